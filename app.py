@@ -1,11 +1,10 @@
 import streamlit as st
 import os
-import pandas as pd
-from datetime import datetime
 
 from batch.batch_scheduler_manager import get_scheduler_manager
 from utils.chatbot import show_chatbot
 from utils.cart import init_cart
+from utils.dataset_manifest import current_manifest
 
 st.set_page_config(page_title="편의점 행사 대시보드", page_icon="🏪", layout="wide")
 scheduler = get_scheduler_manager()
@@ -33,16 +32,17 @@ if os.path.exists("style.css"):
     with open("style.css", encoding="utf-8") as f:
         st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
 
-# 데이터 로드 (사이드바 통계용)
-@st.cache_data(ttl=3600)
+# 사이드바 통계 (데이터 전체 대신 배치가 함께 기록한 매니페스트만 읽음)
 def get_summary_stats():
-    file_path = os.path.join('data', 'categorized_data.csv')
-    if not os.path.exists(file_path):
+    manifest = current_manifest('categorized_data.csv')
+    if not manifest:
         return None
-    df = pd.read_csv(file_path)
+    snapshots = manifest.get('source_snapshots', {})
     return {
-        "total_count": len(df),
-        "brands_count": len(df['brand'].unique())
+        "total_count": manifest['rows'],
+        "brands_count": len(manifest['counts'].get('brand', {})),
+        "data_date": max(snapshots.values()) if snapshots else None,
+        "built_at": manifest.get('built_at'),
     }
 
 # 사이드바 공통 영역
@@ -52,6 +52,10 @@ def show_sidebar():
         st.sidebar.markdown("### 📊 실시간 현황")
         st.sidebar.write(f"✅ 총 행사 상품: **{stats['total_count']:,}개**")
         st.sidebar.write(f"🏢 참여 브랜드: **{stats['brands_count']}개**")
+        if stats['data_date']:
+            st.sidebar.caption(f"🗓️ 데이터 기준일: {stats['data_date']}")
+        if stats['built_at']:
+            st.sidebar.caption(f"🔄 마지막 갱신: {stats['built_at'].replace('T', ' ')[:16]}")
 
     st.sidebar.markdown("---")
     st.sidebar.caption("© 2026 Convenience Store Dashboard")
@@ -0,0 +1,281 @@
+"""
+배치 파이프라인 DAG 실행기
+
+각 단계(Stage)는 의존 단계와 입력/출력 파일을 선언합니다.
+실행기는 입력 파일 내용, 파라미터, 단계 코드의 지문(fingerprint)을 계산해
+지난 실행과 같고 출력도 그대로 남아 있으면 단계를 건너뜁니다.
+의존 관계가 없는 단계(브랜드별 크롤링, 뉴스 수집, 후처리 일부)는 스레드 풀에서 병렬로 실행합니다.
+
+사용법:
+    python batch/pipeline.py --list
+    python batch/pipeline.py                               # 이번 달 전체 실행 (변경 없는 단계는 건너뜀)
+    python batch/pipeline.py --month 2026-03 --stage merge # 한 단계만 실행 (crawl_cu, prepare_cu, registry, publish 등)
+    python batch/pipeline.py --stage prepare_gs25 --force  # 지문과 관계없이 다시 실행
+    python batch/pipeline.py --streaming                   # 중간 CSV 없는 스트리밍 모드 (batch/stream_pipeline.py)
+"""
+import argparse
+import glob
+import hashlib
+import inspect
+import json
+import os
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+from loguru import logger
+
+# 단독 실행 시에도 프로젝트 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+STATE_PATH = os.path.join("data", "cache", "pipeline_state.json")
+DEFAULT_WORKERS = 4
+
+# 단계 실행 결과
+DONE, SKIPPED, FAILED, BLOCKED, DISABLED = 'done', 'skipped', 'failed', 'blocked', 'disabled'
+
+
+class Stage:
+    """
+    파이프라인 단계 하나
+
+    Args:
+        name: 단계 이름 (CLI --stage 에서 사용)
+        func: 인자 없이 호출되는 실행 함수. 실패 시 예외를 던집니다.
+        deps: 먼저 끝나야 하는 단계 이름 목록
+        inputs: 입력 파일 경로 또는 glob 패턴 (내용이 지문에 반영됨)
+        outputs: 출력 파일 경로 또는 glob 패턴 (없거나 바뀌면 다시 실행)
+        params: 지문에 반영할 추가 값 (대상 월 등)
+        optional: True이면 실패해도 후속 단계를 막지 않음 (크롤링처럼 일부 실패를 허용하는 단계)
+        enabled: False이면 실행하지 않고 후속 단계는 계속 진행 (dry-run 크롤링 등)
+    """
+
+    def __init__(self, name: str, func, deps=(), inputs=(), outputs=(), params=None,
+                 optional: bool = False, enabled: bool = True):
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.params = params or {}
+        self.optional = optional
+        self.enabled = enabled
+
+
+def _expand(patterns) -> list:
+    paths = []
+    for pattern in patterns:
+        matched = glob.glob(pattern) if glob.has_magic(pattern) else [pattern]
+        paths.extend(sorted(matched))
+    return paths
+
+
+def _file_digest(path: str) -> str:
+    if not os.path.exists(path):
+        return 'missing'
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def files_fingerprint(patterns) -> dict:
+    """패턴을 펼친 파일별 내용 해시 {경로: sha256 | 'missing'}"""
+    return {path: _file_digest(path) for path in _expand(patterns)}
+
+
+def _code_fingerprint(func) -> str:
+    """단계 함수 소스가 바뀌면 지문도 바뀌도록 함수 소스를 해시합니다."""
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = getattr(func, '__qualname__', repr(func))
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()
+
+
+def stage_fingerprint(stage: Stage) -> str:
+    payload = {
+        'params': stage.params,
+        'code': _code_fingerprint(stage.func),
+        'inputs': files_fingerprint(stage.inputs),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class Pipeline:
+    """단계 DAG를 지문 기반으로 건너뛰며 병렬 실행합니다."""
+
+    def __init__(self, stages, state_path: str = STATE_PATH, log=None):
+        self.stages = {stage.name: stage for stage in stages}
+        self.state_path = state_path
+        self.log = log or logger.info
+        self._lock = threading.Lock()
+        self._validate()
+
+    def _validate(self):
+        for stage in self.stages.values():
+            unknown = [d for d in stage.deps if d not in self.stages]
+            if unknown:
+                raise ValueError(f"{stage.name}: 알 수 없는 의존 단계 {unknown}")
+        self.order()  # 순환 검사
+
+    def order(self) -> list:
+        """위상 정렬된 단계 이름 목록 (선언 순서 유지)"""
+        ordered, visiting, visited = [], set(), set()
+
+        def visit(name):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"파이프라인에 순환 의존이 있습니다: {name}")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+            ordered.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return ordered
+
+    # ---------- 상태 ----------
+
+    def _load_state(self) -> dict:
+        if not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"파이프라인 상태를 읽지 못해 모든 단계를 다시 실행합니다: {e}")
+            return {}
+
+    def _save_state(self, state: dict):
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def is_fresh(self, stage: Stage, state: dict) -> bool:
+        """지난 실행과 입력 지문이 같고 출력이 모두 그대로면 True"""
+        record = state.get(stage.name)
+        if not record or not stage.outputs:
+            return False
+        if record.get('fingerprint') != stage_fingerprint(stage):
+            return False
+        outputs = files_fingerprint(stage.outputs)
+        return bool(outputs) and 'missing' not in outputs.values() and outputs == record.get('outputs')
+
+    # ---------- 실행 ----------
+
+    def _run_stage(self, stage: Stage, state: dict, force: bool) -> str:
+        if not stage.enabled:
+            self.log(f'[{stage.name}] disabled')
+            return DISABLED
+        if not force and self.is_fresh(stage, state):
+            self.log(f'[{stage.name}] skipped (inputs unchanged)')
+            return SKIPPED
+
+        started = datetime.now()
+        self.log(f'[{stage.name}] start')
+        try:
+            stage.func()
+        except Exception as e:
+            self.log(f'[{stage.name}] failed: {e}')
+            return FAILED
+
+        # 실행 후 입력 지문(출력 확인 시점 기준)과 출력 지문을 기록
+        record = {
+            'fingerprint': stage_fingerprint(stage),
+            'outputs': files_fingerprint(stage.outputs),
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        with self._lock:
+            state[stage.name] = record
+            self._save_state(state)
+        self.log(f'[{stage.name}] done ({(datetime.now() - started).total_seconds():.1f}s)')
+        return DONE
+
+    def run(self, targets=None, force: bool = False, max_workers: int = DEFAULT_WORKERS) -> dict:
+        """
+        단계들을 실행하고 {단계: 결과}를 반환합니다.
+        targets를 주면 해당 단계만 실행합니다 (의존 단계는 이미 끝났다고 가정).
+        """
+        names = list(targets) if targets else self.order()
+        unknown = [n for n in names if n not in self.stages]
+        if unknown:
+            raise ValueError(f"알 수 없는 단계: {unknown}")
+
+        state = self._load_state()
+        results = {}
+        pending = {n: [d for d in self.stages[n].deps if d in names] for n in names}
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            while pending or running:
+                for name in [n for n, deps in pending.items() if all(d in results for d in deps)]:
+                    deps = pending.pop(name)
+                    blocking = [d for d in deps
+                                if results[d] in (FAILED, BLOCKED) and not self.stages[d].optional]
+                    if blocking:
+                        self.log(f'[{name}] blocked by {blocking}')
+                        results[name] = BLOCKED
+                        continue
+                    running[pool.submit(self._run_stage, self.stages[name], state, force)] = name
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    results[running.pop(future)] = future.result()
+
+        return results
+
+
+def build_pipeline(run_time: datetime, dry_run: bool = False, log=None, streaming: bool = False,
+                   checkpoints=('raw',)) -> Pipeline:
+    """월간 배치 DAG (crawl → clean → categorize → enrich → publish, streaming이면 stream → publish)"""
+    from batch.script.crawl_batch_script import batch_stages, stream_batch_stages
+    if streaming:
+        return Pipeline(stream_batch_stages(run_time, dry_run, checkpoints), log=log)
+    return Pipeline(batch_stages(run_time, dry_run), log=log)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="배치 파이프라인 실행기")
+    parser.add_argument('--month', help="대상 월 YYYY-MM (기본: 이번 달)")
+    parser.add_argument('--stage', action='append', help="실행할 단계 (여러 번 지정 가능)")
+    parser.add_argument('--force', action='store_true', help="지문과 관계없이 다시 실행")
+    parser.add_argument('--dry-run', action='store_true', help="크롤링 단계 비활성화")
+    parser.add_argument('--streaming', action='store_true', help="크롤링부터 ID 부여까지 메모리에서 한 번에 처리")
+    parser.add_argument('--checkpoint', action='append', choices=['raw', 'cleaned'],
+                        help="스트리밍 모드에서 남길 중간 결과 (기본: raw)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS)
+    parser.add_argument('--list', action='store_true', help="단계 목록과 의존 관계 출력")
+    args = parser.parse_args()
+
+    os.chdir(PROJECT_ROOT)
+    if args.month:
+        year, month = map(int, args.month.split('-'))
+    else:
+        today = datetime.now()
+        year, month = today.year, today.month
+    # 스케줄러와 같은 기준 시각 (매달 1일 00:30) → 같은 달 재실행 시 같은 작업 디렉토리를 사용 (공개 버전은 실행마다 새로)
+    pipeline = build_pipeline(datetime(year, month, 1, 0, 30, 0), dry_run=args.dry_run, streaming=args.streaming,
+                              checkpoints=args.checkpoint or ('raw',))
+
+    if args.list:
+        for name in pipeline.order():
+            stage = pipeline.stages[name]
+            print(f"{name:<16} <- {', '.join(stage.deps) or '-'}")
+    else:
+        results = pipeline.run(targets=args.stage, force=args.force, max_workers=args.workers)
+        for name in pipeline.order():
+            if name in results:
+                print(f"{name:<16} {results[name]}")
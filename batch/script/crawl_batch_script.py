@@ -51,9 +51,249 @@ def make_datetime(fixed_dt: datetime):
     return DateTime
 
 
-def get_next_month_data_batch(year: int, month: int, run_time: datetime, dry_run: bool = False) -> bool:
+# 크롤링 단계: (단계 이름, 모듈, 실행 함수, 출력 파일 접두어)
+CRAWL_STAGES = [
+    ('crawl_7eleven', 'scraper.seven_eleven_scraper', lambda mod: mod.crawl_7eleven(), '7Eleven'),
+    ('crawl_cu', 'scraper.cu_scraper', lambda mod: mod.CUCrawler().run(), 'CU'),
+    ('crawl_gs25', 'scraper.gs25_scraper', lambda mod: mod.scrape_gs25_event_goods(), 'GS25'),
+    ('crawl_emart24', 'scraper.emart24_scraper', lambda mod: mod.Emart24Scraper().run(), 'emart24'),
+]
+
+# 원본 스냅샷 파일 (data/<브랜드>_<yymmdd>.csv)
+RAW_SNAPSHOT_GLOB = os.path.join('data', '*_[0-9][0-9][0-9][0-9][0-9][0-9].csv')
+HISTORY_RAW_GLOB = os.path.join('data', 'history', 'raw', '*.csv')
+NEWS_PATH = os.path.join('data', 'official_event_news.csv')
+
+# 브랜드 단위 후처리(정제 → 검증 → 분류 → 제조사·용량·테마) 코드와 규칙 파일 (바뀌면 다시 실행)
+POSTPROCESS_CODE = ['batch/stream_pipeline.py', 'utils/data_cleaner_batch.py', 'utils/data_validation.py',
+                    'utils/event_taxonomy.py', 'utils/data_categorize.py', 'utils/rules/category_rules.json',
+                    'utils/maker_taxonomy.py', 'utils/rules/maker_aliases.json', 'utils/package_size.py',
+                    'utils/theme_tags.py', 'utils/rules/theme_tags.json']
+
+
+def _crawl_stage_func(module: str, run, output_path: str, run_time: datetime):
+    def crawl():
+        # 스크래퍼 내부의 datetime.now()를 배치 시점으로 고정 (파일명 날짜 = 대상 월 1일)
+        mod = importlib.import_module(module)
+        setattr(mod, 'datetime', make_datetime(run_time))
+        run(mod)
+        # 스크래퍼는 실패해도 예외 없이 메시지만 출력하므로 결과 파일로 성공 여부 판단
+        if not os.path.exists(output_path):
+            raise RuntimeError(f'{output_path} was not created')
+    return crawl
+
+
+def _news_stage(target: str, dry_run: bool):
+    from batch.pipeline import Stage
+
+    def crawl_news():
+        from scraper.event_news_scraper import scrape_official_events
+        scrape_official_events()
+
+    return Stage('crawl_news', crawl_news, outputs=[NEWS_PATH], params={'target': target},
+                 optional=True, enabled=not dry_run)
+
+
+def _price_history_stage(run_time: datetime, deps: list, enabled: bool = True):
+    from batch.pipeline import Stage
+    from utils.price_history import HISTORY_PATH
+
+    def price_history():
+        # 실패해도 공개된 데이터셋에는 영향 없음
+        from utils.price_history import update_price_history
+        store = update_price_history()
+        write_log(f'Finished: price_history ({len(store)} products / {store.n_observations} observations)', run_time)
+
+    return Stage('price_history', price_history, deps=deps, outputs=[HISTORY_PATH],
+                 inputs=[RAW_SNAPSHOT_GLOB, HISTORY_RAW_GLOB, 'utils/price_history.py'], optional=True,
+                 enabled=enabled)
+
+
+def _publish_new_snapshot(files: list, run_time: datetime):
+    """준비된 결과 파일을 이번 실행의 새 스냅샷 버전으로 복사한 뒤 current 포인터를 교체합니다."""
+    from utils.dataset_store import create_snapshot, publish_snapshot
+    version = create_snapshot(files)
+    publish_snapshot(version)
+    write_log(f'Published snapshot: {version}', run_time)
+
+
+def _prepare_stage_func(brand: str, output_path: str, quarantine_path: str, run_time: datetime):
+    def prepare():
+        from batch.stream_pipeline import prepare_partition
+        from utils.snapshot_catalog import SnapshotCatalog
+
+        latest = SnapshotCatalog().latest(brand)
+        if latest is None:
+            # 수집된 적 없는 브랜드는 빼고 통합 (지난 실행의 파티션도 정리)
+            write_log(f'{brand}: no raw snapshot, skipped', run_time)
+            if os.path.exists(output_path):
+                os.remove(output_path)
+            return
+        snapshot_date, raw_path = latest
+        if snapshot_date.strftime('%y%m') != run_time.strftime('%y%m'):
+            write_log(f'{brand}: latest snapshot {snapshot_date} is not from the target month', run_time)
+        if prepare_partition(raw_path, output_path, quarantine_path) is None:
+            raise RuntimeError(f'{brand} partition produced no data')
+    return prepare
+
+
+def batch_stages(run_time: datetime, dry_run: bool = False, registry_path: str = None) -> list:
+    """
+    월간 배치 단계 목록 (batch.pipeline.Pipeline 으로 실행)
+
+    crawl_<브랜드> → prepare_<브랜드> ─┐  (브랜드마다 수집이 끝나는 대로 정제·분류·속성 추출)
+    crawl_news                          └→ merge → registry → publish
+                                                └→ price_history
+    느린 브랜드가 아직 수집 중일 때 먼저 끝난 브랜드의 후처리가 진행되고, 마지막에는 합치기·매칭·ID 부여만 남습니다.
+    중간·최종 결과는 대상 월의 작업 디렉토리에 쓰므로 같은 달 재실행 시 입력이 바뀌지 않은 단계(브랜드)는 건너뛰고,
+    publish 단계가 최종 결과를 실행마다 새 스냅샷 버전으로 복사해 공개합니다. (공개된 디렉토리에는 쓰지 않음)
+    """
+    from batch.pipeline import Stage
+    from utils.dataset_manifest import manifest_path_for, source_snapshot_dates, write_manifest
+    from utils.dataset_store import POINTER_PATH, make_version
+    from utils.product_registry import REGISTRY_PATH
+
+    registry_path = registry_path or REGISTRY_PATH
+    target = run_time.strftime('%y%m%d')
+    # 대상 월의 작업 디렉토리 (브랜드 파티션·통합 결과·공개할 최종 결과)
+    work_dir = os.path.join('data', 'cache', 'pipeline', make_version(run_time))
+    merged_path = os.path.join(work_dir, 'merged.csv')
+    cleaned_path = os.path.join(work_dir, 'cleaned_data.csv')
+    categorized_path = os.path.join(work_dir, 'categorized_data.csv')
+
+    stages, partitions, quarantines = [], [], []
+    for name, module, run, prefix in CRAWL_STAGES:
+        output_path = os.path.join('data', f'{prefix}_{target}.csv')
+        stages.append(Stage(name, _crawl_stage_func(module, run, output_path, run_time),
+                            outputs=[output_path], params={'target': target},
+                            optional=True, enabled=not dry_run))
+
+        partition_path = os.path.join(work_dir, f'{prefix}.csv')
+        quarantine_path = os.path.join(work_dir, f'quarantine_{prefix}.csv')
+        raw_pattern = os.path.join('data', f'{prefix}_' + '[0-9]' * 6 + '.csv')
+        stages.append(Stage(f'prepare_{name[len("crawl_"):]}',
+                            _prepare_stage_func(prefix, partition_path, quarantine_path, run_time),
+                            deps=[name], outputs=[partition_path], inputs=[raw_pattern] + POSTPROCESS_CODE,
+                            params={'target': target}))
+        partitions.append(partition_path)
+        quarantines.append(quarantine_path)
+
+    stages.append(_news_stage(target, dry_run))
+    prepare_names = [stage.name for stage in stages if stage.name.startswith('prepare_')]
+
+    def merge():
+        from batch.stream_pipeline import merge_partitions
+        from utils.data_validation import merge_quarantine, quarantine_path_for
+        from utils.snapshot_catalog import SnapshotCatalog
+
+        # 브랜드별 최신 스냅샷만 남기고 이전 달 스냅샷은 히스토리 저장소로 이동
+        SnapshotCatalog().archive_old_snapshots()
+        os.makedirs(work_dir, exist_ok=True)
+        if merge_partitions(partitions, merged_path, cleaned_path=cleaned_path) is None:
+            raise RuntimeError('no brand partition to merge')
+        merge_quarantine(quarantines, quarantine_path_for(cleaned_path), remove=False).report()
+        write_manifest(cleaned_path, sources=source_snapshot_dates())
+
+    def registry():
+        from utils.product_registry import run_registry
+        # first_seen/last_seen은 실행 날짜가 아니라 브랜드별 원본 스냅샷 날짜 기준
+        if run_registry(input_path=merged_path, output_path=categorized_path, registry_path=registry_path,
+                        seen_on=source_snapshot_dates()) is None:
+            raise RuntimeError('product_registry failed')
+        write_manifest(categorized_path, sources=source_snapshot_dates())
+
+    def publish():
+        from utils.data_validation import quarantine_path_for
+        _publish_new_snapshot([cleaned_path, manifest_path_for(cleaned_path), quarantine_path_for(cleaned_path),
+                               categorized_path, manifest_path_for(categorized_path)], run_time)
+
+    stages += [
+        Stage('merge', merge, deps=prepare_names,
+              outputs=[merged_path, cleaned_path, manifest_path_for(cleaned_path)],
+              inputs=partitions + ['batch/stream_pipeline.py', 'utils/product_matching.py']),
+        Stage('registry', registry, deps=['merge'],
+              outputs=[categorized_path, manifest_path_for(categorized_path), registry_path],
+              inputs=[merged_path, registry_path, RAW_SNAPSHOT_GLOB, HISTORY_RAW_GLOB, 'utils/product_registry.py']),
+        Stage('publish', publish, deps=['registry'], outputs=[POINTER_PATH],
+              inputs=[cleaned_path, categorized_path, manifest_path_for(categorized_path)]),
+        _price_history_stage(run_time, deps=['merge']),
+    ]
+    return stages
+
+
+def stream_batch_stages(run_time: datetime, dry_run: bool = False, checkpoints=('raw',),
+                        registry_path: str = None) -> list:
+    """
+    스트리밍 모드 월간 배치 단계 목록 (batch.stream_pipeline 참고)
+
+    crawl_news
+    stream (크롤링 → 정제 → 분류 → 속성 추출 → 매칭 → ID, 한 번에) → publish
+                                                                   └→ price_history
+    중간 CSV 없이 최종 categorized_data.csv만 쓰고, checkpoints에 지정한 중간 결과만 남깁니다.
+    'raw' 체크포인트(브랜드 원본 CSV)가 없으면 가격 히스토리는 이번 달을 반영할 수 없어 건너뜁니다.
+    dry_run이면 크롤링 대신 data/의 브랜드별 최신 원본 스냅샷을 다시 흘려보냅니다.
+    """
+    from batch.pipeline import Stage
+    from batch.stream_pipeline import STREAM_SOURCES, replay_sources, run_stream_pipeline
+    from utils.data_validation import quarantine_path_for
+    from utils.dataset_manifest import manifest_path_for
+    from utils.dataset_store import POINTER_PATH, make_version
+    from utils.product_registry import REGISTRY_PATH
+
+    registry_path = registry_path or REGISTRY_PATH
+    # 원본을 다시 흘려보낼 때는 읽고 있는 원본 파일을 덮어쓰지 않음
+    checkpoints = [c for c in checkpoints if not (dry_run and c == 'raw')]
+    target = run_time.strftime('%y%m%d')
+    # 대상 월의 작업 디렉토리에 쓰고, publish 단계가 새 스냅샷 버전으로 복사해 공개
+    work_dir = os.path.join('data', 'cache', 'pipeline', make_version(run_time), 'stream')
+    categorized_path = os.path.join(work_dir, 'categorized_data.csv')
+    cleaned_path = os.path.join(work_dir, 'cleaned_data.csv')
+
+    outputs = [categorized_path, manifest_path_for(categorized_path), registry_path]
+    if 'cleaned' in checkpoints:
+        outputs += [cleaned_path, manifest_path_for(cleaned_path)]
+    if 'raw' in checkpoints:
+        outputs += [os.path.join('data', f'{brand}_{target}.csv') for brand, _, _ in STREAM_SOURCES]
+
+    def stream():
+        os.makedirs(work_dir, exist_ok=True)
+        if run_stream_pipeline(run_time, sources=replay_sources() if dry_run else None, output_dir=work_dir,
+                               checkpoints=checkpoints, registry_path=registry_path) is None:
+            raise RuntimeError('stream_pipeline produced no data')
+
+    def publish():
+        files = [categorized_path, manifest_path_for(categorized_path), quarantine_path_for(categorized_path)]
+        if 'cleaned' in checkpoints:
+            files += [cleaned_path, manifest_path_for(cleaned_path)]
+        _publish_new_snapshot(files, run_time)
+
+    inputs = POSTPROCESS_CODE + ['utils/product_matching.py', 'utils/product_registry.py', registry_path]
+    if dry_run:
+        inputs.append(RAW_SNAPSHOT_GLOB)
+
+    return [
+        _news_stage(target, dry_run),
+        Stage('stream', stream, outputs=outputs, inputs=inputs,
+              params={'target': target, 'checkpoints': checkpoints,
+                      'replay': dry_run}),
+        Stage('publish', publish, deps=['stream'], outputs=[POINTER_PATH],
+              inputs=[categorized_path, manifest_path_for(categorized_path)], params={'checkpoints': checkpoints}),
+        _price_history_stage(run_time, deps=['stream'], enabled=dry_run or 'raw' in checkpoints),
+    ]
+
+
+def get_next_month_data_batch(year: int, month: int, run_time: datetime, dry_run: bool = False,
+                              stages: list = None, force: bool = False, streaming: bool = False,
+                              checkpoints=('raw',), registry_path: str = None) -> bool:
     """
     메인 배치 함수
+
+    Args:
+        stages: 실행할 단계 이름 목록 (기본: 전체)
+        force: True이면 입력이 바뀌지 않은 단계도 다시 실행
+        streaming: True이면 중간 CSV 없이 한 번에 처리하는 스트리밍 모드 (stream_batch_stages)
+        checkpoints: 스트리밍 모드에서 남길 중간 결과 ('raw', 'cleaned')
+        registry_path: 상품 ID 레지스트리 경로 (기본: data/product_registry.csv, 테스트는 임시 경로 사용)
     """
     # 현재 작업 디렉토리를 프로젝트 루트로 변경
     os.chdir(PROJECT_ROOT)
@@ -70,70 +310,20 @@ def get_next_month_data_batch(year: int, month: int, run_time: datetime, dry_run
     write_log(f'Target Month: {year}-{month} | Batch ID Time: {run_time.strftime("%H:%M:%S")}', run_time)
     write_log(f'Data directory: {data_dir}', run_time)
 
-    # 3. 스크래퍼 패칭
-    mods = [
-        'scraper.seven_eleven_scraper',
-        'scraper.cu_scraper',
-        'scraper.gs25_scraper',
-        'scraper.emart24_scraper'
-    ]
-    time_patch = make_datetime(run_time)
-
-    for m in mods:
-        try:
-            mod = importlib.import_module(m)
-            setattr(mod, 'datetime', time_patch)
-            write_log(f'Module patched: {m}', run_time)
-        except Exception as e:
-            write_log(f'Failed to patch {m}: {e}', run_time)
-
-    # 4. 크롤링 실행
     if dry_run:
         write_log('Dry run enabled: Skipping actual crawler execution.', run_time)
+
+    # 3~5. 크롤링 → 정제 → 분류 → 매칭 → ID 부여 → 공개, 가격 히스토리
+    # (새 버전 디렉토리에 기록한 뒤, 모두 성공하면 current 포인터 교체)
+    from batch.pipeline import Pipeline
+    if streaming:
+        write_log(f'Streaming mode: checkpoints={list(checkpoints)}', run_time)
+        stage_list = stream_batch_stages(run_time, dry_run, checkpoints, registry_path)
     else:
-        # 7-Eleven
-        try:
-            from scraper.seven_eleven_scraper import crawl_7eleven
-            crawl_7eleven()
-            write_log('Finished: 7-Eleven', run_time)
-        except Exception as e:
-            write_log(f'7-Eleven failed: {e}', run_time)
-
-        # CU
-        try:
-            from scraper.cu_scraper import CUCrawler
-            CUCrawler().run()
-            write_log('Finished: CU', run_time)
-        except Exception as e:
-            write_log(f'CU failed: {e}', run_time)
-
-        # GS25
-        try:
-            from scraper.gs25_scraper import scrape_gs25_event_goods
-            scrape_gs25_event_goods()
-            write_log('Finished: GS25', run_time)
-        except Exception as e:
-            write_log(f'GS25 failed: {e}', run_time)
-
-        # emart24
-        try:
-            from scraper.emart24_scraper import Emart24Scraper
-            Emart24Scraper().run()
-            write_log('Finished: emart24', run_time)
-        except Exception as e:
-            write_log(f'emart24 failed: {e}', run_time)
-
-    # 5. 후처리
-    try:
-        from utils.data_cleaner_batch import clean_and_merge_batch
-        clean_and_merge_batch()
-        write_log('Finished: data_cleaner', run_time)
-
-        from utils.data_categorize import run_categorization
-        run_categorization()
-        write_log('Finished: data_categorize', run_time)
-    except Exception as e:
-        write_log(f'Post-processing failed: {e}', run_time)
+        stage_list = batch_stages(run_time, dry_run, registry_path)
+    pipeline = Pipeline(stage_list, log=lambda msg: write_log(msg, run_time))
+    results = pipeline.run(targets=stages, force=force)
+    write_log('Stage results: ' + ', '.join(f'{name}={status}' for name, status in results.items()), run_time)
 
     write_log('=== BATCH COMPLETE ===', run_time)
-    return True
\ No newline at end of file
+    return True
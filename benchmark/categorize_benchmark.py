@@ -0,0 +1,69 @@
+"""
+카테고리 분류 처리량 벤치마크
+
+cleaned_data.csv의 상품명을 배수만큼 복제해 행 수를 늘려가며
+기존 방식(키워드 목록 any 검사)과 컴파일된 분류기의 처리량을 비교합니다.
+
+실행: python benchmark/categorize_benchmark.py --scales 1 10 50
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.data_categorize import classify_names, classify_product, current_rules
+
+INPUT_PATH = os.path.join(PROJECT_ROOT, 'data', 'cleaned_data.csv')
+
+
+def naive_classify(name):
+    """리팩터링 이전 방식: 분류마다 키워드를 하나씩 부분 문자열 검사"""
+    name = str(name)
+    rules = current_rules()
+    for category, keywords in rules.rules:
+        if any(word in name for word in keywords):
+            return category
+    return rules.default
+
+
+def build_names(scale: int) -> pd.Series:
+    """원본 상품명을 scale배로 늘린 시리즈 (절반은 접미사를 붙여 고유 상품명으로 만듦)"""
+    names = pd.read_csv(INPUT_PATH, encoding='utf-8-sig')['name']
+    parts = [names]
+    for i in range(1, scale):
+        parts.append(names + f"_{i}" if i % 2 else names)
+    return pd.concat(parts, ignore_index=True)
+
+
+def time_it(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run(scales):
+    print(f"{'rows':>10} | {'naive(s)':>9} | {'apply(s)':>9} | {'bulk(s)':>9} | {'bulk rows/s':>12}")
+    print("-" * 62)
+    for scale in scales:
+        names = build_names(scale)
+        t_naive, expected = time_it(lambda s: s.apply(naive_classify), names)
+        t_apply, _ = time_it(lambda s: s.apply(classify_product), names)
+        t_bulk, labels = time_it(classify_names, names)
+
+        if not (labels == expected).all():
+            raise AssertionError(f"scale={scale}: 분류 결과가 기존 방식과 다릅니다.")
+
+        print(f"{len(names):>10,} | {t_naive:>9.3f} | {t_apply:>9.3f} | {t_bulk:>9.3f} | {len(names) / t_bulk:>12,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="카테고리 분류 처리량 벤치마크")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 5, 20])
+    args = parser.parse_args()
+    run(args.scales)
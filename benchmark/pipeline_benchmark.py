@@ -0,0 +1,296 @@
+"""
+배치 파이프라인 단계별 벤치마크
+
+실제 원본 스냅샷(real)과 합성 카탈로그(행 수)마다 아래 단계를 차례로 실행해 단계별 시간을 잽니다.
+각 단계는 repeat번 실행해 가장 빠른 값을 기록하고, 이전 단계 결과를 다음 단계 입력으로 씁니다.
+
+    parse:<브랜드>  스크래퍼 파서 (원본 행을 사이트 응답 형식의 HTML/JSON 페이지로 만들어 파싱)
+    read          브랜드 원본 CSV 읽기
+    normalize     행사 표기 정규화 (normalize_events)
+    clean         clean_and_merge_batch (정제·통합·스키마 검증·저장, 파티션 캐시 없이)
+    categorize    카테고리 분류 (classify_names, 분류 캐시 없이)
+    enrich        제조사·용량·테마 추출
+    match         상품 매칭 (assign_match_groups)
+    write         categorized_data.csv 저장
+
+결과는 JSON 기준선 파일(기본: benchmark/baseline.json)에 저장하고, compare 명령은 지금 측정한 값(또는 --current 파일)을
+기준선과 비교해 threshold(기본 20%)보다 느려진 단계를 표시하고 종료 코드 1을 돌려줍니다.
+스크래퍼 의존성(requests, beautifulsoup4)이 없으면 parse 단계는 건너뜁니다.
+
+실행:
+    python benchmark/pipeline_benchmark.py run --sizes real 10000 100000          # 기준선 저장
+    python benchmark/pipeline_benchmark.py compare --threshold 0.2               # 지금 측정해 기준선과 비교
+    python benchmark/pipeline_benchmark.py compare --current /tmp/after.json     # 저장된 두 결과 비교
+"""
+import argparse
+import contextlib
+import html
+import importlib
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from benchmark.synthetic_catalog import DEFAULT_SEED, ensure_synthetic
+from utils.data_categorize import classify_names
+from utils.data_cleaner_batch import clean_and_merge_batch, read_raw_csv
+from utils.event_taxonomy import normalize_events
+from utils.maker_taxonomy import add_maker_columns
+from utils.package_size import add_size_columns
+from utils.product_matching import assign_match_groups
+from utils.snapshot_catalog import SnapshotCatalog, parse_snapshot_name
+from utils.theme_tags import add_theme_column
+
+BASELINE_PATH = os.path.join(PROJECT_ROOT, 'benchmark', 'baseline.json')
+DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
+DEFAULT_SIZES = ['real', '10000', '100000']
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 0.2
+# 이보다 작은 시간 차이는 측정 잡음으로 보고 회귀로 표시하지 않음 (초)
+NOISE_FLOOR = 0.01
+
+
+def _cu_page(rows: pd.DataFrame) -> str:
+    items = "".join(
+        f'<li class="prod_list"><div class="prod_img"><img src="{html.escape(r.img_url)}"></div>'
+        f'<div class="name"><p>{html.escape(r.name)}</p></div><div class="price"><strong>{r.price:,}</strong>원</div>'
+        f'<div class="badge"><span>{html.escape(r.event)}</span></div></li>'
+        for r in rows.itertuples())
+    return f'<ul>{items}</ul>'
+
+
+def _emart24_page(rows: pd.DataFrame) -> str:
+    return "".join(
+        f'<div class="itemWrap"><div class="itemSpImg"><img src="{html.escape(r.img_url)}"></div>'
+        f'<div class="itemTit"><span class="floatR">{html.escape(r.event)}</span></div>'
+        f'<div class="itemtitle"><p><a>{html.escape(r.name)}</a></p></div><div class="price">{r.price:,} 원</div></div>'
+        for r in rows.itertuples())
+
+
+_GS25_CODES = {'1+1': 'ONE_TO_ONE', '2+1': 'TWO_TO_ONE', '덤증정': 'GIFT'}
+
+
+def _gs25_page(rows: pd.DataFrame) -> str:
+    # API는 JSON 문자열을 한 번 더 감싼 형태로 응답
+    results = [{'goodsNm': r.name, 'price': float(r.price), 'eventTypeSp': {'code': _GS25_CODES.get(r.event, r.event)},
+                'attFileNm': r.img_url} for r in rows.itertuples()]
+    return json.dumps(json.dumps({'results': results}, ensure_ascii=False))
+
+
+def _seven_eleven_page(rows: pd.DataFrame) -> str:
+    host = "https://www.7-eleven.co.kr"
+    items = "".join(
+        f'<li><div class="pic_product"><img src="{html.escape(r.img_url.removeprefix(host))}"></div>'
+        f'<div class="name">{html.escape(r.name)}</div><div class="price"><span>{r.price:,}</span></div>'
+        f'<ul class="tag_list_01"><li>{html.escape(r.event)}</li></ul></li>'
+        for r in rows.itertuples())
+    return f'<ul>{items}</ul>'
+
+
+# 브랜드 → (스크래퍼 모듈, 페이지당 상품 수, 페이지 렌더러, 파서)
+PARSERS = {
+    '7Eleven': ('scraper.seven_eleven_scraper', 10_000, _seven_eleven_page,
+                lambda mod, page: mod.parse_items(page, '1+1')),
+    'CU': ('scraper.cu_scraper', 40, _cu_page, lambda mod, page: mod.CUCrawler().parse_items(page)),
+    'GS25': ('scraper.gs25_scraper', 100, _gs25_page, lambda mod, page: mod.parse_event_goods(json.loads(page))),
+    'emart24': ('scraper.emart24_scraper', 40, _emart24_page,
+                lambda mod, page: mod.Emart24Scraper().parse_items(page, '1+1')),
+}
+
+
+def render_pages(raw: pd.DataFrame, page_size: int, render) -> list:
+    """원본 행을 page_size개씩 사이트 응답 형식 페이지로 만듭니다."""
+    raw = raw.dropna(subset=['name', 'event', 'img_url']).astype({'name': str, 'event': str, 'img_url': str})
+    raw = raw.assign(price=pd.to_numeric(raw['price'], errors='coerce').fillna(0).astype(int))
+    return [render(raw.iloc[i:i + page_size]) for i in range(0, len(raw), page_size)]
+
+
+def time_it(func, repeat: int):
+    """func를 repeat번 실행해 (가장 짧은 시간, 마지막 결과)"""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+@contextlib.contextmanager
+def _workspace(raw_paths: list):
+    """data/에 원본 스냅샷만 복사한 임시 작업 디렉토리 (clean_and_merge_batch는 현재 디렉토리의 data/를 읽음)"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'data'))
+        for path in raw_paths:
+            shutil.copy(path, os.path.join(tmp, 'data', os.path.basename(path)))
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(cwd)
+
+
+def _clean_cold():
+    shutil.rmtree(os.path.join('data', 'cache'), ignore_errors=True)
+    return clean_and_merge_batch(os.path.join('data', 'cleaned_data.csv'))
+
+
+def dataset_paths(size: str, seed: int = DEFAULT_SEED) -> list:
+    """'real'이면 data/의 최신 원본 스냅샷, 숫자면 그 행 수의 합성 원본 스냅샷 경로"""
+    data_dir = DATA_DIR if size == 'real' else ensure_synthetic(int(size), seed=seed)
+    return SnapshotCatalog(data_dir, os.path.join(data_dir, 'history', 'raw')).latest_paths()
+
+
+def benchmark_size(raw_paths: list, repeat: int = DEFAULT_REPEAT) -> dict:
+    """원본 스냅샷 목록 하나의 단계별 시간 {'rows': 원본 행 수, 'stages': {단계: 초}}"""
+    stages = {}
+    for path in raw_paths:
+        brand, _ = parse_snapshot_name(path)
+        module, page_size, render, parse = PARSERS[brand]
+        try:
+            mod = importlib.import_module(module)
+        except ImportError as e:
+            logger.warning(f"{brand}: 스크래퍼를 불러올 수 없어 parse 단계를 건너뜁니다 ({e})")
+            continue
+        pages = render_pages(read_raw_csv(path, dtype=str), page_size, render)
+        stages[f'parse:{brand}'], _ = time_it(lambda: [parse(mod, page) for page in pages], repeat)
+
+    stages['read'], raw = time_it(lambda: pd.concat([read_raw_csv(p) for p in raw_paths], ignore_index=True), repeat)
+    events = raw.dropna(subset=['event'])
+    stages['normalize'], _ = time_it(lambda: normalize_events(events), repeat)
+
+    with _workspace(raw_paths) as workspace:
+        stages['clean'], df = time_it(_clean_cold, repeat)
+        if df is None:
+            raise RuntimeError("정제 결과가 없습니다.")
+        stages['categorize'], labels = time_it(lambda: classify_names(df['name']), repeat)
+        df = df.assign(category=labels)
+        stages['enrich'], df = time_it(lambda: add_theme_column(add_size_columns(add_maker_columns(df))), repeat)
+        stages['match'], groups = time_it(lambda: assign_match_groups(df), repeat)
+        df.insert(df.columns.get_loc('category') + 1, 'match_group_id', groups)
+        output = os.path.join(workspace, 'categorized_data.csv')
+        stages['write'], _ = time_it(lambda: df.to_csv(output, index=False, encoding='utf-8-sig'), repeat)
+
+    return {'rows': len(raw), 'stages': {name: round(seconds, 6) for name, seconds in stages.items()}}
+
+
+def run_benchmark(sizes=DEFAULT_SIZES, repeat: int = DEFAULT_REPEAT, seed: int = DEFAULT_SEED) -> dict:
+    """크기별 단계 시간을 측정해 기준선 형식 dict로 반환합니다."""
+    results = {}
+    for size in sizes:
+        results[str(size)] = benchmark_size(dataset_paths(str(size), seed), repeat)
+        logger.info(f"{size}: {results[str(size)]}")
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+        },
+        'repeat': repeat,
+        'seed': seed,
+        'results': results,
+    }
+
+
+def save_results(results: dict, path: str = BASELINE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def load_results(path: str = BASELINE_PATH) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD,
+                    noise_floor: float = NOISE_FLOOR) -> list:
+    """
+    두 결과에 모두 있는 (크기, 단계)마다 비교 행 목록을 반환합니다.
+        [{'size', 'stage', 'baseline', 'current', 'ratio', 'regression'}, ...]
+    current가 baseline보다 threshold 비율 넘게 느리고 차이가 noise_floor초 이상이면 regression=True
+    """
+    rows = []
+    for size, base in baseline['results'].items():
+        cur = current['results'].get(size)
+        if cur is None:
+            continue
+        for stage, before in base['stages'].items():
+            after = cur['stages'].get(stage)
+            if after is None:
+                continue
+            ratio = after / before if before else float('inf')
+            regression = after > before * (1 + threshold) and after - before >= noise_floor
+            rows.append({'size': size, 'stage': stage, 'baseline': before, 'current': after,
+                         'ratio': ratio, 'regression': regression})
+    return rows
+
+
+def print_comparison(rows: list):
+    print(f"{'size':>8} | {'stage':<14} | {'base(s)':>9} | {'now(s)':>9} | {'ratio':>6}")
+    print("-" * 58)
+    for row in rows:
+        mark = "  ⚠️ 회귀" if row['regression'] else ""
+        print(f"{row['size']:>8} | {row['stage']:<14} | {row['baseline']:>9.4f} | {row['current']:>9.4f} | "
+              f"{row['ratio']:>6.2f}{mark}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="배치 파이프라인 단계별 벤치마크")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = sub.add_parser('run', help="측정해 기준선 파일로 저장")
+    run_parser.add_argument('--sizes', nargs='+', default=DEFAULT_SIZES, help="'real' 또는 합성 행 수")
+    run_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT)
+    run_parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    run_parser.add_argument('--output', default=BASELINE_PATH)
+
+    compare_parser = sub.add_parser('compare', help="기준선과 비교해 회귀 단계 표시")
+    compare_parser.add_argument('--baseline', default=BASELINE_PATH)
+    compare_parser.add_argument('--current', default=None, help="비교할 결과 파일 (없으면 기준선과 같은 조건으로 지금 측정)")
+    compare_parser.add_argument('--output', default=None, help="지금 측정한 결과를 저장할 경로")
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    # 단계 함수들의 진행 로그는 숨기고 경고 이상만 표시 (기준일이 고정된 합성 스냅샷의 '현재 달 아님' 경고 제외)
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING", filter=lambda record: record['name'] != 'utils.data_cleaner_batch')
+
+    if args.command == 'run':
+        results = run_benchmark(args.sizes, args.repeat, args.seed)
+        save_results(results, args.output)
+        for size, result in results['results'].items():
+            print(f"{size:>8} ({result['rows']:,}행): " + ", ".join(f"{k}={v:.4f}s" for k, v in result['stages'].items()))
+        print(f"기준선 저장: {args.output}")
+    else:
+        baseline = load_results(args.baseline)
+        if args.current:
+            current = load_results(args.current)
+        else:
+            current = run_benchmark(list(baseline['results']), baseline.get('repeat', DEFAULT_REPEAT),
+                                    baseline.get('seed', DEFAULT_SEED))
+            if args.output:
+                save_results(current, args.output)
+        rows = compare_results(baseline, current, args.threshold)
+        print_comparison(rows)
+        regressions = [row for row in rows if row['regression']]
+        if regressions:
+            print(f"\n{len(regressions)}개 단계가 기준선보다 {args.threshold:.0%} 넘게 느려졌습니다.")
+            sys.exit(1)
+        print("\n회귀 없음")
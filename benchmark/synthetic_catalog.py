@@ -0,0 +1,290 @@
+"""
+합성 상품 카탈로그 생성기
+
+실제 categorized_data.csv는 7천 행 남짓이라 10만~100만 행(여러 달, 브랜드별 대량 행사)에서
+페이지·예산 조합·배치 파이프라인이 어떻게 동작하는지 알 수 없습니다.
+이 모듈은 실제 데이터에서 아래 분포를 뽑아(CatalogStats) 같은 모양의 합성 데이터를 만듭니다.
+
+    브랜드 비중, 브랜드별 카테고리 비중, 브랜드별 원본 행사 표기('1 + 1' 등) 비중, 이미지 URL 형식
+    제조사 접두어('CJ)') 빈도와 접두어가 붙는 비율
+    카테고리별 상품명 단어 빈도, 단어 수, 용량 표기('500ml')와 괄호 메모('(컵밥)') 비율, 가격 분포
+
+같은 seed와 행 수면 항상 같은 데이터가 나옵니다. 결과물은 두 가지입니다.
+
+    원본 스냅샷    <out>/<브랜드>_<yymmdd>.csv (최신 달), <out>/history/raw/ (이전 달) — 파이프라인 입력
+    분류 데이터셋  <out>/categorized_data.csv — 실제 배치 함수로 정제·분류·매칭까지 마친 공개 데이터셋 형식
+
+벤치마크는 ensure_synthetic()으로 data/cache/synthetic/ 아래 캐시된 데이터를 받아 씁니다.
+
+실행: python benchmark/synthetic_catalog.py --rows 100000 --months 3 --seed 42
+"""
+import argparse
+import os
+import re
+import sys
+from collections import Counter
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from batch.stream_pipeline import RAW_COLUMNS, add_match_groups
+from utils.data_categorize import classify_names
+from utils.data_cleaner_batch import clean_frame, read_raw_csv
+from utils.maker_taxonomy import add_maker_columns
+from utils.package_size import add_size_columns
+from utils.snapshot_catalog import SnapshotCatalog
+from utils.theme_tags import add_theme_column
+
+DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
+STATS_PATH = os.path.join(DATA_DIR, 'categorized_data.csv')
+SYNTHETIC_DIR = os.path.join(DATA_DIR, 'cache', 'synthetic')
+DEFAULT_SEED = 42
+# 같은 인자면 언제 만들어도 같은 파일이 나오도록 마지막 스냅샷 날짜를 고정
+SYNTHETIC_END = date(2026, 1, 1)
+
+# 다음 달에도 행사가 이어지는 상품 비율, 이어지는 상품의 가격 변동 비율
+CARRY_OVER_RATE = 0.7
+PRICE_CHANGE_RATE = 0.1
+
+# 상품명 토큰: 제조사 접두어 / 괄호 메모 / 용량·입수 표기 / 나머지 단어
+_MAKER = re.compile(r'^\s*([^()\s][^()]{0,14})\)\s*(.*)$')
+_PAREN = re.compile(r'\([^)]*\)')
+_SIZE = re.compile(r'(?i)\d+(?:\.\d+)?\s*(?:ml|l|kg|g|입|개|매|롤|봉|팩|구|p)(?![a-z])(?:\s*[*x×]\s*\d+)?')
+_WORD = re.compile(r'[가-힣A-Za-z&]+')
+
+
+def _weights(counter: Counter):
+    """Counter → (값 배열, 확률 배열)"""
+    values = list(counter)
+    counts = np.array([counter[v] for v in values], dtype=float)
+    return np.array(values, dtype=object), counts / counts.sum()
+
+
+class CatalogStats:
+    """실제 데이터에서 뽑은 합성용 분포"""
+
+    def __init__(self, df: pd.DataFrame, raw: pd.DataFrame = None):
+        """
+        Args:
+            df: categorized_data.csv 형식 (brand, name, price, event, img_url, category)
+            raw: 원본 스냅샷을 합친 데이터프레임 (원본 행사 표기 분포용, 없으면 정규화된 event 사용)
+        """
+        self.brands = _weights(Counter(df['brand']))
+        self.categories = {brand: _weights(Counter(group['category'])) for brand, group in df.groupby('brand')}
+        events = raw if raw is not None else df
+        self.events = {brand: _weights(Counter(group['event'].str.strip())) for brand, group in events.groupby('brand')}
+        self.img_urls = {brand: group['img_url'].dropna().to_numpy(dtype=object) for brand, group in df.groupby('brand')}
+
+        makers, bodies = Counter(), []
+        for name in df['name'].astype(str):
+            match = _MAKER.match(name)
+            if match:
+                makers[match.group(1)] += 1
+            bodies.append(match.group(2) if match else name)
+        self.makers = _weights(makers)
+        self.maker_rate = sum(makers.values()) / len(df)
+
+        self.words, self.word_counts, self.sizes, self.parens = {}, {}, {}, {}
+        self.size_rate, self.paren_rate, self.prices = {}, {}, {}
+        for category, group in pd.DataFrame({'body': bodies, 'category': df['category'].to_numpy(),
+                                             'price': df['price'].to_numpy()}).groupby('category'):
+            words, counts, sizes, parens = Counter(), Counter(), Counter(), Counter()
+            for body in group['body']:
+                paren = _PAREN.findall(body)
+                size = _SIZE.findall(_PAREN.sub('', body))
+                tokens = _WORD.findall(_SIZE.sub('', _PAREN.sub('', body)))
+                words.update(tokens)
+                counts[max(len(tokens), 1)] += 1
+                sizes.update(size[:1])
+                parens.update(paren[:1])
+            self.words[category] = _weights(words)
+            self.word_counts[category] = _weights(counts)
+            self.sizes[category] = _weights(sizes) if sizes else None
+            self.parens[category] = _weights(parens) if parens else None
+            self.size_rate[category] = sum(sizes.values()) / len(group)
+            self.paren_rate[category] = sum(parens.values()) / len(group)
+            self.prices[category] = group['price'].to_numpy(dtype=float)
+
+    @classmethod
+    def from_data(cls, stats_path: str = STATS_PATH, data_dir: str = DATA_DIR):
+        """공개 데이터셋과 data/의 최신 원본 스냅샷에서 분포를 뽑습니다."""
+        df = pd.read_csv(stats_path, encoding='utf-8-sig')
+        paths = SnapshotCatalog(data_dir).latest_paths()
+        raw = None
+        if paths:
+            raw = pd.concat([read_raw_csv(p, dtype=str) for p in paths], ignore_index=True)
+            raw = raw[raw['event'].ne('event') & raw['brand'].isin(df['brand'].unique())]
+        return cls(df, raw)
+
+    def _names(self, categories: np.ndarray, rng: np.random.Generator) -> list:
+        """카테고리마다 단어·용량·괄호 메모를 뽑아 상품명을 만듭니다."""
+        names = np.empty(len(categories), dtype=object)
+        has_maker = rng.random(len(categories)) < self.maker_rate
+        makers = rng.choice(self.makers[0], size=len(categories), p=self.makers[1])
+        for category in np.unique(categories):
+            idx = np.flatnonzero(categories == category)
+            n = len(idx)
+            words, word_p = self.words[category]
+            counts = rng.choice(self.word_counts[category][0], size=n, p=self.word_counts[category][1]).astype(int)
+            picked = rng.choice(words, size=(n, counts.max()), p=word_p)
+            bodies = [''.join(picked[i, :c]) for i, c in enumerate(counts)]
+
+            sizes = self.sizes[category]
+            if sizes is not None:
+                drawn = rng.choice(sizes[0], size=n, p=sizes[1])
+                use = rng.random(n) < self.size_rate[category]
+                bodies = [b + s if u else b for b, s, u in zip(bodies, drawn, use)]
+            parens = self.parens[category]
+            if parens is not None:
+                drawn = rng.choice(parens[0], size=n, p=parens[1])
+                use = rng.random(n) < self.paren_rate[category]
+                bodies = [b + p if u else b for b, p, u in zip(bodies, drawn, use)]
+            names[idx] = bodies
+        return [f"{m}){b}" if use else b for m, b, use in zip(makers, names, has_maker)]
+
+    def _prices(self, categories: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """카테고리 가격 분포에서 뽑은 뒤 ±10% 안팎으로 흔들고 100원 단위로 반올림"""
+        prices = np.empty(len(categories))
+        for category in np.unique(categories):
+            idx = np.flatnonzero(categories == category)
+            prices[idx] = rng.choice(self.prices[category], size=len(idx))
+        prices *= rng.lognormal(0.0, PRICE_CHANGE_RATE, size=len(prices))
+        return np.maximum(np.round(prices, -2), 100).astype(np.int64)
+
+    def _img_urls(self, brand: str, n: int, rng: np.random.Generator) -> list:
+        """브랜드의 실제 URL을 골라 파일명의 숫자만 무작위로 바꾼 URL (이미지 서버 경로는 그대로)"""
+        templates = rng.choice(self.img_urls[brand], size=n)
+        heads = [t[:t.rfind('/') + 1] for t in templates]
+        tails = [t[len(h):] for t, h in zip(templates, heads)]
+        digits = iter(rng.integers(0, 10, size=sum(sum(c.isdigit() for c in t) for t in tails)).astype(str))
+        return [h + re.sub(r'\d', lambda _: next(digits), t) for h, t in zip(heads, tails)]
+
+    def sample(self, rows: int, rng: np.random.Generator) -> pd.DataFrame:
+        """원본 스냅샷 형식(brand, name, price, event, img_url)의 합성 행 rows개 (브랜드·상품명·행사 중복 없음)"""
+        frames, total = [], 0
+        while total < rows:
+            n = rows - total
+            brands = rng.choice(self.brands[0], size=n, p=self.brands[1])
+            parts = []
+            for brand in np.unique(brands):
+                k = int((brands == brand).sum())
+                categories = rng.choice(self.categories[brand][0], size=k, p=self.categories[brand][1])
+                parts.append(pd.DataFrame({
+                    'brand': brand,
+                    'name': self._names(categories, rng),
+                    'price': self._prices(categories, rng),
+                    'event': rng.choice(self.events[brand][0], size=k, p=self.events[brand][1]),
+                    'img_url': self._img_urls(brand, k, rng),
+                }))
+            frames.append(pd.concat(parts, ignore_index=True))
+            df = pd.concat(frames, ignore_index=True).drop_duplicates(['brand', 'name', 'event'], ignore_index=True)
+            frames, total = [df], len(df)
+        return frames[0].iloc[:rows][RAW_COLUMNS]
+
+
+def snapshot_dates(months: int, end: date = SYNTHETIC_END) -> list:
+    """end가 마지막인 months개의 월별 스냅샷 날짜 (오래된 순)"""
+    end = pd.Timestamp(end)
+    return [(end - pd.DateOffset(months=k)).date() for k in reversed(range(months))]
+
+
+def generate_months(rows: int, months: int = 1, seed: int = DEFAULT_SEED, stats: CatalogStats = None,
+                    end: date = SYNTHETIC_END) -> dict:
+    """
+    월별 원본 스냅샷 {스냅샷 날짜: 데이터프레임}을 만듭니다. 달마다 rows행이고,
+    이전 달 상품의 CARRY_OVER_RATE만큼은 다음 달에도 이어지며(일부는 가격 변동) 나머지는 새 상품입니다.
+    """
+    stats = stats or CatalogStats.from_data()
+    rng = np.random.default_rng(seed)
+    snapshots, previous = {}, None
+    for snapshot_date in snapshot_dates(months, end):
+        if previous is None:
+            df = stats.sample(rows, rng)
+        else:
+            kept = previous[rng.random(len(previous)) < CARRY_OVER_RATE].copy()
+            changed = rng.random(len(kept)) < PRICE_CHANGE_RATE
+            kept.loc[changed, 'price'] = np.maximum(
+                np.round(kept.loc[changed, 'price'] * rng.lognormal(0.0, PRICE_CHANGE_RATE, changed.sum()), -2), 100
+            ).astype(np.int64)
+            fresh = stats.sample(rows, rng)
+            df = pd.concat([kept, fresh], ignore_index=True).drop_duplicates(['brand', 'name', 'event'])
+            df = df.iloc[:rows].sort_values('brand', kind='stable', ignore_index=True)
+        snapshots[snapshot_date] = previous = df
+    return snapshots
+
+
+def write_raw_snapshots(snapshots: dict, out_dir: str) -> list:
+    """
+    월별 스냅샷을 브랜드 원본 CSV로 저장합니다. 최신 달은 out_dir, 이전 달은 out_dir/history/raw
+    (data/ 와 같은 배치). 최신 달 파일 경로 목록을 반환합니다.
+    """
+    latest = max(snapshots)
+    paths = []
+    for snapshot_date, df in snapshots.items():
+        directory = out_dir if snapshot_date == latest else os.path.join(out_dir, 'history', 'raw')
+        os.makedirs(directory, exist_ok=True)
+        for brand, group in df.groupby('brand', sort=True):
+            path = os.path.join(directory, f"{brand}_{snapshot_date.strftime('%y%m%d')}.csv")
+            group.to_csv(path, index=False, encoding='utf-8-sig')
+            if snapshot_date == latest:
+                paths.append(path)
+    return paths
+
+
+def categorize_snapshot(raw: pd.DataFrame, workers: int = None) -> pd.DataFrame:
+    """
+    원본 스냅샷 하나를 배치와 같은 함수로 정제·분류·속성 추출·매칭해 공개 데이터셋 형식으로 만듭니다.
+    (합성 데이터는 모두 새 상품이므로 product_id는 1부터 차례로 부여)
+    """
+    df = clean_frame(raw.sort_values('brand', kind='stable'))
+    df = df.assign(category=classify_names(df['name']))
+    df = add_theme_column(add_size_columns(add_maker_columns(df))).reset_index(drop=True)
+    df = add_match_groups(df, workers)
+    df.insert(0, 'product_id', np.arange(1, len(df) + 1, dtype=np.int64))
+    return df
+
+
+def generate(out_dir: str, rows: int, months: int = 1, seed: int = DEFAULT_SEED, categorized: bool = True,
+             workers: int = None, end: date = SYNTHETIC_END) -> dict:
+    """
+    out_dir에 원본 스냅샷(+ categorized_data.csv)을 만들고 경로를 담은 dict를 반환합니다.
+        {'raw': 최신 달 원본 경로 목록, 'categorized': 데이터셋 경로 또는 None}
+    """
+    snapshots = generate_months(rows, months, seed, end=end)
+    paths = {'raw': write_raw_snapshots(snapshots, out_dir), 'categorized': None}
+    if categorized:
+        paths['categorized'] = os.path.join(out_dir, 'categorized_data.csv')
+        categorize_snapshot(snapshots[max(snapshots)], workers).to_csv(paths['categorized'], index=False,
+                                                                        encoding='utf-8-sig')
+    logger.success(f"합성 카탈로그 생성 완료: {rows:,}행 × {months}개월 (seed={seed}) → '{out_dir}'")
+    return paths
+
+
+def ensure_synthetic(rows: int, months: int = 1, seed: int = DEFAULT_SEED, root: str = SYNTHETIC_DIR) -> str:
+    """
+    data/cache/synthetic/<rows>_m<months>_s<seed>/ 디렉토리를 반환합니다. 없으면 만듭니다.
+    """
+    out_dir = os.path.join(root, f"{rows}_m{months}_s{seed}")
+    if not os.path.exists(os.path.join(out_dir, 'categorized_data.csv')):
+        generate(out_dir, rows, months, seed)
+    return out_dir
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="합성 상품 카탈로그 생성기")
+    parser.add_argument('--rows', type=int, default=100_000, help="달마다 만들 행 수")
+    parser.add_argument('--months', type=int, default=1, help="월별 스냅샷 수")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--out', default=None, help="출력 디렉토리 (기본: data/cache/synthetic/<rows>_m<months>_s<seed>)")
+    parser.add_argument('--raw-only', action='store_true', help="원본 스냅샷만 만들고 분류 데이터셋은 생략")
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    out = args.out or os.path.join(SYNTHETIC_DIR, f"{args.rows}_m{args.months}_s{args.seed}")
+    generate(out, args.rows, args.months, args.seed, categorized=not args.raw_only, workers=args.workers)
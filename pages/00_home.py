@@ -6,6 +6,8 @@ from datetime import datetime
 import pytz
 import streamlit.components.v1 as components
 from utils.news_scraper import fetch_realtime_cvs_news
+from utils.dataset_manifest import current_manifest, dataset_hash
+from utils.dataset_service import products, products_by_id
 from datetime import datetime, timedelta
 
 # 한국 시간(KST) 설정
@@ -32,12 +34,12 @@ def get_base64_image(image_path):
     with open(image_path, "rb") as img_file:
         return base64.b64encode(img_file.read()).decode()
     
+# 선택 결과는 product_id만 캐시 (행 데이터는 공유 데이터셋에서 복사 없이 조회)
 @st.cache_data
-def get_fixed_hot_deals(recent_keywords):
+def get_fixed_hot_deal_ids(recent_keywords, data_hash: str):
     try:
-        df_main = pd.read_csv('data/categorized_data.csv')
-        df_main['event'] = df_main['event'].astype(str).str.replace(' ', '', regex=False)
-        df_main = df_main[df_main['event'].str.contains(r'\+', na=False, regex=True)]
+        df_main = products()
+        df_main = df_main[df_main['event_type'] == 'N+M']
         
         display_df = pd.DataFrame()
 
@@ -56,9 +58,13 @@ def get_fixed_hot_deals(recent_keywords):
                 fill_df = remaining_df.sample(n=min(shortfall, len(remaining_df)))
                 display_df = pd.concat([display_df, fill_df])
         
-        return display_df.head(10)
+        return display_df.head(10)['product_id'].tolist() if not display_df.empty else []
     except:
-        return pd.DataFrame()
+        return []
+
+def get_fixed_hot_deals(recent_keywords, data_hash: str):
+    ids = get_fixed_hot_deal_ids(recent_keywords, data_hash)
+    return products_by_id().loc[ids] if ids else pd.DataFrame()
 
 # --- 메인 대시보드 ---
 
@@ -76,7 +82,7 @@ st.markdown(f"""
 # 2. 추천 상품 섹션 (가로 스크롤)
 try:
     current_keywords = st.session_state.get('recent_keywords', [])
-    display_df = get_fixed_hot_deals(current_keywords)
+    display_df = get_fixed_hot_deals(current_keywords, dataset_hash())
 
     # 타이틀 
     if current_keywords:
@@ -133,11 +139,12 @@ try:
     """
 
         for idx, row in display_df.iterrows():
-            img_url = row['img_url'] if pd.notna(row['img_url']) else "https://via.placeholder.com/150?text=No+Image"
-            price = int(str(row['price']).replace(',', '')) if pd.notna(row['price']) else 0
-            # 행사 종류에 따른 개당 가격 계산 로직 (기존 유지)
-            unit_price = price // 2 if row['event'] == '1+1' else (
-                price * 2 // 3 if row['event'] == '2+1' else (price * 3 // 4 if row['event'] == '3+1' else price))
+            # 배치 검증을 통과한 데이터이므로 img_url/price는 항상 유효
+            img_url = row['img_url']
+            price = int(row['price'])
+            # 행사 종류에 따른 개당 가격 (N+M: N개 가격으로 N+M개)
+            total = row['buy_n'] + row['get_m']
+            unit_price = price * row['buy_n'] // total if total else price
 
             brand_color = get_brand_color(row['brand'])
             scroll_html += f"""
@@ -189,9 +196,10 @@ except Exception as e:
 # ------ 여기부터 시간대별로 상품 추천해주는 기능 (위치 이동됨) ------
 st.markdown("<br>", unsafe_allow_html=True)
 
-df_time = pd.read_csv('data/categorized_data.csv')
+# 공용 데이터셋 (리런마다 CSV를 다시 읽지 않음)
+df_time = products()
 
-if df_time is not None:
+if not df_time.empty:
     if 6 <= now_hour < 11:
         target_cat, title, icon = ["식사류"], "🌅 바쁜 아침, 든든한 한 끼!", "🥛"
     elif 11 <= now_hour < 14:
@@ -212,12 +220,12 @@ if df_time is not None:
     with col_btn:
         st.button("🔄 다른 상품 보기", use_container_width=True, key="refresh_time_items")
 
-    recommend_df = df_time[df_time['category'].isin(target_cat)].copy()
+    recommend_df = df_time[df_time['category'].isin(target_cat)]
     if not recommend_df.empty:
         exclude_keywords = ['쏘피', '좋은', '섬유유연제', '티셔츠', '순수한면', '면도날', '라엘', '순면', '비비안']
         filter_condition = recommend_df['name'].str.contains('|'.join(exclude_keywords), na=False)
         recommend_df = recommend_df[~filter_condition]
-        recommend_df = recommend_df[recommend_df['event'] != '세일']
+        recommend_df = recommend_df[recommend_df['event_type'] != 'SALE']
 
         display_items = recommend_df.sample(n=min(len(recommend_df), 5))
         cols = st.columns(5)
@@ -407,4 +415,6 @@ for col, (name, path) in zip([l1, l2, l3, l4], logos.items()):
             st.button(name, use_container_width=True)
 
 st.markdown("---")
-st.caption("© 2026 Convenience Store Event Dashboard. Data updated daily.")
+manifest = current_manifest('categorized_data.csv')
+updated = f" Data updated {manifest['built_at'][:10]}." if manifest and manifest.get('built_at') else ""
+st.caption(f"© 2026 Convenience Store Event Dashboard.{updated}")
@@ -1,8 +1,8 @@
 import streamlit as st
-import pandas as pd
 import os
 from datetime import datetime
 from utils.cart import init_cart, render_cart_button, render_floating_cart
+from utils.dataset_service import unique_products
 
 # 브랜드별 고유 컬러 반환 함수
 def get_brand_color(brand):
@@ -24,28 +24,8 @@ if os.path.exists("style.css"):
     with open("style.css", encoding="utf-8") as f:
         st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
 
-@st.cache_data(ttl=3600)
-def get_data():
-    file_path = os.path.join('data', 'categorized_data.csv')
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-    
-    df = pd.read_csv(file_path)
-    df['event'] = df['event'].str.replace(' ', '', regex=False)
-    df['price'] = df['price'].astype(str).str.replace(r'[^\d.]', '', regex=True)
-    df['price'] = pd.to_numeric(df['price'], errors='coerce').fillna(0).astype(int)
-
-    def calc_info(row):
-        e, p = row['event'], row['price']
-        if e == '1+1': return p // 2, "50%"
-        if e == '2+1': return (p * 2) // 3, "33%"
-        if e == '3+1': return (p * 3) // 4, "25%"
-        return p, "0%"
-
-    df[['unit_price', 'discount_rate']] = df.apply(lambda x: pd.Series(calc_info(x)), axis=1)
-    return df.drop_duplicates(subset=['name', 'event', 'brand'])
-
-df = get_data()
+# 공용 데이터셋 (개당 가격·할인율 라벨 포함, 같은 상품명·행사·브랜드 중복 제외)
+df = unique_products()
 
 init_cart()
 render_floating_cart()
@@ -55,8 +35,8 @@ st.title(f"🏪 {datetime.now().strftime('%Y년 %m월')} 편의점 행사 정보
 if not df.empty:
     # 필터 영역 (Expander + 한 줄 통합)
     with st.expander("🔍 상세 필터 및 검색", expanded=True):
-        # 첫 번째 줄: 검색 및 정렬
-        r1_c1, r1_c2 = st.columns([3, 1])
+        # 첫 번째 줄: 검색, 제조사, 정렬
+        r1_c1, r1_c3, r1_c2 = st.columns([2, 1, 1])
         with r1_c1:
             search_query = st.text_input("📝 검색", "", placeholder="상품명 입력")
 
@@ -68,6 +48,10 @@ if not df.empty:
                 st.session_state['recent_keywords'].insert(0, search_query)
                 st.session_state['recent_keywords'] = st.session_state['recent_keywords'][:5]
 
+        with r1_c3:
+            # 배치에서 추출한 제조사(maker) 컬럼 (미선택 시 전체)
+            maker_list = df['maker'].value_counts().index.tolist()
+            selected_makers = st.multiselect("🏭 제조사", maker_list, default=[], placeholder="전체")
         with r1_c2:
             sort_option = st.selectbox("💰 정렬", ["기본", "가격 낮은 순", "가격 높은 순"])
 
@@ -77,8 +61,8 @@ if not df.empty:
             brand_list = sorted(df['brand'].unique().tolist())
             selected_brands = st.multiselect("🏪 브랜드", brand_list, default=brand_list)
         with r2_c2:
-            # 행사 필터: SALE, 세일 제외
-            event_list = sorted([e for e in df['event'].unique().tolist() if e not in ['SALE', '세일']])
+            # 행사 필터: 세일(SALE) 제외
+            event_list = sorted(df.loc[df['event_type'] != 'SALE', 'event'].unique().tolist())
             selected_events = st.multiselect("🎁 행사", event_list, default=event_list)
         with r2_c3:
             # 카테고리 필터
@@ -92,6 +76,8 @@ if not df.empty:
         (df['category'].isin(selected_cats)) &
         (df['name'].str.contains(search_query, case=False))
     ]
+    if selected_makers:
+        filtered_df = filtered_df[filtered_df['maker'].isin(selected_makers)]
 
     if sort_option == "가격 낮은 순":
         filtered_df = filtered_df.sort_values(by='unit_price', ascending=True)
@@ -102,7 +88,8 @@ if not df.empty:
         if not search_query and 'recent_keywords' in st.session_state and st.session_state['recent_keywords']:
             latest_kwd = st.session_state['recent_keywords'][0]
             # 최근 검색어가 포함된 상품들에 가산점을 줘서 최상단으로 정렬
-            filtered_df['is_recommended'] = filtered_df['name'].str.contains(latest_kwd, case=False, na=False).astype(int)
+            filtered_df = filtered_df.assign(
+                is_recommended=filtered_df['name'].str.contains(latest_kwd, case=False, na=False).astype(int))
             filtered_df = filtered_df.sort_values(by='is_recommended', ascending=False)
             filtered_df = filtered_df.drop(columns=['is_recommended'])
 
@@ -113,7 +100,7 @@ if not df.empty:
     if 'current_page' not in st.session_state:
         st.session_state.current_page = 1
 
-    query_hash = search_query + str(selected_cats) + str(selected_events) + str(selected_brands) + sort_option
+    query_hash = search_query + str(selected_makers) + str(selected_cats) + str(selected_events) + str(selected_brands) + sort_option
     if 'last_query' not in st.session_state or st.session_state.last_query != query_hash:
         st.session_state.current_page = 1
         st.session_state.last_query = query_hash
@@ -125,7 +112,7 @@ if not df.empty:
         cols = st.columns(5)
         for idx, (_, row) in enumerate(display_df.iterrows()):
             with cols[idx % 5]:
-                img_url = row['img_url'] if pd.notna(row['img_url']) else ""
+                img_url = row['img_url']
                 st.markdown(f"""
                     <div class="product-card">
                         <div class="img-container"><img src="{img_url}"></div>
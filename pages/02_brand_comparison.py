@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import os
+from utils.dataset_service import products
 
 st.set_page_config(page_title="브랜드별 비교", page_icon="📊", layout="wide")
 
@@ -11,40 +12,8 @@ if os.path.exists("style.css"):
         st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
 
 
-@st.cache_data(ttl=3600)
-def get_data():
-    file_path = os.path.join('data', 'categorized_data.csv')
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-
-    df = pd.read_csv(file_path)
-    # 이벤트 표기 정규화
-    if 'event' in df.columns:
-        df['event'] = df['event'].astype(str).str.replace(r'\s+', '', regex=True)
-        df.loc[df['event'].str.contains(r'1\+1', regex=True, na=False), 'event'] = '1+1'
-        df.loc[df['event'].str.contains(r'2\+1', regex=True, na=False), 'event'] = '2+1'
-        df.loc[df['event'].str.contains(r'3\+1', regex=True, na=False), 'event'] = '3+1'
-        df.loc[df['event'].str.contains(r'(?i)sale|세일', regex=True, na=False), 'event'] = 'SALE'
-
-    # 브랜드명 정규화
-    if 'brand' in df.columns:
-        df['brand'] = df['brand'].astype(str).str.strip()
-
-    df['price'] = pd.to_numeric(df['price'].astype(str).str.replace(r'[^\d.]', '', regex=True), errors='coerce').fillna(
-        0).astype(int)
-
-    def calc_unit_price(row):
-        e, p = row['event'], row['price']
-        if e == '1+1': return p // 2
-        if e == '2+1': return (p * 2) // 3
-        if e == '3+1': return (p * 3) // 4
-        return p
-
-    df['unit_price'] = df.apply(calc_unit_price, axis=1)
-    return df
-
-
-df = get_data()
+# 공용 데이터셋 (행사 표기·브랜드명·가격은 배치에서 정규화됨, 개당 가격 포함)
+df = products()
 
 st.title("📊 브랜드별 행사 비교")
 
@@ -71,7 +40,7 @@ if not df.empty:
             brand_list = sorted(df['brand'].unique().tolist())
             selected_brands = st.multiselect("🏪 브랜드", brand_list, default=brand_list)
         with r2_c2:
-            event_list = sorted([e for e in df['event'].unique().tolist() if e not in ['SALE', '세일']])
+            event_list = sorted(df.loc[df['event_type'] != 'SALE', 'event'].unique().tolist())
             selected_events = st.multiselect("🎁 행사", event_list, default=event_list)
         with r2_c3:
             cat_list = sorted(df['category'].unique().tolist())
@@ -89,7 +58,8 @@ if not df.empty:
 
     if not filtered_df.empty:
         # 상세 통계 표 생성 (피벗) - 이벤트별 개수
-        event_pivot = filtered_df.groupby(['brand', 'event']).size().unstack(fill_value=0)
+        # brand/event는 범주형이므로 observed=True로 필터에서 빠진 브랜드·행사를 집계에서 제외 (pandas<3 기본값은 False)
+        event_pivot = filtered_df.groupby(['brand', 'event'], observed=True).size().unstack(fill_value=0)
 
         # 이벤트 컬럼 순서 정렬
         desired_order = ['1+1', '2+1', '3+1', '4+1', '5+1']
@@ -131,8 +101,6 @@ if not df.empty:
 
         # 각 컬럼을 독립적으로 정렬한 후, 그 값들로 막대그래프 데이터 생성
         # 표와 동일한 정렬 방식 사용
-        brand_counts_raw = filtered_df['brand'].value_counts()
-
         # 표의 첫 번째 컬럼(1+1)의 정렬된 값들
         first_col_sorted_values = sorted_event_data[cols_order[0]]
 
@@ -167,7 +135,7 @@ if not df.empty:
             st.dataframe(event_brand_counts, use_container_width=True)
 
         st.subheader("💰 브랜드별 평균 개당 가격")
-        avg_price_dict = dict(filtered_df.groupby('brand')['unit_price'].mean())
+        avg_price_dict = dict(filtered_df.groupby('brand', observed=True)['unit_price'].mean())
         avg_price = pd.DataFrame({
             '브랜드': brand_order,
             '평균가격': [avg_price_dict.get(b, 0) for b in brand_order]
@@ -185,20 +153,13 @@ if not df.empty:
 
         st.subheader("📉 브랜드별 평균 할인율")
 
-        # 1. 할인율 계산 (0으로 나누기 방지)
-        filtered_df = filtered_df.copy()
-        filtered_df['discount_rate'] = 0.0  # 기본값 0 세팅
-
-        # price가 0보다 큰 정상적인 데이터만 계산
-        valid_mask = filtered_df['price'] > 0
-        filtered_df.loc[valid_mask, 'discount_rate'] = (
-                (filtered_df.loc[valid_mask, 'price'] - filtered_df.loc[valid_mask, 'unit_price'])
-                / filtered_df.loc[valid_mask, 'price'] * 100
-        )
+        # 1. 할인율 계산 (배치 검증으로 price > 0 보장, 표기용 discount_rate 컬럼과 별도의 숫자 컬럼)
+        discount_df = filtered_df.assign(
+            discount_pct=(filtered_df['price'] - filtered_df['unit_price']) / filtered_df['price'] * 100)
 
         # "할인 행사 중인 상품(할인율 > 0)"의 평균
-        discount_df = filtered_df[filtered_df['discount_rate'] > 0]
-        avg_discount_dict = dict(discount_df.groupby('brand')['discount_rate'].mean())
+        discount_df = discount_df[discount_df['discount_pct'] > 0]
+        avg_discount_dict = dict(discount_df.groupby('brand', observed=True)['discount_pct'].mean())
 
         # 2. 브랜드별 평균 할인율 집계
         avg_discount = pd.DataFrame({
@@ -264,7 +225,7 @@ if not df.empty:
 
         st.subheader("📈 브랜드별 핵심 요약")
         # 원본 필터링 데이터에서 브랜드별 통계 계산
-        brand_stats = filtered_df.groupby('brand').agg({
+        brand_stats = filtered_df.groupby('brand', observed=True).agg({
             'name': 'count',
             'unit_price': 'mean'
         }).rename(columns={'name': '상품 수', 'unit_price': '평균 단가'})
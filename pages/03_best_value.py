@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import os
 from utils.cart import init_cart, render_cart_button, render_floating_cart
+from utils.dataset_service import products
 
 # 브랜드별 고유 컬러 반환 함수
 def get_brand_color(brand):
@@ -24,29 +25,8 @@ if os.path.exists("style.css"):
         st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
 
 
-@st.cache_data(ttl=3600)
-def get_data():
-    file_path = os.path.join('data', 'categorized_data.csv')
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-
-    df = pd.read_csv(file_path)
-    df['event'] = df['event'].str.replace(' ', '', regex=False)
-    df['price'] = pd.to_numeric(df['price'].astype(str).str.replace(r'[^\d.]', '', regex=True), errors='coerce').fillna(
-        0).astype(int)
-
-    def calc_info(row):
-        e, p = row['event'], row['price']
-        if e == '1+1': return p // 2, 50.0, "50%"
-        if e == '2+1': return (p * 2) // 3, 33.3, "33%"
-        if e == '3+1': return (p * 3) // 4, 25.0, "25%"
-        return p, 0.0, "0%"
-
-    df[['unit_price', 'discount_num', 'discount_rate']] = df.apply(lambda x: pd.Series(calc_info(x)), axis=1)
-    return df
-
-
-df = get_data()
+# 공용 데이터셋 (개당 가격·할인율 숫자(discount_num)·할인율 라벨(discount_rate) 포함)
+df = products()
 
 init_cart()
 render_floating_cart()
@@ -70,14 +50,14 @@ if not df.empty:
                 
         with r1_c2:
             # 아래 코드의 정렬 옵션 반영
-            sort_option = st.selectbox("💰 정렬", ["가성비 순 (할인율)", "가격 낮은 순", "가격 높은 순"])
+            sort_option = st.selectbox("💰 정렬", ["가성비 순 (할인율)", "용량당 가격 순 (100ml·100g)", "가격 낮은 순", "가격 높은 순"])
 
         r2_c1, r2_c2, r2_c3 = st.columns([1, 1, 1])
         with r2_c1:
             brand_list = sorted(df['brand'].unique().tolist())
             selected_brands = st.multiselect("🏪 브랜드", brand_list, default=brand_list)
         with r2_c2:
-            event_list = sorted([e for e in df['event'].unique().tolist() if e not in ['SALE', '세일']])
+            event_list = sorted(df.loc[df['event_type'] != 'SALE', 'event'].unique().tolist())
             selected_events = st.multiselect("🎁 행사", event_list, default=event_list)
         with r2_c3:
             cat_list = sorted(df['category'].unique().tolist())
@@ -89,13 +69,17 @@ if not df.empty:
         (df['event'].isin(selected_events)) &
         (df['category'].isin(selected_cats)) &
         (df['name'].str.contains(search_query, case=False))
-        ].copy()
+        ]
 
     # 🔥 4️⃣ 정렬 로직 반영 (체감가 및 할인율 기준)
     if sort_option == "가격 낮은 순":
         best_value_df = filtered_df.sort_values(by='unit_price', ascending=True)
     elif sort_option == "가격 높은 순":
         best_value_df = filtered_df.sort_values(by='unit_price', ascending=False)
+    elif sort_option == "용량당 가격 순 (100ml·100g)":
+        # 배치에서 계산한 행사 적용 100ml·100g당 가격 (용량 표기가 없는 상품은 제외)
+        best_value_df = filtered_df.dropna(subset=['price_per_100']).sort_values(
+            by=['price_per_100', 'discount_num'], ascending=[True, False])
     else:  # 가성비 순 (할인율 높은 순 -> 가격 낮은 순)
         best_value_df = filtered_df.sort_values(by=['discount_num', 'unit_price'], ascending=[False, True])
 
@@ -125,7 +109,7 @@ if not df.empty:
             with st.container():
                 c1, c2, c3 = st.columns([1.5, 4, 2])
                 with c1:
-                    img_url = row['img_url'] if pd.notna(row['img_url']) else ""
+                    img_url = row['img_url']
                     st.image(img_url, width=120)
                 with c2:
                     st.markdown(f"### {row['name']}")
@@ -138,6 +122,8 @@ if not df.empty:
                                 unsafe_allow_html=True)
                     st.markdown(f"#### 개당 {int(row['unit_price']):,}원")
                     st.caption(f"정가 {int(row['price']):,}원")
+                    if pd.notna(row['price_per_100']):
+                        st.caption(f"100{row['size_unit']}당 {row['price_per_100']:,.0f}원")
                     render_cart_button(row, f"cart_best_{int(row.name)}")
                 st.divider()
 
@@ -1,10 +1,10 @@
 import streamlit as st
 import pandas as pd
-from pathlib import Path
 import os
 import itertools
 import random
 from utils.cart import init_cart, add_to_cart, is_in_cart, remove_from_cart, render_floating_cart
+from utils.dataset_service import products
 
 # 브랜드별 고유 컬러 반환 함수
 def get_brand_color(brand):
@@ -39,49 +39,9 @@ REDUNDANT_GROUPS = [
 # ==========================================
 # 2. 데이터 로드 및 전처리
 # ==========================================
-@st.cache_data
-def load_data():
-    file_path = Path("data/categorized_data.csv")
-    if not file_path.exists():
-        st.error("데이터 파일을 찾을 수 없습니다.")
-        return pd.DataFrame()
-    
-    try:
-        df = pd.read_csv(file_path)
-    except Exception as e:
-        st.error(f"데이터 파일 읽기 실패: {e}")
-        return pd.DataFrame()
-
-    required_cols = ["brand", "name", "price", "event", "category", "img_url"]
-    if not all(col in df.columns for col in required_cols):
-        st.error("데이터 파일에 필수 컬럼이 부족합니다.")
-        return pd.DataFrame()
-
-    if df['price'].dtype == object:
-        df['price'] = pd.to_numeric(df['price'].astype(str).str.replace(r'[^\d]', '', regex=True), errors='coerce').fillna(0)
-    
-    df['price'] = df['price'].astype(int)
-    df['unit_price'] = df['price'].astype(float)
-    df['discount_rate'] = 0.0
-    
-    # 실제 결제 개수와 총 개수 정의
-    df['pay_count'] = 1
-    df['total_count'] = 1
-
-    masks = {
-        '1+1': (df['price'] / 2, 50.0, 1, 2),
-        '2+1': ((df['price'] * 2) / 3, 33.3, 2, 3),
-        '3+1': ((df['price'] * 3) / 4, 25.0, 3, 4)
-    }
-    for event_type, (unit_price_calc, discount, pay_cnt, total_cnt) in masks.items():
-        mask = df['event'].astype(str).str.contains(event_type.replace('+', r'\+'), na=False)
-        df.loc[mask, 'unit_price'] = unit_price_calc
-        df.loc[mask, 'discount_rate'] = discount
-        df.loc[mask, 'pay_count'] = pay_cnt
-        df.loc[mask, 'total_count'] = total_cnt
-
-    df['unit_price'] = df['unit_price'].astype(int)
-    return df
+# 공용 데이터셋(utils/dataset_service.py)이 아래 파생 컬럼을 한 번만 계산해 둠
+#   pay_count / total_count: 실제 결제 개수와 총 개수 (N+M 행사: N개 결제로 N+M개, 그 외 1개)
+#   unit_price: 개당 가격, discount_num: 할인율(%)
 
 # ==========================================
 # 3. 비즈니스 로직 (조합 생성기)
@@ -101,12 +61,12 @@ def get_candidate_pools(df, categories, budget):
     
     for cat in categories:
         # 번들 결제 금액(price * pay_count) 기준으로 예산 필터링
-        cat_df = df[(df['category'] == cat) & (df['price'] * df['pay_count'] <= budget * 0.7)].copy()
+        cat_df = df[(df['category'] == cat) & (df['price'] * df['pay_count'] <= budget * 0.7)]
         if cat_df.empty:
             continue
             
         # 번들 결제 금액과 목표 금액의 차이 계산
-        cat_df['price_diff'] = (cat_df['price'] * cat_df['pay_count'] - target_price).abs()
+        cat_df = cat_df.assign(price_diff=(cat_df['price'] * cat_df['pay_count'] - target_price).abs())
 
         if cat == '식사류':
             mask_include = cat_df['name'].str.contains('|'.join(MEAL_KEYWORDS), case=False, na=False)
@@ -114,11 +74,11 @@ def get_candidate_pools(df, categories, budget):
             meal_items_mask = mask_include & ~mask_exclude
             
             top_items = pd.concat([
-                cat_df[meal_items_mask].sort_values(by=['discount_rate', 'price_diff'], ascending=[False, True]),
-                cat_df[~meal_items_mask].sort_values(by=['discount_rate', 'price_diff'], ascending=[False, True])
+                cat_df[meal_items_mask].sort_values(by=['discount_num', 'price_diff'], ascending=[False, True]),
+                cat_df[~meal_items_mask].sort_values(by=['discount_num', 'price_diff'], ascending=[False, True])
             ]).drop_duplicates(subset=['name']).head(30)
         else:
-            top_items = cat_df.sort_values(by=['discount_rate', 'price_diff'], ascending=[False, True]).head(30)
+            top_items = cat_df.sort_values(by=['discount_num', 'price_diff'], ascending=[False, True]).head(30)
         
         if not top_items.empty:
             pool_list = top_items.to_dict('records')
@@ -135,7 +95,7 @@ def find_best_combinations(df, selected_categories, budget, selected_events, sea
     if selected_events:
         # '1+1' 등의 텍스트가 포함된 행만 필터링 (regex 사용 방지 위해 단순 string check)
         event_mask = df['event'].apply(lambda x: any(e in str(x) for e in selected_events))
-        df = df[event_mask].copy()
+        df = df[event_mask]
 
     if df.empty:
         return []
@@ -159,21 +119,21 @@ def find_best_combinations(df, selected_categories, budget, selected_events, sea
     
     for cat in selected_categories:
         # 해당 카테고리 내 예산 범위 안의 상품 필터링
-        cat_df = df[(df['category'] == cat) & (df['price'] <= budget * 0.7)].copy()
+        cat_df = df[(df['category'] == cat) & (df['price'] <= budget * 0.7)]
         
         if search_keyword and not keyword_applied:
             # 현재 카테고리에서 검색어가 포함된 상품이 있는지 확인
             matched_df = cat_df[cat_df['name'].str.contains(search_keyword, case=False, na=False)]
             if not matched_df.empty:
                 # 검색어가 포함된 상품을 우선적으로 풀(Pool)에 담음
-                top_items = matched_df.sort_values(by=['discount_rate'], ascending=False).head(20)
+                top_items = matched_df.sort_values(by=['discount_num'], ascending=False).head(20)
                 keyword_applied = True 
             else:
                 # 검색어가 없는 카테고리라면 기존처럼 할인율 높은 상품 담음
-                top_items = cat_df.sort_values(by=['discount_rate'], ascending=False).head(20)
+                top_items = cat_df.sort_values(by=['discount_num'], ascending=False).head(20)
         else:
             # 검색어가 없거나 이미 다른 카테고리에서 검색어 상품을 확보한 경우
-            top_items = cat_df.sort_values(by=['discount_rate'], ascending=False).head(20)
+            top_items = cat_df.sort_values(by=['discount_num'], ascending=False).head(20)
         
         if not top_items.empty:
             pool_list = top_items.to_dict('records')
@@ -189,7 +149,7 @@ def find_best_combinations(df, selected_categories, budget, selected_events, sea
     random.shuffle(all_combinations)
     
     valid_combinations = []
-    seen_names = set()
+    seen_ids = set()
 
     # ---------------------------------------------------------
     # 3. 조합 검증 및 짝꿍 보완 로직 (기존 정교한 로직 100% 보존)
@@ -221,7 +181,7 @@ def find_best_combinations(df, selected_categories, budget, selected_events, sea
             # 맨밥만 있고 반찬이 없는 경우 반찬 추가
             has_side = any(any(k in i['name'] for k in SIDE_DISH_KEYWORDS) for i in current_items)
             if not has_soup and not is_complete_meal and not has_side and has_staple_rice and side_candidates:
-                side_added = next((s for s in side_candidates if s['name'] not in [i['name'] for i in current_items] and sum(i['price'] * i['pay_count'] for i in current_items) + (s['price'] * s['pay_count']) <= budget), None)
+                side_added = next((s for s in side_candidates if s['product_id'] not in {i['product_id'] for i in current_items} and sum(i['price'] * i['pay_count'] for i in current_items) + (s['price'] * s['pay_count']) <= budget), None)
                 if side_added:
                     current_items.append(side_added)
 
@@ -236,7 +196,7 @@ def find_best_combinations(df, selected_categories, budget, selected_events, sea
             random.shuffle(all_selectable)
 
             for extra in all_selectable:
-                if extra['name'] not in [i['name'] for i in current_items]:
+                if extra['product_id'] not in {i['product_id'] for i in current_items}:
                     if sum(i['price'] * i['pay_count'] for i in current_items) + (extra['price'] * extra['pay_count']) <= budget:
                         current_items.append(extra)
                         if len(current_items) >= 5: break
@@ -246,8 +206,8 @@ def find_best_combinations(df, selected_categories, budget, selected_events, sea
         # ---------------------------------------------------------
         total_price = sum(i['price'] * i['pay_count'] for i in current_items)
         if total_price <= budget:
-            combo_names = tuple(sorted([i['name'] for i in current_items]))
-            if combo_names not in seen_names:
+            combo_ids = frozenset(i['product_id'] for i in current_items)
+            if combo_ids not in seen_ids:
                 # 절약 금액: (총 개수 - 결제 개수) * 단품가 = 무료 증정분의 가치
                 saved_money = sum((i['total_count'] - i['pay_count']) * i['price'] for i in current_items)
                 valid_combinations.append({
@@ -255,7 +215,7 @@ def find_best_combinations(df, selected_categories, budget, selected_events, sea
                     'total_price': total_price, 
                     'saved_money': saved_money
                 })
-                seen_names.add(combo_names)
+                seen_ids.add(combo_ids)
                 if len(valid_combinations) >= 30: break
 
     # 전체 가격이 높으면서 절약 금액이 큰 순서로 상위 5개 정렬
@@ -269,7 +229,7 @@ if os.path.exists("static/css/style.css"):
     with open("static/css/style.css", encoding="utf-8") as f:
         st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
 
-df = load_data()
+df = products()
 
 init_cart()
 render_floating_cart()
@@ -362,7 +322,7 @@ if top_combinations:
             for i, item in enumerate(items):
                 with item_cols[i]:
                     brand_color = get_brand_color(item['brand'])
-                    img_url = item['img_url'] if pd.notna(item['img_url']) else "https://via.placeholder.com/150"
+                    img_url = item['img_url']
                     
                     # 상품 카드 스타일링
                     st.markdown(f"""
@@ -378,8 +338,8 @@ if top_combinations:
                     """, unsafe_allow_html=True)
                     
                     # 장바구니 버튼 연동
-                    cart_key = (item['name'], item['brand'], item['event'])
-                    in_cart = is_in_cart(item['name'], item['brand'], item['event'])
+                    cart_key = int(item['product_id'])
+                    in_cart = is_in_cart(cart_key)
                     
                     # 장바구니에 담을 때는 단품 가격(price)과 낱개 체감가(unit_price) 전달
                     price_to_pay = int(item['price'])
@@ -392,7 +352,7 @@ if top_combinations:
                             st.rerun()
                     else:
                         if st.button("🛒 담기", key=btn_key, use_container_width=True):
-                            add_to_cart(item['name'], item['brand'], item['event'], price_to_pay, unit_price)
+                            add_to_cart(cart_key, item['name'], item['brand'], item['event'], price_to_pay, unit_price)
                             st.rerun()
             st.write("") 
 elif st.session_state.get('budget_searched') and not top_combinations:
@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 import os
 from datetime import datetime
 from utils.cart import (
@@ -7,6 +6,8 @@ from utils.cart import (
     calc_actual_total, calc_total_received, render_cart_warning,
     render_floating_cart
 )
+from utils.dataset_service import unique_products
+from utils.theme_tags import page_themes, theme_mask
 
 # 브랜드별 고유 컬러 반환 함수
 def get_brand_color(brand):
@@ -64,28 +65,8 @@ def execute_scroll():
 # 6. (공통 cart 유틸에서 EVENT_UNITS, calc_actual_total, calc_total_received, render_cart_warning 사용)
 
 # 9. 데이터 로드
-@st.cache_data(ttl=3600)
-def get_data():
-    file_path = os.path.join('data', 'categorized_data.csv')
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-
-    df = pd.read_csv(file_path)
-    df['event'] = df['event'].str.replace(' ', '', regex=False)
-    df['price'] = df['price'].astype(str).str.replace(r'[^\d.]', '', regex=True)
-    df['price'] = pd.to_numeric(df['price'], errors='coerce').fillna(0).astype(int)
-
-    def calc_info(row):
-        e, p = row['event'], row['price']
-        if e == '1+1': return p // 2,       "50%"
-        if e == '2+1': return (p * 2) // 3, "33%"
-        if e == '3+1': return (p * 3) // 4, "25%"
-        return p, "0%"
-
-    df[['unit_price', 'discount_rate']] = df.apply(lambda x: pd.Series(calc_info(x)), axis=1)
-    return df.drop_duplicates(subset=['name', 'event', 'brand'])
-
-df = get_data()
+# 공용 데이터셋 (개당 가격·할인율 라벨 포함, 같은 상품명·행사·브랜드 중복 제외)
+df = unique_products()
 
 # 10. (render_cart_warning은 공통 cart 유틸 사용)
 
@@ -109,12 +90,9 @@ if not df.empty:
                 st.session_state['recent_keywords'] = st.session_state['recent_keywords'][:5]
                 
         with r1_c2:
-            tags = {
-                "🥤 제로 & 저당": ["제로", "zero", "무가당", "슈가프리", "0칼로리"],
-                "🍗 고단백 식단": ["단백질", "프로틴", "닭가슴살", "계란", "단백", "닭가슴"]
-            }
+            # 테마 정의는 utils/rules/theme_tags.json, 상품별 해당 여부는 배치에서 theme_bits로 계산됨
+            tags = page_themes('diet')
             selected_tag = st.selectbox("🎯 식단 테마", list(tags.keys()))
-            keywords = tags[selected_tag]
         with r1_c3:
             sort_option = st.selectbox("💰 정렬", ["기본", "가격 낮은 순", "가격 높은 순"])
 
@@ -123,28 +101,21 @@ if not df.empty:
             brand_list = sorted(df['brand'].unique().tolist())
             selected_brands = st.multiselect("🏪 브랜드", brand_list, default=brand_list)
         with r2_c2:
-            event_list = sorted([e for e in df['event'].unique().tolist() if e not in ['SALE', '세일']])
+            event_list = sorted(df.loc[df['event_type'] != 'SALE', 'event'].unique().tolist())
             selected_events = st.multiselect("🎁 행사", event_list, default=event_list)
         with r2_c3:
             cat_list = sorted(df['category'].unique().tolist())
             selected_cats = st.multiselect("📂 분류", cat_list, default=cat_list)
 
-    # 13. 필터링
-    pattern = "|".join(keywords)
-    exclude_pattern = "|".join([
-        "맥주", "라이트비어", "피죤", "필라이트", "카스라이트", "주류",
-        "스팸", "베이컨", "부대찌개", "햄", "가그린", "구강", "리스테린",
-        "순수한면", "대형", "무알콜", "제로백젤리"
-    ])
-
+    # 13. 필터링 (테마는 비트 마스크 한 번, 검색어가 있을 때만 상품명 검색)
     filtered_df = df[
-        (df['name'].str.contains(pattern, case=False, na=False)) &
-        (~df['name'].str.contains(exclude_pattern, case=False, na=False)) &
+        theme_mask(df, tags[selected_tag]) &
         (df['brand'].isin(selected_brands)) &
         (df['event'].isin(selected_events)) &
-        (df['category'].isin(selected_cats)) &
-        (df['name'].str.contains(search_query, case=False))
+        (df['category'].isin(selected_cats))
     ]
+    if search_query:
+        filtered_df = filtered_df[filtered_df['name'].str.contains(search_query, case=False)]
 
     if sort_option == "가격 낮은 순":
         filtered_df = filtered_df.sort_values(by='unit_price')
@@ -181,8 +152,6 @@ if not df.empty:
 
         cols = st.columns(5)
         for idx, (_, row) in enumerate(display_df.iterrows()):
-            cart_key = (row['name'], row['brand'], row['event'])
-
             with cols[idx % 5]:
                 st.markdown(f"""
                     <div class="product-card">
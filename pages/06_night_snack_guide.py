@@ -1,8 +1,9 @@
 import streamlit as st
-import pandas as pd
 import os
 from datetime import datetime
 from utils.cart import init_cart, render_cart_button, render_floating_cart
+from utils.dataset_service import unique_products
+from utils.theme_tags import page_themes, theme_mask
 
 # 브랜드별 고유 컬러 반환 함수
 def get_brand_color(brand):
@@ -57,28 +58,8 @@ def execute_scroll():
         height=0
     )
 
-@st.cache_data(ttl=3600)
-def get_data():
-    file_path = os.path.join('data', 'categorized_data.csv')
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-
-    df = pd.read_csv(file_path)
-    df['event'] = df['event'].str.replace(' ', '', regex=False)
-    df['price'] = df['price'].astype(str).str.replace(r'[^\d.]', '', regex=True)
-    df['price'] = pd.to_numeric(df['price'], errors='coerce').fillna(0).astype(int)
-
-    def calc_info(row):
-        e, p = row['event'], row['price']
-        if e == '1+1': return p // 2, "50%"
-        if e == '2+1': return (p * 2) // 3, "33%"
-        if e == '3+1': return (p * 3) // 4, "25%"
-        return p, "0%"
-
-    df[['unit_price', 'discount_rate']] = df.apply(lambda x: pd.Series(calc_info(x)), axis=1)
-    return df.drop_duplicates(subset=['name', 'event', 'brand'])
-
-df = get_data()
+# 공용 데이터셋 (개당 가격·할인율 라벨 포함, 같은 상품명·행사·브랜드 중복 제외)
+df = unique_products()
 
 init_cart()
 render_floating_cart()
@@ -104,13 +85,9 @@ if not df.empty:
                 st.session_state['recent_keywords'] = st.session_state['recent_keywords'][:5]
                 
         with r1_c2:
-            snack_themes = {
-                "🍺 맥주와 찰떡궁합": ["치킨", "너겟", "소시지", "핫바", "만두", "피자", "감자", "나쵸", "과자", "팝콘", "땅콩", "아몬드", "어포"],
-                "🔥 소주 & 매콤안주": ["닭발", "곱창", "막창", "족발", "편육", "육포", "오징어", "황태", "어묵탕", "부대찌개", "매콤", "불닭"],
-                "🍜 든든한 야식": ["떡볶이", "라면", "컵라면", "짜장", "짬뽕", "우동", "도시락", "김밥", "삼각김밥", "햄버거"]
-            }
+            # 테마 정의는 utils/rules/theme_tags.json, 상품별 해당 여부는 배치에서 theme_bits로 계산됨
+            snack_themes = page_themes('night_snack')
             selected_theme = st.selectbox("🎯 야식 테마 선택", list(snack_themes.keys()))
-            keywords = snack_themes[selected_theme]
         with r1_c3:
             sort_option = st.selectbox("💰 정렬 방식", ["할인율 순", "가격 낮은 순", "가격 높은 순"])
 
@@ -119,25 +96,21 @@ if not df.empty:
             brand_list = sorted(df['brand'].unique().tolist())
             selected_brands = st.multiselect("🏪 편의점", brand_list, default=brand_list)
         with r2_c2:
-            event_list = sorted([e for e in df['event'].unique().tolist() if e not in ['SALE', '세일']])
+            event_list = sorted(df.loc[df['event_type'] != 'SALE', 'event'].unique().tolist())
             selected_events = st.multiselect("🎁 행사 유형", event_list, default=event_list)
         with r2_c3:
             cat_list = sorted(df['category'].unique().tolist())
             selected_cats = st.multiselect("📂 상품 카테고리", cat_list, default=cat_list)
 
-    # 6. 필터링 로직
-    pattern = "|".join(keywords)
-    # 야식과 거리가 먼 생활용품 등 제외 패턴
-    exclude_pattern = "|".join(["피죤", "가그린", "칫솔", "치약", "샴푸", "린스", "면도기", "생리대", "마스크", "세제", "멀티비타민"])
-
+    # 6. 필터링 로직 (테마는 비트 마스크 한 번, 검색어가 있을 때만 상품명 검색)
     filtered_df = df[
-        (df['name'].str.contains(pattern, case=False, na=False)) &
-        (~df['name'].str.contains(exclude_pattern, case=False, na=False)) &
+        theme_mask(df, snack_themes[selected_theme]) &
         (df['brand'].isin(selected_brands)) &
         (df['event'].isin(selected_events)) &
-        (df['category'].isin(selected_cats)) &
-        (df['name'].str.contains(search_query, case=False))
-    ].copy()
+        (df['category'].isin(selected_cats))
+    ]
+    if search_query:
+        filtered_df = filtered_df[filtered_df['name'].str.contains(search_query, case=False)]
 
     # 정렬
     if sort_option == "가격 낮은 순":
@@ -176,7 +149,7 @@ if not df.empty:
                 st.markdown(f"""
                     <div class="product-card">
                         <div class="img-container">
-                            <img src="{row['img_url'] if pd.notna(row['img_url']) else ''}">
+                            <img src="{row['img_url']}">
                         </div>
                         <div class="product-name" style="height: 45px; overflow: hidden;">{row['name']}</div>
                         <div style="margin-top: 8px;">
@@ -28,8 +28,8 @@ if os.path.exists("style.css"):
     with open("style.css", encoding="utf-8") as f:
         st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
 
-# 데이터 로드
-@st.cache_data(ttl=3600)
+# 데이터 로드 (읽기 전용으로 쓰므로 세션마다 복사하지 않고 한 벌을 공유)
+@st.cache_resource(ttl=3600)
 def get_processed_data():
     file_path = os.path.join('data', 'filtered_convenience_stores.csv')
     if not os.path.exists(file_path):
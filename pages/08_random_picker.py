@@ -1,10 +1,10 @@
 import streamlit as st
-import pandas as pd
 import random
 import os
 import time
 # 1. 장바구니 유틸리티 임포트 추가
 from utils.cart import init_cart, add_to_cart, is_in_cart, remove_from_cart, render_floating_cart
+from utils.dataset_service import products_by_id
 
 
 # 브랜드별 고유 컬러 반환 함수
@@ -29,14 +29,8 @@ if os.path.exists("style.css"):
         st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
 
 
-@st.cache_data(ttl=3600)
-def get_data():
-    file_path = os.path.join('data', 'categorized_data.csv')
-    if not os.path.exists(file_path): return pd.DataFrame()
-    return pd.read_csv(file_path)
-
-
-df = get_data()
+# 공용 데이터셋 (product_id로 바로 조회할 수 있도록 인덱스로 사용)
+df = products_by_id()
 
 # 2. 장바구니 초기화 및 UI 렌더링 호출
 init_cart()
@@ -85,8 +79,8 @@ if not df.empty:
                 time.sleep(1)  # 애니메이션 효과
                 picked = filtered_df.sample(n=1).iloc[0]
 
-                # 3. 결과를 session_state에 저장하여 장바구니 클릭 시 유지되도록 함
-                st.session_state.lucky_picked = picked.to_dict()
+                # 3. 결과(product_id)를 session_state에 저장하여 장바구니 클릭 시 유지되도록 함
+                st.session_state.lucky_picked = int(picked['product_id'])
                 st.balloons()
         else:
             st.session_state.lucky_picked = None
@@ -94,15 +88,14 @@ if not df.empty:
                 st.warning("선택하신 조건에 맞는 상품이 없습니다. 필터를 조정해 보세요!")
 
     # 4. 결과 출력 로직 (session_state 기반으로 변경하여 장바구니 버튼 상호작용 대응)
-    picked_item = st.session_state.get('lucky_picked')
+    picked_id = st.session_state.get('lucky_picked')
+    picked_item = df.loc[picked_id] if picked_id in df.index else None
 
-    if picked_item:
+    if picked_item is not None:
         with col_c:
             st.success(f"🎉 오늘의 추천 상품은 **{picked_item['name']}** 입니다!")
 
-            # 이미지 URL 처리
-            img_url = picked_item['img_url'] if pd.notna(
-                picked_item['img_url']) else "https://via.placeholder.com/250?text=No+Image"
+            img_url = picked_item['img_url']
 
             st.markdown(f"""
                 <div style="background-color: #161b22; border: 2px solid #58a6ff; border-radius: 20px; padding: 30px; text-align: center;">
@@ -123,8 +116,8 @@ if not df.empty:
             """, unsafe_allow_html=True)
 
             # 5. 장바구니 담기/취소 버튼 추가
-            cart_key = (picked_item['name'], picked_item['brand'], picked_item['event'])
-            in_cart = is_in_cart(picked_item['name'], picked_item['brand'], picked_item['event'])
+            cart_key = picked_id
+            in_cart = is_in_cart(cart_key)
             unit_price = int(picked_item.get('unit_price', picked_item['price']))
 
             st.markdown("<br>", unsafe_allow_html=True)
@@ -135,6 +128,7 @@ if not df.empty:
             else:
                 if st.button("🛒 장바구니에 담기", use_container_width=True, key="lucky_cart_btn", type="primary"):
                     add_to_cart(
+                        product_id=cart_key,
                         name=picked_item['name'],
                         brand=picked_item['brand'],
                         event=picked_item['event'],
@@ -1,9 +1,8 @@
 import streamlit as st
-import pandas as pd
 import random
 import time
-import os
 from utils.cart import init_cart, add_to_cart, is_in_cart, remove_from_cart, render_floating_cart
+from utils.dataset_service import products_by_id
 
 # 브랜드별 고유 컬러 반환 함수
 def get_brand_color(brand):
@@ -18,16 +17,9 @@ def get_brand_color(brand):
     }
     return brand_colors.get(brand, "#8b949e")
 
-# 1. 데이터 로드
-@st.cache_data(ttl=3600)
-def load_game_data():
-    file_path = os.path.join('data', 'categorized_data.csv')
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-    return pd.read_csv(file_path)
-
-df = load_game_data()
-game_df = df[(df['img_url'].notna()) & (~df['img_url'].str.contains('7-eleven.co.kr', na=False)) & (df['name'].notna())].copy()
+# 1. 데이터 로드 (공용 데이터셋, product_id로 바로 조회할 수 있도록 인덱스로 사용)
+df = products_by_id()
+game_df = df[~df['img_url'].str.contains('7-eleven.co.kr')]
 
 init_cart()
 render_floating_cart()
@@ -142,7 +134,10 @@ if not game_df.empty:
 
     # 5. 슬롯 표시 영역
     col1, col2, col3 = st.columns(3)
-    slots = st.session_state.slot_items
+    # 슬롯에는 product_id만 보관하고 화면에 그릴 때 데이터에서 조회
+    slots = [game_df.loc[pid] for pid in st.session_state.slot_items if pid in game_df.index]
+    if len(slots) != 3:
+        slots = []
     cols = [col1, col2, col3]
 
     for i in range(3):
@@ -167,19 +162,19 @@ if not game_df.empty:
             with st.spinner("돌아가는 중..."):
                 time.sleep(1.0)
                 if random.random() < 0.3:
-                    winning_item = filtered_df.sample(1).iloc[0]
-                    st.session_state.slot_items = [winning_item.to_dict() for _ in range(3)]
+                    winning_id = int(filtered_df.sample(1).iloc[0]['product_id'])
+                    st.session_state.slot_items = [winning_id] * 3
                 else:
-                    st.session_state.slot_items = [filtered_df.sample(1).iloc[0].to_dict() for _ in range(3)]
+                    st.session_state.slot_items = [int(filtered_df.sample(1).iloc[0]['product_id']) for _ in range(3)]
                 
                 # 당첨 여부 확인 및 횟수 증가
-                if len(set([item['name'] for item in st.session_state.slot_items])) == 1:
+                if len(set(st.session_state.slot_items)) == 1:
                     st.session_state.win_count += 1
                 
                 st.rerun()
 
     # 7. 결과창 (당첨 시)
-    if slots and len(set([item['name'] for item in slots])) == 1:
+    if slots and len(set(st.session_state.slot_items)) == 1:
         st.balloons()
         st.markdown(f"""
             <div style="background: #1C1C1E; border-radius: 28px; padding: 40px; border: 2px solid #3182F6; text-align: center; margin-top: 40px;">
@@ -195,8 +190,8 @@ if not game_df.empty:
         won_item = slots[0]
         _, jackpot_cart_col, _ = st.columns([1, 2, 1])
         with jackpot_cart_col:
-            cart_key = (won_item['name'], won_item['brand'], won_item['event'])
-            in_cart = is_in_cart(won_item['name'], won_item['brand'], won_item['event'])
+            cart_key = int(won_item['product_id'])
+            in_cart = is_in_cart(cart_key)
             unit_price = won_item.get('unit_price', won_item['price'])
             st.markdown("<br>", unsafe_allow_html=True)
             if in_cart:
@@ -206,6 +201,7 @@ if not game_df.empty:
             else:
                 if st.button("🛒 당첨 상품 장바구니 담기!", use_container_width=True, key="jackpot_cart_btn", type="primary"):
                     add_to_cart(
+                        product_id=cart_key,
                         name=won_item['name'],
                         brand=won_item['brand'],
                         event=won_item['event'],
@@ -6,6 +6,9 @@ import re
 import os
 from datetime import datetime
 
+# 브랜드 안에서 같은 상품으로 보는 기준 (먼저 수집된 행을 남김)
+DEDUP_COLUMNS = ['name', 'price', 'event']
+
 class CUCrawler:
     def __init__(self):
         self.brand = "CU"
@@ -24,11 +27,13 @@ class CUCrawler:
             return response.text
         except Exception: return None
 
-    def parse_data(self, html):
-        if not html: return False
+    def parse_items(self, html):
+        """페이지 HTML → 상품 레코드 목록 (상품이 없으면 None)"""
+        if not html: return None
         soup = BeautifulSoup(html, "html.parser")
         items = soup.select("li.prod_list")
-        if not items: return False
+        if not items: return None
+        records = []
         for item in items:
             try:
                 name = item.select_one(".name p").get_text(strip=True)
@@ -38,20 +43,31 @@ class CUCrawler:
                 event = event_element.get_text(strip=True) if event_element else "행사정보없음"
                 img_url = item.select_one(".prod_img img")['src']
                 if img_url.startswith("//"): img_url = "https:" + img_url
-                self.product_list.append({"brand": self.brand, "name": name, "price": price, "event": event, "img_url": img_url})
+                records.append({"brand": self.brand, "name": name, "price": price, "event": event, "img_url": img_url})
             except Exception: continue 
+        return records
+
+    def parse_data(self, html):
+        records = self.parse_items(html)
+        if records is None: return False
+        self.product_list.extend(records)
         return True
 
-    def run(self, max_pages=150):
-        start_ts = datetime.now()
-        print(f"🚀 [{self.brand}] 데이터 수집을 시작합니다...")
-        
+    def iter_products(self, max_pages=150):
+        """페이지를 차례로 받아 상품 레코드를 하나씩 내보냅니다 (스트리밍 배치용, 파일 저장 없음)."""
+        count = 0
         for page in range(1, max_pages + 1):
-            html = self.fetch_page(page)
-            if not self.parse_data(html): break
-            if page % 10 == 0: print(f" 📦 {page}페이지 수집 중... (누적: {len(self.product_list)}건)")
+            records = self.parse_items(self.fetch_page(page))
+            if records is None: break
+            yield from records
+            count += len(records)
+            if page % 10 == 0: print(f" 📦 {page}페이지 수집 중... (누적: {count}건)")
             time.sleep(0.5)
 
+    def run(self, max_pages=150):
+        start_ts = datetime.now()
+        print(f"🚀 [{self.brand}] 데이터 수집을 시작합니다...")
+        self.product_list.extend(self.iter_products(max_pages))
         self._save_to_csv(start_ts)
 
     def _save_to_csv(self, start_ts):
@@ -61,7 +77,7 @@ class CUCrawler:
 
         df = pd.DataFrame(self.product_list)
         raw_count = len(df)
-        df = df.drop_duplicates(subset=['name', 'price', 'event'])
+        df = df.drop_duplicates(subset=DEDUP_COLUMNS)
         
         date_str = datetime.now().strftime("%y%m%d")
         filename = f"CU_{date_str}.csv"
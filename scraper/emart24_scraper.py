@@ -7,6 +7,9 @@ import os
 import re
 from datetime import datetime
 
+# 브랜드 안에서 같은 상품으로 보는 기준 (먼저 수집된 행을 남김)
+DEDUP_COLUMNS = ['name', 'event']
+
 class Emart24Scraper:
     def __init__(self):
         self.brand = "emart24"
@@ -17,12 +20,8 @@ class Emart24Scraper:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/114.0.0.0 Safari/537.36'
         }
 
-    def run(self):
-        start_ts = datetime.now()
-        print(f"🚀 [{self.brand}] 데이터 수집을 시작합니다...")
-        
-        data_list = []
-
+    def iter_products(self):
+        """행사 카테고리별 페이지를 차례로 받아 상품 레코드를 하나씩 내보냅니다 (스트리밍 배치용, 파일 저장 없음)."""
         for seq, label in self.categories.items():
             page = 1
             print(f" 📦 {label} 카테고리 수집 중...")
@@ -31,27 +30,41 @@ class Emart24Scraper:
                 params = {'page': page, 'category_seq': seq}
                 try:
                     res = requests.get(self.base_url, headers=self.headers, params=params, timeout=10)
-                    soup = BeautifulSoup(res.text, 'html.parser')
-                    items = soup.find_all('div', class_='itemWrap')
+                    records = self.parse_items(res.text, label)
                 except Exception: break
 
-                if not items: break
+                if records is None: break
 
-                for item in items:
-                    try:
-                        name = item.select_one('.itemtitle p a').text.strip()
-                        # 가격 데이터에서 숫자만 추출하여 정수형으로 변환
-                        price_text = item.select_one('.price').text.strip()
-                        price = int(re.sub(r'[^0-9]', '', price_text))
-                        
-                        event = item.select_one('.itemTit span.floatR').text.strip() if item.select_one('.itemTit span.floatR') else label
-                        img_raw = item.select_one('.itemSpImg img')['src']
-                        img_url = img_raw if img_raw.startswith('http') else f"https://emart24.co.kr{img_raw}"
-                        data_list.append({'brand': self.brand, 'name': name, 'price': price, 'event': event, 'img_url': img_url})
-                    except Exception: continue
+                yield from records
                 page += 1
                 time.sleep(random.uniform(0.1, 0.3))
-            
+
+    def parse_items(self, html, label):
+        """페이지 HTML → 상품 레코드 목록 (상품이 없으면 None, 행사 표기가 없으면 카테고리 라벨 사용)"""
+        soup = BeautifulSoup(html, 'html.parser')
+        items = soup.find_all('div', class_='itemWrap')
+        if not items: return None
+
+        records = []
+        for item in items:
+            try:
+                name = item.select_one('.itemtitle p a').text.strip()
+                # 가격 데이터에서 숫자만 추출하여 정수형으로 변환
+                price_text = item.select_one('.price').text.strip()
+                price = int(re.sub(r'[^0-9]', '', price_text))
+
+                event = item.select_one('.itemTit span.floatR').text.strip() if item.select_one('.itemTit span.floatR') else label
+                img_raw = item.select_one('.itemSpImg img')['src']
+                img_url = img_raw if img_raw.startswith('http') else f"https://emart24.co.kr{img_raw}"
+                records.append({'brand': self.brand, 'name': name, 'price': price, 'event': event, 'img_url': img_url})
+            except Exception: continue
+        return records
+
+    def run(self):
+        start_ts = datetime.now()
+        print(f"🚀 [{self.brand}] 데이터 수집을 시작합니다...")
+        
+        data_list = list(self.iter_products())
         self._save_to_csv(data_list, start_ts)
 
     def _save_to_csv(self, data_list, start_ts):
@@ -61,7 +74,7 @@ class Emart24Scraper:
 
         df = pd.DataFrame(data_list)
         raw_count = len(df)
-        df.drop_duplicates(subset=['name', 'event'], keep='first', inplace=True)
+        df.drop_duplicates(subset=DEDUP_COLUMNS, keep='first', inplace=True)
         
         filename = f"{self.brand}_{datetime.now().strftime('%y%m%d')}.csv"
         os.makedirs("data", exist_ok=True)
@@ -6,11 +6,23 @@ import json
 import os
 from datetime import datetime
 
-def scrape_gs25_event_goods():
-    start_ts = datetime.now()
-    brand_name = "GS25"
-    print(f"🚀 [{brand_name}] 데이터 수집을 시작합니다...")
-    
+# 브랜드 안에서 같은 상품으로 보는 기준 (먼저 수집된 행을 남김)
+DEDUP_COLUMNS = ['name', 'event']
+
+def parse_event_goods(data):
+    """행사 상품 API 응답(JSON 문자열이 한 번 더 감싸져 올 수 있음) → 상품 레코드 목록"""
+    if isinstance(data, str): data = json.loads(data)
+    records = []
+    for item in data.get('results', []):
+        event_code = item.get('eventTypeSp', {}).get('code', '')
+        event_name = '1+1' if event_code == 'ONE_TO_ONE' else '2+1' if event_code == 'TWO_TO_ONE' else '덤증정' if event_code == 'GIFT' else event_code
+        try: price = int(float(item.get('price', 0)))
+        except: price = 0
+        records.append({'brand': 'GS25', 'name': item.get('goodsNm', '').strip(), 'price': price, 'event': event_name, 'img_url': item.get('attFileNm', '')})
+    return records
+
+def iter_gs25_event_goods():
+    """행사 상품 API를 페이지 단위로 받아 상품 레코드를 하나씩 내보냅니다 (스트리밍 배치용, 파일 저장 없음)."""
     session = requests.Session()
     headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'}
     
@@ -23,32 +35,33 @@ def scrape_gs25_event_goods():
         return
 
     api_url = f"http://gs25.gsretail.com/gscvs/ko/products/event-goods-search?CSRFToken={csrf_token}"
-    gs25_data_list = []
+    count = 0
     page_num = 1
     
     while True:
         payload = {'pageNum': page_num, 'pageSize': 100, 'parameterList': 'TOTAL'}
         res = session.get(api_url, params=payload, headers=headers)
-        data = res.json()
-        if isinstance(data, str): data = json.loads(data)
-        results = data.get('results', [])
-        if not results: break
-            
-        for item in results:
-            event_code = item.get('eventTypeSp', {}).get('code', '')
-            event_name = '1+1' if event_code == 'ONE_TO_ONE' else '2+1' if event_code == 'TWO_TO_ONE' else '덤증정' if event_code == 'GIFT' else event_code
-            try: price = int(float(item.get('price', 0)))
-            except: price = 0
-            gs25_data_list.append({'brand': 'GS25', 'name': item.get('goodsNm', '').strip(), 'price': price, 'event': event_name, 'img_url': item.get('attFileNm', '')})
-        
-        if page_num % 5 == 0: print(f" 📦 {page_num}페이지 수집 중... (누적: {len(gs25_data_list)}건)")
+        records = parse_event_goods(res.json())
+        if not records: break
+
+        yield from records
+        count += len(records)
+
+        if page_num % 5 == 0: print(f" 📦 {page_num}페이지 수집 중... (누적: {count}건)")
         page_num += 1
         time.sleep(0.5)
+
+def scrape_gs25_event_goods():
+    start_ts = datetime.now()
+    brand_name = "GS25"
+    print(f"🚀 [{brand_name}] 데이터 수집을 시작합니다...")
+    
+    gs25_data_list = list(iter_gs25_event_goods())
         
     if gs25_data_list:
         df = pd.DataFrame(gs25_data_list)
         raw_count = len(df)
-        df.drop_duplicates(subset=['name', 'event'], keep='first', inplace=True)
+        df.drop_duplicates(subset=DEDUP_COLUMNS, keep='first', inplace=True)
         
         file_date_str = datetime.now().strftime("%y%m%d")
         csv_filename = f'GS25_{file_date_str}.csv'
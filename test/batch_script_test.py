@@ -2,7 +2,7 @@
 테스트베드 환경으로 2026년 3월을 대상으로 배치 크롤링을 실행해봅니다.
 데이터는 2월꺼로 가정
 """
-import sys, os
+import sys, os, tempfile
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
@@ -14,13 +14,22 @@ TARGET_MONTH = 3
 
 test_run_time = datetime(2026, 3, 1, 0, 30, 0)
 
-print(f"Running batch test for {TARGET_YEAR}-{TARGET_MONTH} (dry-run)")
-get_next_month_data_batch(TARGET_YEAR, TARGET_MONTH, dry_run=False, run_time=test_run_time)
 
-log_dir = os.path.join(PROJECT_ROOT, 'batch', 'batch_script_log', f"{str(TARGET_YEAR)[-2:]}_{TARGET_MONTH}")
-print('Expected log dir:', log_dir)
-print('Exists:', os.path.exists(log_dir))
-if os.path.exists(log_dir):
-    print('Files:', os.listdir(log_dir))
-else:
-    print('No logs created')
+def test_batch_run():
+    # 상품 ID 레지스트리는 임시 경로에 기록 (저장소의 data/product_registry.csv는 건드리지 않음)
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Running batch test for {TARGET_YEAR}-{TARGET_MONTH} (dry-run)")
+        get_next_month_data_batch(TARGET_YEAR, TARGET_MONTH, dry_run=False, run_time=test_run_time,
+                                  registry_path=os.path.join(tmp, 'product_registry.csv'))
+
+    log_dir = os.path.join(PROJECT_ROOT, 'batch', 'batch_script_log', f"{str(TARGET_YEAR)[-2:]}_{TARGET_MONTH}")
+    print('Expected log dir:', log_dir)
+    print('Exists:', os.path.exists(log_dir))
+    if os.path.exists(log_dir):
+        print('Files:', os.listdir(log_dir))
+    else:
+        print('No logs created')
+
+
+if __name__ == "__main__":
+    test_batch_run()
@@ -0,0 +1,48 @@
+"""
+카테고리 분류 골든 테스트
+벡터화 이전 분류 코드가 만든 라벨(test/fixtures/categorize_golden.csv)과 현재 분류 결과를 비교합니다.
+키워드 목록 수정으로 의도적으로 바뀐 라벨은 KEYWORD_FIXES에만 둡니다.
+"""
+import sys, os
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.data_categorize import classify_names, classify_product
+
+GOLDEN_PATH = os.path.join(PROJECT_ROOT, 'test', 'fixtures', 'categorize_golden.csv')
+
+# 쉼표 누락으로 붙어 있던 간식류 키워드를 고치면서 바뀐 라벨 (test_keyword_list_fixes 참고)
+KEYWORD_FIXES = {
+    '제스)오레오아이스크림샌드위치1': '간식류',
+    'CJ)밸런스밀바말차초코': '간식류',
+    'CJ)밸런스밀바말차초코38G': '간식류',
+}
+
+
+def test_labels_unchanged():
+    golden = pd.read_csv(GOLDEN_PATH, encoding='utf-8-sig')
+    expected = golden['name'].map(KEYWORD_FIXES).fillna(golden['category'])
+
+    labels = classify_names(golden['name'])
+    diff = golden.assign(expected=expected, actual=labels)[labels != expected]
+    assert diff.empty, f"라벨이 달라진 상품 {len(diff)}건:\n{diff[['name', 'expected', 'actual']].head(20)}"
+
+
+def test_bulk_matches_single():
+    names = pd.Series(['HK)새싹보리500ml', '농심)신라면', '삼다수2L', '홍삼음료', None, '알수없는상품'])
+    assert classify_names(names).tolist() == [classify_product(n) for n in names]
+
+
+def test_keyword_list_fixes():
+    # 간식류 키워드 사이 쉼표 누락으로 '밸런스밀바말차초코아이스크림' 하나로 붙어 있던 키워드
+    assert classify_product('CJ)밸런스밀바말차초코38G') == '간식류'
+    assert classify_product('제스)오레오아이스크림샌드위치1') == '간식류'
+
+
+if __name__ == "__main__":
+    test_labels_unchanged()
+    test_bulk_matches_single()
+    test_keyword_list_fixes()
+    print("골든 테스트 통과")
@@ -0,0 +1,62 @@
+"""
+카테고리 캐시 테스트
+처음 보는 상품명만 분류기로 넘기는지, 규칙 해시가 바뀌면 캐시가 비워지는지 확인합니다.
+"""
+import sys, os, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.category_cache import CategoryCache
+from utils.data_categorize import RuleSet, classify_names
+
+
+def test_only_unseen_names_are_classified():
+    calls = []
+
+    def classifier(names):
+        calls.append(names.tolist())
+        return classify_names(names)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite')
+        with CategoryCache('rules-v1', path) as cache:
+            first = cache.classify(pd.Series(['삼다수2L', '농심)신라면', '삼다수2L']), classifier)
+        with CategoryCache('rules-v1', path) as cache:
+            second = cache.classify(pd.Series(['농심)신라면', '홍삼음료']), classifier)
+        with CategoryCache('rules-v2', path) as cache:
+            cache.classify(pd.Series(['농심)신라면']), classifier)
+
+    assert first.tolist() == ['생수', '식사류', '생수']
+    assert second.tolist() == ['식사류', '기타']
+    assert calls == [['삼다수2L', '농심)신라면'], ['홍삼음료'], ['농심)신라면']]
+
+
+def test_rule_change_reclassifies_only_affected_names():
+    old = RuleSet({"default": "기타", "rules": [{"category": "음료", "keywords": ["커피"]}]})
+    new = RuleSet({"default": "기타", "rules": [{"category": "음료", "keywords": ["커피", "콜라"]}]})
+    names = pd.Series(['카누커피', '코카콜라', '새우깡'])
+    calls = []
+
+    def classifier(rules):
+        def classify(batch):
+            calls.append(batch.tolist())
+            return batch.map(rules.classify)
+        return classify
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite')
+        with CategoryCache(old.hash, path, old.spec, old.changed_pattern) as cache:
+            assert cache.classify(names, classifier(old)).tolist() == ['음료', '기타', '기타']
+        with CategoryCache(new.hash, path, new.spec, new.changed_pattern) as cache:
+            assert cache.classify(names, classifier(new)).tolist() == ['음료', '음료', '기타']
+
+    # 규칙 변경 후에는 바뀐 키워드('콜라')가 들어간 상품명만 다시 분류
+    assert calls == [['카누커피', '코카콜라', '새우깡'], ['코카콜라']]
+
+
+if __name__ == "__main__":
+    test_only_unseen_names_are_classified()
+    test_rule_change_reclassifies_only_affected_names()
+    print("카테고리 캐시 테스트 통과")
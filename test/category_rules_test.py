@@ -0,0 +1,67 @@
+"""
+분류 규칙 파일 테스트
+규칙 파일 검증(형식 오류, 중복·가려진 키워드 제거), 파일 수정 시 다시 로드, 바뀐 키워드 정규식을 확인합니다.
+"""
+import sys, os, json, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.data_categorize import RuleSet, current_rules, validate_rules
+
+
+def _spec(snack, drink, default='기타'):
+    return {"version": 1, "default": default, "rules": [
+        {"category": "간식류", "groups": {"과자": snack}},
+        {"category": "음료", "keywords": drink},
+    ]}
+
+
+def test_validation():
+    version, default, rules = validate_rules(_spec(['과자', '젤리', '과자'], ['음료', '젤리음료', '커피']))
+    assert (version, default) == (1, '기타')
+    # 중복 '과자' 제거, '젤리음료'는 앞선 간식류 '젤리'에 가려져 제거
+    assert rules == [('간식류', ['과자', '젤리']), ('음료', ['음료', '커피'])]
+
+    for bad in ({"rules": []}, _spec([''], ['커피']), _spec(['과자'], []), _spec(['과자'], ['커피'], default=''),
+                {"default": "기타", "rules": [{"category": "음료", "keywords": ["a"]}, {"category": "음료", "keywords": ["b"]}]}):
+        try:
+            validate_rules(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"검증 실패를 기대했습니다: {bad}")
+
+
+def test_hot_reload_and_changed_pattern():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'rules.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(_spec(['과자'], ['커피']), f, ensure_ascii=False)
+        first = current_rules(path)
+        assert current_rules(path) is first
+        assert first.classify('카누커피') == '음료' and first.classify('초코바') == '기타'
+
+        spec = _spec(['과자', '초코바'], ['커피'])
+        spec['version'] = 2
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(spec, f, ensure_ascii=False)
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+        second = current_rules(path)
+        assert second.version == 2 and second.classify('초코바') == '간식류'
+
+        # 잘못된 파일로 바뀌면 직전 규칙 유지
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"rules": []}, f)
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 2_000_000))
+        assert current_rules(path) is second
+
+    pattern = second.changed_pattern(first.spec)
+    assert pattern.search('초코바') and not pattern.search('카누커피')
+    assert RuleSet(_spec(['과자'], ['커피'])).changed_pattern(first.spec).search('과자') is None
+    assert RuleSet(_spec(['과자'], ['커피'], default='미분류')).changed_pattern(first.spec) is None
+
+
+if __name__ == "__main__":
+    test_validation()
+    test_hot_reload_and_changed_pattern()
+    print("분류 규칙 테스트 통과")
@@ -0,0 +1,102 @@
+"""
+증분 정제 파티션 캐시 테스트
+원본이 그대로면 파티션을 재사용하고, 정제 코드가 바뀌면 파티션을 모두 다시 만드는지 확인합니다.
+파일명이 같은 원본(최신·히스토리 스냅샷)이 캐시에서 섞이지 않는지도 확인합니다.
+"""
+import sys, os, tempfile
+from datetime import datetime
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+import pytz
+import utils.data_cleaner_batch as cleaner
+
+_original_clean_frame = cleaner.clean_frame
+_original_fingerprint = cleaner.cleaner_fingerprint
+
+
+def _write_raw(path, brand):
+    pd.DataFrame({
+        'brand': brand,
+        'name': [f"{brand} 상품{i}" for i in range(20)],
+        'price': [f"{1000 + i * 100:,}원" for i in range(20)],
+        'event': ['1+1', '2+1'] * 10,
+        'img_url': [f"https://img/{brand}/{i}.jpg" for i in range(20)],
+    }).to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def _clean_frame_v2(df):
+    """정제 로직 변경을 흉내 낸 정제 함수 (새 컬럼 추가)"""
+    df = _original_clean_frame(df)
+    return df.assign(cleaned_by='v2')
+
+
+def _partition_mtimes():
+    return {os.path.join(root, name): os.stat(os.path.join(root, name)).st_mtime_ns
+            for root, _, names in os.walk(cleaner.PARTITION_DIR) for name in names}
+
+
+def test_partitions_rebuilt_when_cleaner_changes():
+    cwd = os.getcwd()
+    today = datetime.now(pytz.timezone('Asia/Seoul')).strftime("%y%m%d")
+    with tempfile.TemporaryDirectory() as tmp:
+        os.makedirs(os.path.join(tmp, 'data'))
+        for brand in ('CU', 'GS25'):
+            _write_raw(os.path.join(tmp, 'data', f"{brand}_{today}.csv"), brand)
+        os.chdir(tmp)
+        try:
+            output = os.path.join('data', 'cleaned_data.csv')
+            first = cleaner.clean_and_merge_batch(output)
+            assert {'event_type', 'buy_n', 'get_m'} <= set(first.columns)
+            built = _partition_mtimes()
+
+            # 원본과 정제 코드가 그대로면 파티션 재사용
+            cleaner.clean_and_merge_batch(output)
+            assert _partition_mtimes() == built
+
+            # 정제 코드가 바뀌면(모듈 소스가 달라져 지문이 바뀜) 변경 없는 원본도 다시 정제
+            cleaner.clean_frame = _clean_frame_v2
+            cleaner.cleaner_fingerprint = lambda: _original_fingerprint() + 'v2'
+            try:
+                second = cleaner.clean_and_merge_batch(output)
+            finally:
+                cleaner.clean_frame = _original_clean_frame
+                cleaner.cleaner_fingerprint = _original_fingerprint
+            assert (second['cleaned_by'] == 'v2').all()
+            assert all(_partition_mtimes()[name] != mtime for name, mtime in built.items())
+        finally:
+            os.chdir(cwd)
+
+
+def test_fingerprint_includes_schema_version():
+    # 소스가 같으면 지문이 같고, 매니페스트 형식 버전이 바뀌면 지문도 바뀜
+    fingerprint = cleaner.cleaner_fingerprint()
+    assert fingerprint == cleaner.cleaner_fingerprint()
+    version = cleaner.MANIFEST_VERSION
+    cleaner.MANIFEST_VERSION = version + 1
+    try:
+        assert cleaner.cleaner_fingerprint() != fingerprint
+    finally:
+        cleaner.MANIFEST_VERSION = version
+
+
+def test_partition_keyed_by_relative_path():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            latest = os.path.join('data', 'CU_260301.csv')
+            archived = os.path.join('data', 'history', 'raw', 'CU_260301.csv')
+            assert cleaner.source_key(os.path.abspath(latest)) == latest
+            assert cleaner.partition_path(latest) != cleaner.partition_path(archived)
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    test_partitions_rebuilt_when_cleaner_changes()
+    test_fingerprint_includes_schema_version()
+    test_partition_keyed_by_relative_path()
+    print("증분 정제 파티션 캐시 테스트 통과")
@@ -0,0 +1,70 @@
+"""
+스키마 검증 테스트
+규칙을 어긴 행이 사유와 함께 격리되고, 현재 데이터셋은 모든 규칙을 통과하는지 확인합니다.
+"""
+import sys, os, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.data_validation import QuarantineWriter, merge_quarantine, validate_frame
+from utils.event_taxonomy import normalize_events
+
+
+def test_bad_rows_are_quarantined_with_reasons():
+    df = normalize_events(pd.DataFrame({
+        'brand': ['CU', 'CU', 'brand', 'GS25', 'emart24'],
+        'name': ['정상상품', '가격없음', 'name', ' ', '이미지없음'],
+        'price': [1500, 0, 0, 2000, 1800],
+        'event': ['1+1', '2+1', 'event', '세일', '1+1'],
+        'img_url': ['https://a/1.jpg', 'https://a/2.jpg', 'img_url', 'http://a/3.jpg', None],
+    }))
+    valid, quarantined = validate_frame(df)
+
+    assert valid['name'].tolist() == ['정상상품']
+    assert quarantined['reasons'].tolist() == [
+        'invalid_price',
+        'unknown_brand;invalid_price;unknown_event;invalid_img_url',
+        'empty_name',
+        'invalid_img_url',
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = QuarantineWriter(os.path.join(tmp, 'quarantine.csv'))
+        writer.filter(df)
+        writer.filter(df)
+        assert writer.rows == 8
+        assert len(pd.read_csv(writer.path, encoding='utf-8-sig')) == 8
+
+
+def test_current_dataset_is_valid():
+    df = pd.read_csv(os.path.join(PROJECT_ROOT, 'data', 'categorized_data.csv'), encoding='utf-8-sig')
+    _, quarantined = validate_frame(df)
+    assert quarantined.empty, quarantined[['name', 'reasons']].head()
+
+
+def test_merge_brand_quarantine_files():
+    bad = normalize_events(pd.DataFrame({'brand': ['CU', 'GS25'], 'name': ['a', 'b'], 'price': [0, 0],
+                                         'event': ['1+1', '1+1'], 'img_url': ['https://x/1.jpg', 'https://x/2.jpg']}))
+    with tempfile.TemporaryDirectory() as tmp:
+        parts = [os.path.join(tmp, f'quarantine_{brand}.csv') for brand in ('CU', 'GS25', 'emart24')]
+        for part, row in zip(parts, [bad.iloc[:1], bad.iloc[1:]]):
+            QuarantineWriter(part).filter(row)
+
+        output = os.path.join(tmp, 'quarantine.csv')
+        merged = merge_quarantine(parts, output, remove=False)
+        assert merged.rows == 2 and pd.read_csv(output)['brand'].tolist() == ['CU', 'GS25']
+        assert all(os.path.exists(p) for p in parts[:2])
+
+        # 격리 행이 없으면 이전 실행의 결과 파일도 정리
+        merged = merge_quarantine(parts, output)
+        assert merged.rows == 2 and not any(os.path.exists(p) for p in parts)
+        assert merge_quarantine(parts, output).rows == 0 and not os.path.exists(output)
+
+
+if __name__ == "__main__":
+    test_bad_rows_are_quarantined_with_reasons()
+    test_current_dataset_is_valid()
+    test_merge_brand_quarantine_files()
+    print("스키마 검증 테스트 통과")
@@ -0,0 +1,49 @@
+"""
+데이터셋 매니페스트 테스트
+매니페스트의 개수·해시가 데이터와 일치하는지, 데이터가 바뀌면 오래된 매니페스트를 쓰지 않는지 확인합니다.
+"""
+import sys, os, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.data_cleaner_batch import file_sha256
+from utils.dataset_manifest import manifest_path_for, read_manifest, write_manifest
+
+DATA_PATH = os.path.join(PROJECT_ROOT, 'data', 'categorized_data.csv')
+
+
+def test_committed_manifest_matches_data():
+    manifest = read_manifest(DATA_PATH)
+    df = pd.read_csv(DATA_PATH, encoding='utf-8-sig')
+    assert manifest['sha256'] == file_sha256(DATA_PATH)
+    assert manifest['rows'] == len(df)
+    assert manifest['counts']['brand'] == df['brand'].value_counts().to_dict()
+    assert list(manifest['columns']) == df.columns.tolist()
+
+
+def test_write_and_stale_detection():
+    df = pd.DataFrame({'brand': ['CU', 'CU', 'GS25'], 'name': ['a', 'b', 'c'], 'event': ['1+1', '2+1', '1+1']})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'categorized_data.csv')
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+        written = write_manifest(path, sources={'CU': '2026-03-01'})
+
+        assert manifest_path_for(path) == os.path.join(tmp, 'categorized_data.manifest.json')
+        assert read_manifest(path) == written
+        assert written['counts']['brand'] == {'CU': 2, 'GS25': 1}
+        assert written['source_snapshots'] == {'CU': '2026-03-01'}
+
+        # 데이터가 바뀌었는데 매니페스트가 그대로면 데이터에서 다시 집계
+        df.iloc[:2].to_csv(path, index=False, encoding='utf-8-sig')
+        rebuilt = read_manifest(path)
+        assert rebuilt['rows'] == 2 and rebuilt['sha256'] != written['sha256']
+
+    assert read_manifest(os.path.join(PROJECT_ROOT, 'data', 'missing.csv')) is None
+
+
+if __name__ == "__main__":
+    test_committed_manifest_matches_data()
+    test_write_and_stale_detection()
+    print("데이터셋 매니페스트 테스트 통과")
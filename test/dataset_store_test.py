@@ -0,0 +1,59 @@
+"""
+데이터셋 스냅샷 저장소 테스트
+같은 기준 시각으로 여러 번 공개해도 실행마다 새 버전 디렉토리가 생기고, 공개된 디렉토리에는 다시 쓰지 않으며,
+직전 버전으로 롤백할 수 있는지 확인합니다.
+"""
+import sys, os, tempfile
+from datetime import datetime
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.dataset_store import (create_snapshot, current_version, list_versions, new_snapshot_dir, new_version,
+                                 publish_snapshot, read_pointer, rollback, snapshot_dir)
+
+RUN_TIME = datetime(2026, 3, 1, 0, 30, 0)
+
+
+def _publish(content: str) -> str:
+    os.makedirs('work', exist_ok=True)
+    with open(os.path.join('work', 'categorized_data.csv'), 'w', encoding='utf-8') as f:
+        f.write(content)
+    version = create_snapshot([os.path.join('work', 'categorized_data.csv')], new_version(RUN_TIME))
+    publish_snapshot(version)
+    return version
+
+
+def _read(version: str) -> str:
+    with open(os.path.join(snapshot_dir(version), 'categorized_data.csv'), encoding='utf-8') as f:
+        return f.read()
+
+
+def test_reruns_publish_new_versions():
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            first = _publish('v1')
+            second = _publish('v2')
+
+            # 같은 기준 시각이어도 버전이 겹치지 않고, 먼저 공개한 디렉토리는 그대로
+            assert first != second and list_versions() == [first, second]
+            assert _read(first) == 'v1' and _read(second) == 'v2'
+            assert read_pointer()['previous'] == first
+
+            try:
+                new_snapshot_dir(second)
+            except FileExistsError:
+                pass
+            else:
+                raise AssertionError("공개된 버전 디렉토리를 다시 열 수 있음")
+
+            assert rollback() == first and current_version() == first
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    test_reruns_publish_new_versions()
+    print("데이터셋 스냅샷 저장소 테스트 통과")
@@ -0,0 +1,37 @@
+"""
+행사 표기 정규화 테스트
+브랜드별로 다른 표기가 같은 라벨/종류/N+M으로 정규화되는지, 개당 가격 계산이 기존 페이지 계산과 같은지 확인합니다.
+"""
+import sys, os
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.event_taxonomy import bundle_of, discount_labels, normalize_events, unit_prices
+
+
+def test_variants_share_one_label():
+    raw = pd.DataFrame({
+        'event': ['1+1', '1 + 1', 'ONE_TO_ONE', '2 + 1', 'TWO_TO_ONE', '3 + 1', '세일', 'SALE', 'GIFT', '덤증정'],
+        'price': [3000] * 10,
+    })
+    df = normalize_events(raw)
+
+    assert df['event'].tolist() == ['1+1', '1+1', '1+1', '2+1', '2+1', '3+1', 'SALE', 'SALE', '덤증정', '덤증정']
+    assert df['event_type'].astype(str).tolist() == ['N+M'] * 6 + ['SALE'] * 2 + ['GIFT'] * 2
+    assert df['buy_n'].tolist() == [1, 1, 1, 2, 2, 3, 0, 0, 0, 0]
+    assert df['get_m'].tolist() == [1, 1, 1, 1, 1, 1, 0, 0, 0, 0]
+    assert bundle_of('2+1') == (2, 1) and bundle_of('SALE') == (0, 0)
+
+
+def test_unit_price_matches_page_rules():
+    df = normalize_events(pd.DataFrame({'event': ['1+1', '2+1', '3+1', '세일'], 'price': [1001, 1001, 1001, 1001]}))
+    assert unit_prices(df).tolist() == [1001 // 2, 1001 * 2 // 3, 1001 * 3 // 4, 1001]
+    assert discount_labels(df).tolist() == ['50%', '33%', '25%', '0%']
+
+
+if __name__ == "__main__":
+    test_variants_share_one_label()
+    test_unit_price_matches_page_rules()
+    print("행사 정규화 테스트 통과")
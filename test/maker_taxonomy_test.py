@@ -0,0 +1,51 @@
+"""
+제조사 접두어 추출 테스트
+별칭 정규화·제조사가 아닌 라벨·접두어 없는 상품명 처리와, 공개 데이터셋의 maker 컬럼이 최신인지 확인합니다.
+"""
+import sys, os, json, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.maker_taxonomy import MAKER_COLUMNS, extract_makers, load_maker_aliases
+
+DATA_PATH = os.path.join(PROJECT_ROOT, 'data', 'categorized_data.csv')
+
+
+def test_extract_makers():
+    names = pd.Series(['HK)새싹보리500ml', '하겐)컵바닐라', '위스키)조니워커블랙700ml',
+                       '장인라면(맵싸한맛)', '좋은느낌유기농순면라이너18P', None], index=[5, 4, 3, 2, 1, 0])
+    result = extract_makers(names)
+    assert result.index.tolist() == [5, 4, 3, 2, 1, 0]
+    assert result['maker'].tolist() == ['HK', '하겐다즈', '기타', '기타', '기타', '기타']
+    assert result['base_name'].tolist() == ['새싹보리500ml', '컵바닐라', '위스키)조니워커블랙700ml',
+                                            '장인라면(맵싸한맛)', '좋은느낌유기농순면라이너18P', '']
+
+
+def test_conflicting_alias_rejected():
+    spec = {'default': '기타', 'aliases': {'A': ['x'], 'B': ['x']}}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'maker_aliases.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(spec, f)
+        try:
+            load_maker_aliases(path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("한 별칭이 두 제조사에 걸리면 ValueError여야 합니다.")
+
+
+def test_published_dataset_is_current():
+    df = pd.read_csv(DATA_PATH, encoding='utf-8-sig')
+    expected = extract_makers(df['name'])
+    for col in MAKER_COLUMNS:
+        assert df[col].fillna('').tolist() == expected[col].tolist(), f"{col} 컬럼이 별칭 표와 다릅니다. (python utils/maker_taxonomy.py)"
+
+
+if __name__ == "__main__":
+    test_extract_makers()
+    test_conflicting_alias_rejected()
+    test_published_dataset_is_current()
+    print("제조사 접두어 추출 테스트 통과")
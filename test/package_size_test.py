@@ -0,0 +1,47 @@
+"""
+용량 추출 테스트
+용량·중량·묶음·입수 표기 해석과 행사 적용 100ml·100g당 가격, 공개 데이터셋의 용량 컬럼이 최신인지 확인합니다.
+"""
+import sys, os
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+import pandas as pd
+from utils.package_size import SIZE_COLUMNS, add_size_columns, parse_sizes
+
+DATA_PATH = os.path.join(PROJECT_ROOT, 'data', 'categorized_data.csv')
+
+
+def test_parse_sizes():
+    names = pd.Series(['새싹보리500ml', '컨디션헛개수1.0L', '햇반210g*3입', '쏘피유기농대형4P',
+                       '콤비네이션', '아이시스8.0 2L*6', '백산수1KG', None], index=range(8, 0, -1))
+    result = parse_sizes(names)
+    assert result.index.tolist() == list(range(8, 0, -1))
+    assert result['size_value'].fillna(-1).tolist() == [500, 1000, 630, 4, -1, 12000, 1000, -1]
+    assert result['size_unit'].fillna('').tolist() == ['ml', 'ml', 'g', '개', '', 'ml', 'g', '']
+
+
+def test_price_per_100_uses_event_price():
+    df = add_size_columns(pd.DataFrame({
+        'name': ['물500ml', '물2L', '휴지3롤'],
+        'price': [1000, 3000, 3000],
+        'event': ['1+1', '2+1', '1+1'],
+    }))
+    # 1+1 500ml: 개당 500원 → 100ml당 100원 / 2+1 2L: 개당 2000원 → 100ml당 100원 / 개수 단위는 없음
+    assert df['price_per_100'].tolist()[:2] == [100.0, 100.0]
+    assert np.isnan(df['price_per_100'].iloc[2])
+
+
+def test_published_dataset_is_current():
+    df = pd.read_csv(DATA_PATH, encoding='utf-8-sig')
+    expected = add_size_columns(df.drop(columns=SIZE_COLUMNS))
+    pd.testing.assert_frame_equal(df[SIZE_COLUMNS], expected[SIZE_COLUMNS], check_dtype=False)
+
+
+if __name__ == "__main__":
+    test_parse_sizes()
+    test_price_per_100_uses_event_price()
+    test_published_dataset_is_current()
+    print("용량 추출 테스트 통과")
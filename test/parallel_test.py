@@ -0,0 +1,50 @@
+"""
+파티션 병렬 처리 테스트
+프로세스 풀로 나눠 실행한 분류·정규화·스냅샷 정제 결과가 직렬 실행과 값·순서까지 같은지 확인합니다.
+"""
+import sys, os
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.data_categorize import classify_names
+from utils.parallel import map_items, map_partitions, partition_bounds
+from utils.price_history import _clean_snapshot
+from utils.product_matching import normalize_names
+from utils.snapshot_catalog import SnapshotCatalog
+
+CLEANED_PATH = os.path.join(PROJECT_ROOT, 'data', 'cleaned_data.csv')
+
+
+def test_partition_bounds():
+    assert partition_bounds(10, 3) == [(0, 3), (3, 6), (6, 10)]
+    assert partition_bounds(2, 4) == [(0, 1), (1, 2)]
+
+
+def test_map_partitions_matches_serial():
+    names = pd.read_csv(CLEANED_PATH, encoding='utf-8-sig')['name']
+    # 인덱스를 섞어 두어도 파티션 결과가 원래 순서로 합쳐지는지 확인
+    names.index = names.index[::-1]
+
+    for func in (classify_names, normalize_names):
+        serial = func(names)
+        parallel = map_partitions(func, names, workers=4, min_rows=500)
+        pd.testing.assert_series_equal(parallel, serial, check_names=False)
+        assert serial.to_csv(index=False) == parallel.to_csv(index=False)
+
+
+def test_map_items_keeps_order():
+    paths = [path for _, _, path in SnapshotCatalog(data_dir=os.path.join(PROJECT_ROOT, 'data')).history()]
+    serial = [_clean_snapshot(path) for path in paths]
+    parallel = map_items(_clean_snapshot, paths, workers=4)
+    assert len(parallel) == len(serial)
+    for a, b in zip(serial, parallel):
+        pd.testing.assert_frame_equal(a, b)
+
+
+if __name__ == "__main__":
+    test_partition_bounds()
+    test_map_partitions_matches_serial()
+    test_map_items_keeps_order()
+    print("파티션 병렬 처리 테스트 통과")
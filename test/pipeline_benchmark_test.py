@@ -0,0 +1,67 @@
+"""
+배치 파이프라인 벤치마크 테스트
+기준선 비교가 threshold와 잡음 하한을 지키는지, 사이트 응답 형식으로 만든 페이지를 스크래퍼 파서가 원본 행 그대로 읽는지,
+작은 합성 카탈로그로 모든 단계가 측정되는지 확인합니다.
+"""
+import sys, os, importlib.util, json, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+from benchmark.pipeline_benchmark import (PARSERS, benchmark_size, compare_results, load_results, render_pages,
+                                          save_results)
+from benchmark.synthetic_catalog import CatalogStats, generate_months, write_raw_snapshots
+
+STAGES = ['read', 'normalize', 'clean', 'categorize', 'enrich', 'match', 'write']
+
+
+def _results(stages):
+    return {'results': {'10000': {'rows': 10000, 'stages': stages}}}
+
+
+def test_compare_flags_regressions():
+    baseline = _results({'clean': 1.0, 'categorize': 0.5, 'write': 0.001, 'match': 2.0})
+    current = _results({'clean': 1.3, 'categorize': 0.55, 'write': 0.004, 'parse:CU': 1.0})
+    rows = {row['stage']: row for row in compare_results(baseline, current, threshold=0.2)}
+
+    assert rows['clean']['regression'] and abs(rows['clean']['ratio'] - 1.3) < 1e-9
+    assert not rows['categorize']['regression']          # 10% 느려짐은 threshold 이내
+    assert not rows['write']['regression']               # 4배지만 차이가 잡음 하한보다 작음
+    assert 'match' not in rows and 'parse:CU' not in rows  # 한쪽에만 있는 단계는 비교하지 않음
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'baseline.json')
+        save_results(baseline, path)
+        assert load_results(path) == baseline
+
+
+def test_rendered_pages_round_trip():
+    if importlib.util.find_spec('bs4') is None or importlib.util.find_spec('requests') is None:
+        return  # 스크래퍼 의존성이 없으면 벤치마크도 parse 단계를 건너뜀
+    raw = CatalogStats.from_data().sample(500, np.random.default_rng(0))
+    for brand, group in raw.groupby('brand'):
+        module, page_size, render, parse = PARSERS[brand]
+        mod = importlib.import_module(module)
+        records = [r for page in render_pages(group, page_size, render) for r in parse(mod, page)]
+        assert [(r['brand'], r['name'], r['price'], r['event'], r['img_url']) for r in records] == \
+            list(group.itertuples(index=False, name=None)), brand
+
+
+def test_benchmark_all_stages():
+    snapshots = generate_months(400, seed=5)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_raw_snapshots(snapshots, os.path.join(tmp, 'raw'))
+        cwd = os.getcwd()
+        result = benchmark_size(paths, repeat=1)
+        assert os.getcwd() == cwd  # 정제 단계의 작업 디렉토리 이동은 원래대로 복구
+    assert result['rows'] == 400
+    assert all(result['stages'][stage] > 0 for stage in STAGES)
+    json.dumps(result)
+
+
+if __name__ == "__main__":
+    test_compare_flags_regressions()
+    test_rendered_pages_round_trip()
+    test_benchmark_all_stages()
+    print("배치 파이프라인 벤치마크 테스트 통과")
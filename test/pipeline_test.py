@@ -0,0 +1,84 @@
+"""
+배치 파이프라인 DAG 실행기 테스트
+입력이 바뀌지 않은 단계는 건너뛰고, 독립 단계는 병렬로 실행되며,
+필수 단계가 실패하면 후속 단계가 막히는지 확인합니다.
+"""
+import sys, os, tempfile, threading
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from batch.pipeline import BLOCKED, DISABLED, DONE, FAILED, SKIPPED, Pipeline, Stage
+
+
+def _write(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_skip_unchanged_and_rerun_on_change():
+    with tempfile.TemporaryDirectory() as tmp:
+        raw, mid, out = (os.path.join(tmp, n) for n in ('raw.txt', 'mid.txt', 'out.txt'))
+        _write(raw, 'a')
+        calls = []
+
+        def upper():
+            calls.append('upper')
+            _write(mid, _read(raw).upper())
+
+        def repeat():
+            calls.append('repeat')
+            _write(out, _read(mid) * 2)
+
+        def build():
+            return Pipeline([Stage('repeat', repeat, deps=['upper'], inputs=[mid], outputs=[out]),
+                             Stage('upper', upper, inputs=[raw], outputs=[mid])],
+                            state_path=os.path.join(tmp, 'state.json'), log=lambda msg: None)
+
+        assert build().order() == ['upper', 'repeat']
+        assert build().run() == {'upper': DONE, 'repeat': DONE}
+        assert build().run() == {'upper': SKIPPED, 'repeat': SKIPPED}
+
+        # 입력이 바뀌면 해당 단계와 결과가 바뀐 후속 단계만 다시 실행
+        _write(raw, 'b')
+        assert build().run() == {'upper': DONE, 'repeat': DONE}
+        assert _read(out) == 'BB'
+
+        # 출력이 지워지면 다시 실행, force는 지문과 관계없이 실행
+        os.remove(out)
+        assert build().run() == {'upper': SKIPPED, 'repeat': DONE}
+        assert build().run(targets=['upper'], force=True) == {'upper': DONE}
+        assert calls == ['upper', 'repeat', 'upper', 'repeat', 'repeat', 'upper']
+
+
+def test_parallel_and_blocked():
+    with tempfile.TemporaryDirectory() as tmp:
+        barrier = threading.Barrier(2, timeout=5)
+
+        def crawl():
+            barrier.wait()  # 두 크롤링 단계가 동시에 실행되지 않으면 타임아웃
+
+        def broken():
+            raise RuntimeError('boom')
+
+        stages = [
+            Stage('crawl_a', crawl, optional=True),
+            Stage('crawl_b', crawl, optional=True),
+            Stage('crawl_c', crawl, optional=True, enabled=False),
+            Stage('clean', broken, deps=['crawl_a', 'crawl_b', 'crawl_c']),
+            Stage('categorize', lambda: None, deps=['clean']),
+        ]
+        results = Pipeline(stages, state_path=os.path.join(tmp, 'state.json'), log=lambda msg: None).run()
+        assert results == {'crawl_a': DONE, 'crawl_b': DONE, 'crawl_c': DISABLED,
+                           'clean': FAILED, 'categorize': BLOCKED}
+
+
+if __name__ == "__main__":
+    test_skip_unchanged_and_rerun_on_change()
+    test_parallel_and_blocked()
+    print("파이프라인 테스트 통과")
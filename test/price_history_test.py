@@ -0,0 +1,61 @@
+"""
+가격 히스토리 저장소 테스트
+델타 인코딩 저장 후 조회/복원한 값이 원래 스냅샷 값과 같은지,
+증분 추가와 저장·로드가 이력을 보존하는지 확인합니다.
+"""
+import sys, os, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from datetime import date
+
+import pandas as pd
+from utils.price_history import PriceHistory
+
+
+def _snapshot(prices, events):
+    return pd.DataFrame({
+        'brand': 'CU',
+        'name': [f"상품{i}" for i in range(len(prices))],
+        'price': prices,
+        'event': events,
+    })
+
+
+def test_roundtrip_and_incremental_append():
+    jan = _snapshot([1000, 2000, 3000], ['1+1', '2+1', '1+1'])
+    feb = _snapshot([1200, 2000], ['1+1', '1+1'])
+    mar = _snapshot([900, 2000, 3500], ['2+1', '1+1', '1+1'])
+
+    store = PriceHistory()
+    store.append_snapshots([(date(2026, 1, 1), 'CU', jan), (date(2026, 2, 1), 'CU', feb)])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'price_history.npz')
+        store.save(path)
+        store = PriceHistory.load(path)
+        store.append_snapshots([(date(2026, 3, 1), 'CU', mar)])
+        store.save(path)
+        store = PriceHistory.load(path)
+
+    assert len(store) == 3 and store.n_observations == 8
+    assert store.is_ingested('CU', date(2026, 2, 1))
+    assert not store.is_ingested('GS25', date(2026, 2, 1))
+
+    first = store.lookup('CU', '상품0')
+    assert first['price'].tolist() == [1000, 1200, 900]
+    assert first['event'].tolist() == ['1+1', '1+1', '2+1']
+    assert store.lookup('CU', '없는상품').empty
+
+    # 전체 복원(벡터 연산)이 상품별 조회와 일치
+    frame = store.to_frame()
+    assert frame.loc[frame['name'] == '상품2', 'price'].tolist() == [3000, 3500]
+
+    changes = store.changes()
+    assert sorted(zip(changes['name'], changes['date'].dt.month)) == [('상품0', 2), ('상품0', 3), ('상품1', 2), ('상품2', 3)]
+
+
+if __name__ == "__main__":
+    test_roundtrip_and_incremental_append()
+    print("가격 히스토리 테스트 통과")
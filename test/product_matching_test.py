@@ -0,0 +1,43 @@
+"""
+브랜드 간 상품 매칭 테스트
+표기만 다른 같은 상품은 한 그룹으로, 용량이나 구성이 다른 상품은 다른 그룹으로 묶이는지 확인합니다.
+"""
+import sys, os
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.product_matching import assign_match_groups, cheapest_offers, normalize_name
+
+
+def test_normalize_name():
+    assert normalize_name('HK)새싹보리P500ml') == normalize_name('HK)새싹보리펫500ml') == '새싹보리500ml'
+    assert normalize_name('롯데)칠성사이다1.5L') == '칠성사이다1500ml'
+    assert normalize_name('CJ)맛밤80G') == normalize_name('CJ)맛밤80g')
+
+
+def test_cross_brand_groups():
+    df = pd.DataFrame({
+        'brand': ['7Eleven', 'CU', 'emart24', 'GS25', 'CU', 'GS25', 'GS25'],
+        'name': ['HK)새싹보리500ml', 'HK)새싹보리P500ml', 'HK)새싹보리펫500ml', 'HK)새싹보리블랙500ML',
+                 '웅진)아침햇살P500ml', '웅진)아침햇살500ML', '웅진)아침햇살1.5L'],
+        'price': [2500, 2500, 2400, 2500, 2000, 1800, 3500],
+        'event': ['1+1', '1+1', '1+1', '1+1', '2+1', '1+1', '1+1'],
+    })
+    groups = assign_match_groups(df).tolist()
+
+    assert groups[0] == groups[1] == groups[2]
+    assert groups[3] != groups[0]                       # 블랙은 다른 상품
+    assert groups[4] == groups[5] != groups[6]          # 용량이 다르면 다른 상품
+
+    df['match_group_id'] = groups
+    cheapest = cheapest_offers(df)
+    assert cheapest.loc[groups[0], 'brand'] == 'emart24'
+    assert cheapest.loc[groups[4], 'brand'] == 'GS25'   # 1+1 개당 900원 < 2+1 개당 1333원
+
+
+if __name__ == "__main__":
+    test_normalize_name()
+    test_cross_brand_groups()
+    print("상품 매칭 테스트 통과")
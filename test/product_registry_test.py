@@ -0,0 +1,69 @@
+"""
+상품 ID 레지스트리 테스트
+다음 스냅샷에서도 같은 상품은 같은 product_id를 유지하고, 새 상품에만 새 ID가 발급되는지,
+first_seen/last_seen이 실행 날짜가 아닌 스냅샷 날짜를 따르는지 확인합니다.
+"""
+import sys, os, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.product_registry import assign_product_ids, ensure_product_ids, load_registry, save_registry, seed_registry
+
+
+def test_ids_survive_across_snapshots():
+    feb = pd.DataFrame({'brand': ['CU', 'CU', 'GS25'], 'name': ['A', 'B', 'A'], 'event': ['1+1', '2+1', '1+1']})
+    mar = pd.DataFrame({'brand': ['GS25', 'CU', 'CU'], 'name': ['A', 'C', 'B'], 'event': ['1+1', '1+1', '1+1']})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'product_registry.csv')
+        feb_ids, registry = assign_product_ids(feb, load_registry(path), seen_on='2026-02-01')
+        save_registry(registry, path)
+        mar_ids, registry = assign_product_ids(mar, load_registry(path), seen_on='2026-03-01')
+        save_registry(registry, path)
+
+        assert feb_ids.tolist() == [1, 2, 3]
+        assert mar_ids.tolist() == [3, 4, 5]            # GS25 A 유지, 행사가 바뀐 CU B는 새 ID
+        assert load_registry(path).set_index('product_id').loc[1, 'last_seen'] == '2026-02-01'
+
+        # product_id 컬럼이 없는 이전 데이터는 레지스트리 조회 + 임시 음수 ID
+        old = ensure_product_ids(pd.DataFrame({'brand': ['CU', 'CU'], 'name': ['C', 'Z'], 'event': ['1+1', '1+1']}), path)
+        assert old['product_id'].iloc[0] == 4 and old['product_id'].iloc[1] < 0
+
+
+def test_seen_dates_follow_snapshots():
+    feb = pd.DataFrame({'brand': ['CU', 'GS25'], 'name': ['A', 'A'], 'event': ['1+1', '1+1']})
+    mar = pd.DataFrame({'brand': ['CU', 'GS25'], 'name': ['A', 'B'], 'event': ['1+1', '1+1']})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'product_registry.csv')
+        # 브랜드마다 스냅샷 날짜가 다르면 그 날짜로 기록
+        _, registry = assign_product_ids(mar, load_registry(path), seen_on={'CU': '2026-03-01', 'GS25': '2026-03-02'})
+        save_registry(registry, path)
+        # 지난 스냅샷으로 다시 실행해도 last_seen은 앞당겨지지 않고 first_seen만 더 이른 날짜로
+        _, registry = assign_product_ids(feb, load_registry(path), seen_on={'CU': '2026-02-01', 'GS25': '2026-02-01'})
+
+        dates = registry.set_index(['brand', 'name'])[['first_seen', 'last_seen']]
+        assert dates.loc[('CU', 'A')].tolist() == ['2026-02-01', '2026-03-01']
+        assert dates.loc[('GS25', 'B')].tolist() == ['2026-03-02', '2026-03-02']
+        assert dates.loc[('GS25', 'A')].tolist() == ['2026-02-01', '2026-02-01']
+
+
+def test_seed_registry_from_dataset():
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset = os.path.join(tmp, 'categorized_data.csv')
+        pd.DataFrame({'product_id': [7, 3, 7], 'brand': ['CU', 'GS25', 'CU'], 'name': ['A', 'B', 'A'],
+                      'event': ['1+1', '2+1', '1+1']}).to_csv(dataset, index=False, encoding='utf-8-sig')
+        # 레지스트리가 없어도 배포된 데이터셋의 ID를 이어서 사용
+        ids, registry = assign_product_ids(pd.DataFrame({'brand': ['CU', 'CU'], 'name': ['A', 'C'], 'event': ['1+1', '1+1']}),
+                                           seed_registry(dataset), seen_on='2026-03-01')
+        assert ids.tolist() == [7, 8]
+        assert pd.isna(registry.set_index('product_id').loc[3, 'last_seen'])  # 다시 관측되기 전까지 비어 있음
+
+
+if __name__ == "__main__":
+    test_ids_survive_across_snapshots()
+    test_seen_dates_follow_snapshots()
+    test_seed_registry_from_dataset()
+    print("상품 ID 레지스트리 테스트 통과")
@@ -0,0 +1,121 @@
+"""
+메모리 절약형 상품 테이블 테스트
+컬럼 타입을 줄여도 값은 원본 CSV와 같고, 실제 메모리 사용량은 줄어드는지,
+공용 데이터셋의 파생 컬럼과 뷰가 페이지들이 따로 계산하던 값과 같은지 확인합니다.
+"""
+import sys, os
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+import pandas as pd
+import utils.product_table as product_table
+from utils.event_taxonomy import discount_labels, discount_rates, unit_prices
+from utils.product_table import (ProductDataset, compact_product_table, image_urls, load_product_table, memory_report,
+                                 shared_view)
+
+DATA_PATH = os.path.join(PROJECT_ROOT, 'data', 'categorized_data.csv')
+
+
+def test_lean_dtypes():
+    df = load_product_table(DATA_PATH)
+    for col in ['brand', 'event', 'event_type', 'category']:
+        assert isinstance(df[col].dtype, pd.CategoricalDtype), col
+    assert df['price'].dtype == np.int32
+    assert df['match_group_id'].dtype == np.int32
+    assert df['buy_n'].dtype == np.int8
+
+
+def test_values_match_raw():
+    raw = pd.read_csv(DATA_PATH, encoding='utf-8-sig')
+    lean = load_product_table(DATA_PATH, encode_img_url=True)
+
+    assert lean.columns.tolist()[:5] == raw.columns.tolist()[:5]
+    for col in ['brand', 'name', 'event', 'category']:
+        assert lean[col].astype(str).tolist() == raw[col].astype(str).tolist(), col
+    assert lean['price'].tolist() == raw['price'].tolist()
+    assert lean['product_id'].tolist() == raw['product_id'].tolist()
+    assert image_urls(lean).tolist() == raw['img_url'].fillna('').tolist()
+
+
+def test_interned_names_share_objects():
+    df = compact_product_table(pd.DataFrame({
+        'brand': ['CU', 'GS25'], 'name': ['바나나우유', ''.join(['바나나', '우유'])],
+        'price': [1500, 1500], 'event': ['1+1', '1+1'],
+    }))
+    assert df['name'].iloc[0] is df['name'].iloc[1]
+
+
+def test_memory_report_shrinks():
+    raw = pd.read_csv(DATA_PATH, encoding='utf-8-sig')
+    lean = load_product_table(DATA_PATH, encode_img_url=True)
+    raw_total = memory_report(raw).loc['(total)', 'bytes']
+    lean_report = memory_report(lean)
+    assert lean_report.loc['(total)', 'bytes'] == lean_report['bytes'].iloc[:-1].sum()
+    assert lean_report.loc['(total)', 'bytes'] < raw_total
+    # 범주형 컬럼은 행 수와 무관하게 코드(1바이트) + 고유값 사전 크기
+    assert lean_report.loc['brand', 'bytes'] < memory_report(raw).loc['brand', 'bytes'] / 4
+
+
+def test_product_dataset_views():
+    table = load_product_table(DATA_PATH)
+    dataset = ProductDataset.load(DATA_PATH)
+    df = dataset.products
+
+    assert df['unit_price'].tolist() == unit_prices(table).tolist()
+    assert df['discount_num'].tolist() == discount_rates(table).tolist()
+    assert df['discount_rate'].tolist() == discount_labels(table).tolist()
+    bundle = table['event_type'] == 'N+M'
+    assert df['pay_count'].tolist() == table['buy_n'].astype(int).where(bundle, 1).tolist()
+    assert df['total_count'].tolist() == (table['buy_n'] + table['get_m']).astype(int).where(bundle, 1).tolist()
+    # 파생 컬럼은 새 프레임에 붙이므로 읽어 온 테이블은 그대로
+    assert 'unit_price' not in table.columns
+
+    pd.testing.assert_frame_equal(dataset.unique_products, df.drop_duplicates(subset=['name', 'event', 'brand']))
+    pid = int(df['product_id'].iloc[10])
+    assert dataset.by_id.loc[pid, 'name'] == df['name'].iloc[10]
+    assert len(dataset) == len(table)
+
+    empty = ProductDataset.load(os.path.join(PROJECT_ROOT, 'data', 'missing.csv'))
+    assert empty.products.empty and empty.unique_products.empty and empty.by_id.empty
+
+    # 같은 (brand, name, event)에 가격만 다른 행이 있어도 ID 조회는 한 행(Series)
+    dup = pd.concat([table.iloc[[10]].assign(price=table['price'].iloc[10] + 100), table], ignore_index=True)
+    by_id = ProductDataset(dup).by_id
+    assert by_id.index.is_unique and isinstance(by_id.loc[pid], pd.Series)
+    assert by_id.loc[pid, 'price'] == table['price'].iloc[10] + 100
+
+
+def test_shared_view_copy_on_write():
+    shared = ProductDataset.load(DATA_PATH).products
+    before = shared.copy()
+    view = shared_view(shared)
+    # 뷰는 데이터를 복사하지 않고 공유 프레임의 배열을 그대로 씀
+    assert np.shares_memory(view['price'].to_numpy(), shared['price'].to_numpy())
+
+    # 페이지에서 하는 제자리 수정이 공유 프레임에 새지 않아야 함
+    view['is_recommended'] = view['name'].str.contains('우유', na=False).astype(int)
+    view['discount_rate'] = (view['price'] - view['unit_price']) / view['price'] * 100
+    view.loc[view.index[0], 'price'] = -1
+    assert 'is_recommended' not in shared.columns
+    pd.testing.assert_frame_equal(shared, before)
+
+    # copy-on-write가 꺼져 있으면(pandas<3 기본값) 얕은 뷰 대신 복사본으로 격리
+    original = product_table.copy_on_write_enabled
+    product_table.copy_on_write_enabled = lambda: False
+    try:
+        copied = shared_view(shared)
+    finally:
+        product_table.copy_on_write_enabled = original
+    assert not np.shares_memory(copied['price'].to_numpy(), shared['price'].to_numpy())
+
+
+if __name__ == "__main__":
+    test_lean_dtypes()
+    test_values_match_raw()
+    test_interned_names_share_objects()
+    test_memory_report_shrinks()
+    test_product_dataset_views()
+    test_shared_view_copy_on_write()
+    print("메모리 절약형 상품 테이블 테스트 통과")
@@ -0,0 +1,49 @@
+"""
+스트리밍 정제기 테스트
+청크 단위로 정제한 결과가 한 번에 읽어 정제한 결과와 같은지,
+중복 키가 디스크로 넘어간 뒤에도 중복 제거가 유지되는지 확인합니다.
+"""
+import io, sys, os, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.data_cleaner_batch import clean_frame, read_raw_csv
+from utils.stream_cleaner import stream_clean_files
+
+
+def _write_raw(path, brand, n):
+    df = pd.DataFrame({
+        'brand': brand,
+        'name': [f"상품{i % (n // 2)}" for i in range(n)],  # 파일 안에서 절반은 중복
+        'price': [f"{1000 + i % (n // 2):,}원" for i in range(n)],
+        'event': '1+1',
+        'img_url': [f"https://img/{i % (n // 2)}.jpg" for i in range(n)],
+    })
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def test_chunked_matches_in_memory():
+    with tempfile.TemporaryDirectory() as tmp:
+        files = [os.path.join(tmp, 'CU_260101.csv'), os.path.join(tmp, 'CU_260201.csv')]
+        _write_raw(files[0], 'CU', 4000)
+        _write_raw(files[1], 'CU', 6000)  # 앞 파일과 겹치는 행 포함
+
+        expected = pd.concat([clean_frame(read_raw_csv(f)) for f in files], ignore_index=True).drop_duplicates()
+
+        output = os.path.join(tmp, 'out.csv')
+        rows = stream_clean_files(files, output, clean_frame, read_raw_csv,
+                                  chunk_rows=1000, memory_limit_mb=0.1, spill_dir=tmp)
+        result = pd.read_csv(output, encoding='utf-8-sig')
+
+        assert rows == len(expected) == 3000
+        # CSV 왕복 후 dtype(범주형 등) 차이는 비교에서 제외
+        expected = pd.read_csv(io.StringIO(expected.to_csv(index=False)))
+        assert result.equals(expected)
+        assert not [f for f in os.listdir(tmp) if f.startswith('dedup_')]
+
+
+if __name__ == "__main__":
+    test_chunked_matches_in_memory()
+    print("스트리밍 정제 테스트 통과")
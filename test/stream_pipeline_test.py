@@ -0,0 +1,210 @@
+"""
+스트리밍 배치 파이프라인 테스트
+원본 스냅샷을 한 번에 흘려보낸 결과와 브랜드 파티션을 따로 만든 뒤 합친 결과가
+단계별 실행(정제 → 분류 → 매칭 → 제조사 → 용량 → 테마 → ID)과 같은지,
+스크래퍼 레코드의 브랜드 내 중복 제거와 원본 체크포인트가 동작하는지,
+수집 실패만 원본 스냅샷으로 대체하고 후처리 오류는 그대로 실패하는지 확인합니다.
+"""
+import sys, os, shutil, tempfile
+from datetime import date, datetime
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+import batch.stream_pipeline as stream_pipeline
+from batch.stream_pipeline import (RAW_COLUMNS, RawCheckpoint, StreamSource, merge_partitions, prepare_partition,
+                                   process_source, record_chunks, replay_sources, run_stream_pipeline)
+from utils.data_categorize import run_categorization
+from utils.data_cleaner_batch import clean_frame, read_raw_csv
+from utils.data_validation import QuarantineWriter
+from utils.maker_taxonomy import run_maker_extraction
+from utils.package_size import run_size_extraction
+from utils.product_matching import run_matching
+from utils.product_registry import run_registry, save_registry, seed_registry
+from utils.snapshot_catalog import SnapshotCatalog, parse_snapshot_name
+from utils.theme_tags import run_theme_tagging
+
+RUN_TIME = datetime(2026, 3, 1, 0, 30, 0)
+
+
+def _snapshot_dates(paths):
+    """원본 경로들의 {브랜드: 스냅샷 날짜} (레지스트리 first_seen/last_seen 기준)"""
+    return {brand: d.isoformat() for brand, d in map(parse_snapshot_name, paths)}
+
+
+def _seed_registry(tmp):
+    """배포된 데이터셋의 ID로 시작하는 임시 레지스트리 (저장소의 레지스트리 파일은 건드리지 않음)"""
+    path = os.path.join(tmp, 'seed_registry.csv')
+    if not os.path.exists(path):
+        save_registry(seed_registry(os.path.join(PROJECT_ROOT, 'data', 'categorized_data.csv')), path)
+    return path
+
+
+def _file_pipeline(paths, tmp, registry_path):
+    cleaned = pd.concat([clean_frame(read_raw_csv(p)) for p in paths], ignore_index=True).drop_duplicates()
+    cleaned = QuarantineWriter(os.path.join(tmp, 'quarantine.csv')).filter(cleaned)
+    steps = [os.path.join(tmp, f'{n}.csv') for n in ('cleaned', 'categorized', 'matched', 'makers', 'sizes', 'themes')]
+    cleaned.to_csv(steps[0], index=False, encoding='utf-8-sig')
+    run_categorization(steps[0], steps[1], use_cache=False, workers=1)
+    run_matching(steps[1], steps[2], workers=1)
+    run_maker_extraction(steps[2], steps[3])
+    run_size_extraction(steps[3], steps[4])
+    run_theme_tagging(steps[4], steps[5])
+    output = os.path.join(tmp, 'final.csv')
+    run_registry(steps[5], output, registry_path=registry_path, seen_on=_snapshot_dates(paths))
+    return pd.read_csv(output, encoding='utf-8-sig')
+
+
+def test_stream_matches_file_pipeline():
+    paths = SnapshotCatalog(os.path.join(PROJECT_ROOT, 'data')).latest_paths()
+    with tempfile.TemporaryDirectory() as tmp:
+        file_dir, stream_dir = os.path.join(tmp, 'file'), os.path.join(tmp, 'stream')
+        for d in (file_dir, stream_dir):
+            os.makedirs(d, exist_ok=True)
+            shutil.copy(_seed_registry(tmp), os.path.join(d, 'registry.csv'))
+
+        expected = _file_pipeline(paths, file_dir, os.path.join(file_dir, 'registry.csv'))
+        run_stream_pipeline(RUN_TIME, sources=replay_sources(paths, chunk_rows=500), output_dir=stream_dir,
+                            checkpoints=['cleaned'], registry_path=os.path.join(stream_dir, 'registry.csv'),
+                            use_cache=False, workers=1)
+        result = pd.read_csv(os.path.join(stream_dir, 'categorized_data.csv'), encoding='utf-8-sig')
+
+        pd.testing.assert_frame_equal(result, expected)
+        pd.testing.assert_frame_equal(pd.read_csv(os.path.join(stream_dir, 'registry.csv')),
+                                      pd.read_csv(os.path.join(file_dir, 'registry.csv')))
+        cleaned = pd.read_csv(os.path.join(stream_dir, 'cleaned_data.csv'), encoding='utf-8-sig')
+        pd.testing.assert_frame_equal(cleaned, pd.read_csv(os.path.join(file_dir, 'cleaned.csv'), encoding='utf-8-sig'))
+
+
+def test_partitions_match_file_pipeline():
+    paths = SnapshotCatalog(os.path.join(PROJECT_ROOT, 'data')).latest_paths()
+    with tempfile.TemporaryDirectory() as tmp:
+        file_dir, part_dir = os.path.join(tmp, 'file'), os.path.join(tmp, 'part')
+        for d in (file_dir, part_dir):
+            os.makedirs(d, exist_ok=True)
+            shutil.copy(_seed_registry(tmp), os.path.join(d, 'registry.csv'))
+        expected = _file_pipeline(paths, file_dir, os.path.join(file_dir, 'registry.csv'))
+
+        # 브랜드 순서와 관계없이 준비해도(먼저 끝난 브랜드부터) 통합 결과는 같음
+        partitions = [os.path.join(part_dir, os.path.basename(p)) for p in paths]
+        for raw, part in reversed(list(zip(paths, partitions))):
+            prepare_partition(raw, part, part + '.quarantine', use_cache=False)
+        merged = os.path.join(part_dir, 'merged.csv')
+        merge_partitions(partitions, merged, cleaned_path=os.path.join(part_dir, 'cleaned.csv'), workers=1)
+        output = os.path.join(part_dir, 'final.csv')
+        run_registry(merged, output, registry_path=os.path.join(part_dir, 'registry.csv'),
+                     seen_on=_snapshot_dates(paths))
+
+        pd.testing.assert_frame_equal(pd.read_csv(output, encoding='utf-8-sig'), expected)
+        pd.testing.assert_frame_equal(pd.read_csv(os.path.join(part_dir, 'cleaned.csv'), encoding='utf-8-sig'),
+                                      pd.read_csv(os.path.join(file_dir, 'cleaned.csv'), encoding='utf-8-sig'))
+
+
+def test_record_chunks_dedup_and_checkpoint():
+    records = [{'brand': 'CU', 'name': f'상품{i % 3}', 'price': 1000 + i, 'event': '1+1',
+                'img_url': f'https://img/{i}.jpg'} for i in range(7)]
+    records.append({'brand': 'CU', 'name': '', 'price': 1000, 'event': '1+1', 'img_url': ''})
+    chunks = list(record_chunks(iter(records), chunk_rows=2, dedup_columns=['name', 'event']))
+
+    merged = pd.concat(chunks)
+    # 청크 경계를 넘어서도 (name, event) 기준 첫 행만 남고, 빈 문자열은 결측
+    assert merged['price'].tolist() == [1000, 1001, 1002, 1000]
+    assert merged['name'].isna().tolist() == [False, False, False, True]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'CU_260301.csv')
+        checkpoint = RawCheckpoint(path)
+        for chunk in chunks:
+            checkpoint.write(chunk)
+        assert not os.path.exists(path)
+        checkpoint.commit()
+        saved = read_raw_csv(path)
+        assert saved.columns.tolist() == RAW_COLUMNS and len(saved) == 4
+
+        # 다시 흘려보낸 원본은 체크포인트와 같은 브랜드·날짜로 인식
+        source = replay_sources([path])[0]
+        assert (source.brand, source.snapshot_date) == ('CU', date(2026, 3, 1))
+
+
+def test_failed_brand_is_skipped():
+    def broken():
+        yield pd.DataFrame({'brand': ['CU'], 'name': ['콜라'], 'price': [1500], 'event': ['1+1'],
+                            'img_url': ['https://img/1.jpg']})
+        raise ConnectionError("네트워크 오류")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'GS25_260301.csv')
+        pd.DataFrame({'brand': ['GS25'], 'name': ['사이다'], 'price': [1200], 'event': ['2+1'],
+                      'img_url': ['https://img/2.jpg']}).to_csv(path, index=False, encoding='utf-8-sig')
+        sources = [StreamSource('CU', RUN_TIME.date(), broken(), None)] + replay_sources([path])
+        df = run_stream_pipeline(RUN_TIME, sources=sources, output_dir=tmp,
+                                 registry_path=os.path.join(tmp, 'registry.csv'), use_cache=False, workers=1)
+        # 중간에 실패한 브랜드는 일부만 반영하지 않음
+        assert df['brand'].tolist() == ['GS25']
+        assert not os.path.exists(os.path.join(tmp, 'cleaned_data.csv'))
+
+
+def test_processing_error_is_not_replaced_by_fallback():
+    def chunks():
+        yield pd.DataFrame({'brand': ['CU'], 'name': ['콜라'], 'price': [1500], 'event': ['1+1'],
+                            'img_url': ['https://img/1.jpg']})
+
+    calls = []
+
+    def broken_classifier(names):
+        # 첫 호출만 실패 (대체 스냅샷을 다시 분류하면 성공하므로, 대체로 가려지면 예외가 나지 않음)
+        calls.append(len(names))
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return pd.Series('기타', index=names.index)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fallback = os.path.join(tmp, 'CU_260201.csv')
+        pd.DataFrame({'brand': ['CU'], 'name': ['사이다'], 'price': [1200], 'event': ['2+1'],
+                      'img_url': ['https://img/2.jpg']}).to_csv(fallback, index=False, encoding='utf-8-sig')
+        source = StreamSource('CU', RUN_TIME.date(), chunks(), (date(2026, 2, 1), fallback))
+        original = stream_pipeline.classify_names
+        stream_pipeline.classify_names = broken_classifier
+        try:
+            # 후처리 오류는 지난달 원본으로 대체하지 않고 그대로 실패
+            try:
+                process_source(source, os.path.join(tmp, 'quarantine.csv'), raw_dir=tmp, use_cache=False)
+            except RuntimeError as e:
+                assert 'database is locked' in str(e)
+            else:
+                raise AssertionError("처리 오류가 대체 스냅샷으로 가려짐")
+        finally:
+            stream_pipeline.classify_names = original
+        assert not os.path.exists(os.path.join(tmp, 'CU_260301.csv.tmp'))
+
+
+def test_fallback_does_not_duplicate_quarantine():
+    rows = pd.DataFrame({'brand': ['CU', 'CU'], 'name': ['콜라', '사이다'], 'price': [1500, 10],
+                         'event': ['1+1', '2+1'], 'img_url': ['https://img/1.jpg', 'https://img/2.jpg']})
+
+    def broken():
+        # 가격이 잘못된 행을 격리한 뒤 수집 실패
+        yield rows
+        raise ConnectionError("timeout")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fallback = os.path.join(tmp, 'CU_260201.csv')
+        rows.to_csv(fallback, index=False, encoding='utf-8-sig')
+        quarantine = os.path.join(tmp, 'quarantine.csv')
+        source = StreamSource('CU', RUN_TIME.date(), broken(), (date(2026, 2, 1), fallback))
+        frames, snapshot_date = process_source(source, quarantine, use_cache=False)
+        assert snapshot_date == date(2026, 2, 1)
+        assert pd.concat(frames)['name'].tolist() == ['콜라']
+        # 대체 스냅샷의 격리 행만 남음
+        assert pd.read_csv(quarantine, encoding='utf-8-sig')['name'].tolist() == ['사이다']
+
+
+if __name__ == "__main__":
+    test_stream_matches_file_pipeline()
+    test_partitions_match_file_pipeline()
+    test_record_chunks_dedup_and_checkpoint()
+    test_failed_brand_is_skipped()
+    test_processing_error_is_not_replaced_by_fallback()
+    test_fallback_does_not_duplicate_quarantine()
+    print("스트리밍 배치 파이프라인 테스트 통과")
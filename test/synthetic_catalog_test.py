@@ -0,0 +1,78 @@
+"""
+합성 상품 카탈로그 생성기 테스트
+같은 seed면 같은 데이터가 나오는지, 합성 원본이 스키마 검증을 통과하고 배치 파티션 단계와 같은 데이터셋이 되는지,
+월별 스냅샷이 data/ 와 같은 배치로 저장되는지 확인합니다.
+"""
+import sys, os, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import numpy as np
+import pandas as pd
+from batch.stream_pipeline import RAW_COLUMNS, merge_partitions, prepare_partition
+from benchmark.synthetic_catalog import (CatalogStats, categorize_snapshot, generate_months, snapshot_dates,
+                                         write_raw_snapshots)
+from utils.data_cleaner_batch import clean_frame
+from utils.data_validation import validate_frame
+from utils.snapshot_catalog import SnapshotCatalog
+
+STATS = CatalogStats.from_data()
+DATA_PATH = os.path.join(PROJECT_ROOT, 'data', 'categorized_data.csv')
+
+
+def test_seeded_and_sized():
+    a = STATS.sample(3000, np.random.default_rng(7))
+    b = STATS.sample(3000, np.random.default_rng(7))
+    pd.testing.assert_frame_equal(a, b)
+    assert not a.equals(STATS.sample(3000, np.random.default_rng(8)))
+
+    assert len(a) == 3000 and a.columns.tolist() == RAW_COLUMNS
+    assert not a.duplicated(['brand', 'name', 'event']).any()
+    # 원본 행사 표기를 그대로 흉내 내므로 정제 후 스키마 검증을 모두 통과
+    valid, quarantined = validate_frame(clean_frame(a))
+    assert quarantined.empty and len(valid) == 3000
+    assert set(a['brand']) == set(pd.read_csv(DATA_PATH, encoding='utf-8-sig')['brand'])
+
+
+def test_months_carry_over():
+    snapshots = generate_months(2000, months=3, seed=1, stats=STATS)
+    dates = list(snapshots)
+    assert dates == snapshot_dates(3) and all(len(df) == 2000 for df in snapshots.values())
+    keys = [set(zip(df['brand'], df['name'], df['event'])) for df in snapshots.values()]
+    # 이전 달 상품의 일부는 다음 달에도 이어짐
+    assert 0.5 < len(keys[0] & keys[1]) / len(keys[0]) < 0.9
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_raw_snapshots(snapshots, tmp)
+        catalog = SnapshotCatalog(tmp, os.path.join(tmp, 'history', 'raw'))
+        assert sorted(catalog.latest_paths()) == sorted(paths)
+        assert all(len(catalog.snapshots[brand]) == 3 for brand in snapshots[dates[-1]]['brand'].unique())
+
+
+def test_categorized_matches_partition_pipeline():
+    snapshots = generate_months(1500, seed=3, stats=STATS)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_raw_snapshots(snapshots, tmp)
+        parts = [p + '.part' for p in paths]
+        for raw, part in zip(paths, parts):
+            prepare_partition(raw, part, part + '.quarantine', use_cache=False)
+        merged = merge_partitions(parts, os.path.join(tmp, 'merged.csv'), workers=1)
+
+        df = categorize_snapshot(snapshots[max(snapshots)], workers=1)
+        path = os.path.join(tmp, 'categorized_data.csv')
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+        result = pd.read_csv(path, encoding='utf-8-sig')
+
+        # 공개 데이터셋과 같은 컬럼, 파일 기반 배치의 파티션 단계와 같은 내용
+        assert result.columns.tolist() == pd.read_csv(DATA_PATH, encoding='utf-8-sig', nrows=0).columns.tolist()
+        pd.testing.assert_frame_equal(result.drop(columns='product_id'),
+                                      pd.read_csv(os.path.join(tmp, 'merged.csv'), encoding='utf-8-sig'))
+        assert len(merged) == len(result) and result['product_id'].is_unique
+
+
+if __name__ == "__main__":
+    test_seeded_and_sized()
+    test_months_carry_over()
+    test_categorized_matches_partition_pipeline()
+    print("합성 상품 카탈로그 생성기 테스트 통과")
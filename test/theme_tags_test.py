@@ -0,0 +1,76 @@
+"""
+테마 태그 비트셋 테스트
+비트셋 판정이 기존 페이지의 포함/제외 키워드 검색과 같은 상품을 고르는지, 공개 데이터셋의 theme_bits가 최신인지 확인합니다.
+"""
+import sys, os, json, tempfile
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import pandas as pd
+from utils.theme_tags import THEME_TAGS_PATH, current_themes, load_themes, page_themes, theme_bitsets, theme_mask
+
+DATA_PATH = os.path.join(PROJECT_ROOT, 'data', 'categorized_data.csv')
+
+
+def test_bitsets_match_keyword_search():
+    df = pd.read_csv(DATA_PATH, encoding='utf-8-sig')
+    with open(THEME_TAGS_PATH, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    for theme in spec['themes']:
+        expected = (df['name'].str.contains("|".join(theme['include']), case=False, na=False) &
+                    ~df['name'].str.contains("|".join(theme['exclude']), case=False, na=False))
+        assert theme_mask(df, 1 << theme['bit']).tolist() == expected.tolist(), theme['label']
+
+
+def test_page_themes():
+    assert list(page_themes('diet')) == ["🥤 제로 & 저당", "🍗 고단백 식단"]
+    assert len(page_themes('night_snack')) == 3
+    names = pd.Series(['제로콜라', '닭가슴살제로', '라이트비어제로', '샴푸'])
+    diet = page_themes('diet')
+    bits = theme_bitsets(names)
+    assert bits.tolist() == [diet["🥤 제로 & 저당"], diet["🥤 제로 & 저당"] | diet["🍗 고단백 식단"], 0, 0]
+
+
+def test_duplicate_bit_rejected():
+    spec = {'themes': [{'bit': 1, 'label': 'a', 'include': ['x']}, {'bit': 1, 'label': 'b', 'include': ['y']}]}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'theme_tags.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(spec, f)
+        try:
+            load_themes(path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("bit가 겹치면 ValueError여야 합니다.")
+
+
+def test_themes_reloaded_when_file_changes():
+    spec = {'themes': [{'bit': 0, 'page': 'diet', 'label': 'a', 'include': ['x']}]}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'theme_tags.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(spec, f)
+        first = current_themes(path)
+        assert current_themes(path) is first
+
+        spec['themes'].append({'bit': 1, 'page': 'diet', 'label': 'b', 'include': ['y']})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(spec, f)
+        os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000))
+        assert list(page_themes('diet', path)) == ['a', 'b']
+
+
+def test_published_dataset_is_current():
+    df = pd.read_csv(DATA_PATH, encoding='utf-8-sig')
+    assert df['theme_bits'].tolist() == theme_bitsets(df['name']).tolist(), "theme_bits가 테마 정의와 다릅니다. (python utils/theme_tags.py)"
+
+
+if __name__ == "__main__":
+    test_bitsets_match_keyword_search()
+    test_page_themes()
+    test_duplicate_bit_rejected()
+    test_themes_reloaded_when_file_changes()
+    test_published_dataset_is_current()
+    print("테마 태그 비트셋 테스트 통과")
@@ -1,15 +1,12 @@
 """
 공통 장바구니 유틸리티 모듈
 모든 페이지에서 import하여 사용합니다.
+장바구니는 배치에서 부여한 정수 product_id를 키로 사용합니다.
 """
 import streamlit as st
 
-# 행사 유형별 최적 묶음 단위
-EVENT_UNITS = {
-    '1+1': 2,
-    '2+1': 3,
-    '3+1': 4,
-}
+# 행사 유형별 최적 묶음 단위 (행사 정규화 모듈과 같은 정의 사용)
+from utils.event_taxonomy import bundle_of
 
 
 def init_cart():
@@ -18,10 +15,10 @@ def init_cart():
         st.session_state.cart = {}
 
 
-def add_to_cart(name: str, brand: str, event: str, price: int, unit_price: int):
+def add_to_cart(product_id: int, name: str, brand: str, event: str, price: int, unit_price: int):
     """장바구니에 상품 추가 (이미 있으면 수량 +1)"""
     init_cart()
-    key = (name, brand, event)
+    key = int(product_id)
     if key in st.session_state.cart:
         st.session_state.cart[key]['qty'] += 1
     else:
@@ -42,10 +39,10 @@ def remove_from_cart(key):
         del st.session_state.cart[key]
 
 
-def is_in_cart(name: str, brand: str, event: str) -> bool:
+def is_in_cart(product_id: int) -> bool:
     """상품이 장바구니에 있는지 확인"""
     init_cart()
-    return (name, brand, event) in st.session_state.cart
+    return int(product_id) in st.session_state.cart
 
 
 def get_cart_count() -> int:
@@ -56,35 +53,31 @@ def get_cart_count() -> int:
 
 def calc_actual_total(price: int, event: str, qty: int) -> int:
     """행사 적용 실제 결제금액 계산"""
-    unit = EVENT_UNITS.get(event, 1)
-    if unit == 1:
+    pay_needed, _ = bundle_of(event)
+    if pay_needed == 0:
         return price * qty
-    pay_needed = unit - 1
     sets = qty // pay_needed
     remainder = qty % pay_needed
     return price * (sets * pay_needed + remainder)
 
 
 def calc_total_received(event: str, qty: int) -> int:
-    """증정 포함 실제 받는 총 개수"""
-    if event == '1+1':
-        return qty * 2
-    if event == '2+1':
-        return qty + qty // 2
-    if event == '3+1':
-        return qty + qty // 3
-    return qty
+    """증정 포함 실제 받는 총 개수 (N+M 행사: N개마다 M개 증정)"""
+    buy_n, get_m = bundle_of(event)
+    if buy_n == 0:
+        return qty
+    return qty + (qty // buy_n) * get_m
 
 
 def render_cart_warning(item: dict):
     """행사 최적 수량 경고 배너 렌더링"""
     event = item['event']
-    unit = EVENT_UNITS.get(event, 1)
-    if unit == 1:
+    pay_needed, get_m = bundle_of(event)
+    if pay_needed == 0:
         return
 
     qty = item['qty']
-    pay_needed = unit - 1
+    unit = pay_needed + get_m
     if qty % pay_needed == 0:
         return
 
@@ -118,12 +111,11 @@ def render_cart_warning(item: dict):
 def render_cart_button(row, button_key: str):
     """
     상품 카드 하단에 장바구니 담기/취소 버튼을 렌더링합니다.
-    row: pandas Series (name, brand, event, price, unit_price 필드 필요)
+    row: pandas Series (product_id, name, brand, event, price, unit_price 필드 필요)
     button_key: 고유한 버튼 키 문자열
     """
-    import pandas as pd
     init_cart()
-    cart_key = (row['name'], row['brand'], row['event'])
+    cart_key = int(row['product_id'])
     in_cart = cart_key in st.session_state.cart
 
     if in_cart:
@@ -133,6 +125,7 @@ def render_cart_button(row, button_key: str):
     else:
         if st.button("🛒 담기", key=button_key, use_container_width=True):
             add_to_cart(
+                product_id=cart_key,
                 name=row['name'],
                 brand=row['brand'],
                 event=row['event'],
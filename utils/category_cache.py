@@ -0,0 +1,121 @@
+"""
+상품명 → 카테고리 분류 결과 영구 캐시 (SQLite)
+
+매달 수집되는 상품명은 대부분 지난달과 같으므로, 한 번 분류한 결과를 저장해 두고
+처음 보는 상품명만 분류기에 넘깁니다. 캐시는 분류 규칙 해시로 태깅되며,
+규칙이 바뀌면 결과가 바뀔 수 있는 상품명(바뀐 키워드를 포함한 상품명)만 비우고,
+판단할 수 없으면 저장된 결과를 모두 비우고 다시 분류합니다.
+"""
+import os
+import sqlite3
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+CACHE_DIR = os.path.join('data', 'cache')
+CACHE_PATH = os.path.join(CACHE_DIR, 'category_cache.sqlite')
+
+# SQLite 바인딩 변수 개수 제한(기본 999)보다 작게 나눠서 조회
+_LOOKUP_CHUNK = 900
+
+
+class CategoryCache:
+    """규칙 해시로 태깅된 상품명 → 카테고리 캐시"""
+
+    def __init__(self, rules_hash: str, path: str = CACHE_PATH, rules_spec: str = None, stale_pattern=None):
+        """
+        Args:
+            rules_hash: 현재 분류 규칙 해시
+            rules_spec: 현재 규칙 내용 (다음 규칙 변경 때 비교용으로 저장)
+            stale_pattern: 이전 rules_spec을 받아 결과가 바뀔 수 있는 상품명 정규식을 돌려주는 함수.
+                           None을 돌려주면 캐시 전체를 비웁니다.
+        """
+        self.path = path
+        self.rules_hash = rules_hash
+        self.rules_spec = rules_spec
+        self.stale_pattern = stale_pattern
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS categories (name TEXT PRIMARY KEY, category TEXT NOT NULL)")
+        self._check_rules()
+
+    def _meta(self, key: str):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _check_rules(self):
+        """저장된 규칙 해시가 현재 규칙과 다르면 영향받는 상품명(또는 캐시 전체)을 무효화"""
+        stored = self._meta('rules_hash')
+        if stored == self.rules_hash:
+            return
+
+        old_spec = self._meta('rules_spec')
+        pattern = self.stale_pattern(old_spec) if stored and old_spec and self.stale_pattern else None
+        with self.conn:
+            if pattern is not None:
+                names = [name for (name,) in self.conn.execute("SELECT name FROM categories") if pattern.search(name)]
+                self.conn.executemany("DELETE FROM categories WHERE name = ?", ((name,) for name in names))
+                logger.info(f"분류 규칙이 변경되어 영향받는 상품명 {len(names)}개만 캐시에서 제거합니다.")
+            else:
+                if stored:
+                    logger.info("분류 규칙이 변경되어 카테고리 캐시를 초기화합니다.")
+                self.conn.execute("DELETE FROM categories")
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('rules_hash', ?)", (self.rules_hash,))
+            if self.rules_spec is not None:
+                self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('rules_spec', ?)",
+                                  (self.rules_spec,))
+            else:
+                self.conn.execute("DELETE FROM meta WHERE key = 'rules_spec'")
+
+    def lookup(self, names) -> dict:
+        """캐시에 있는 상품명의 분류 결과만 dict로 반환"""
+        found = {}
+        names = list(names)
+        for i in range(0, len(names), _LOOKUP_CHUNK):
+            chunk = names[i:i + _LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT name, category FROM categories WHERE name IN ({placeholders})", chunk
+            )
+            found.update(rows)
+        return found
+
+    def store(self, mapping: dict):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO categories (name, category) VALUES (?, ?)", mapping.items()
+            )
+
+    def classify(self, names: pd.Series, classifier) -> pd.Series:
+        """
+        캐시를 거쳐 상품명 컬럼을 분류합니다.
+
+        Args:
+            names: 상품명 시리즈
+            classifier: 캐시에 없는 상품명 시리즈를 받아 분류 결과 시리즈를 돌려주는 함수
+        """
+        codes, uniques = pd.factorize(names, use_na_sentinel=False)
+        unique_names = [str(name) for name in uniques]
+
+        mapping = self.lookup(unique_names)
+        misses = [name for name in unique_names if name not in mapping]
+        if misses:
+            new_labels = classifier(pd.Series(misses, dtype=object))
+            new_mapping = dict(zip(misses, new_labels.tolist()))
+            self.store(new_mapping)
+            mapping.update(new_mapping)
+
+        logger.info(f"카테고리 캐시: 고유 상품명 {len(unique_names)}개 중 {len(unique_names) - len(misses)}개 재사용, {len(misses)}개 신규 분류")
+        labels = np.array([mapping[name] for name in unique_names], dtype=object)
+        return pd.Series(labels[codes], index=names.index, name='category')
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,24 +1,14 @@
 import streamlit as st
-import pandas as pd
 import os
 from groq import Groq
 from dotenv import load_dotenv
-import time
+from utils.dataset_service import products
 
 load_dotenv()
 api_key = os.getenv("GROQ_API_KEY")
 client = Groq(api_key=api_key) if api_key else None
 
 
-# CSV 데이터 로드
-@st.cache_data
-def load_chatbot_data():
-    path = os.path.join("data", "categorized_data.csv")
-    if os.path.exists(path):
-        return pd.read_csv(path)
-    return pd.DataFrame()
-
-
 def show_chatbot():
     if 'messages' not in st.session_state:
         st.session_state.messages = [
@@ -96,7 +86,7 @@ def show_chatbot():
                         placeholder = st.empty()
                         placeholder.markdown("…")
 
-                        df = load_chatbot_data()
+                        df = products()  # 페이지들과 같은 공용 데이터셋
                         context = ""
 
                         if not df.empty:
@@ -1,111 +1,189 @@
+import argparse
+import numpy as np
 import pandas as pd
 from loguru import logger
 import os
+import re
+import sys
+import hashlib
+import json
+import time
+from functools import partial
+
+# 단독 실행(python utils/data_categorize.py) 시에도 utils 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.category_cache import CategoryCache
+from utils.parallel import map_partitions
+
+# 분류 규칙 파일 (우선순위 순서대로 검사, 먼저 걸린 분류가 최종 결과)
+RULES_PATH = os.path.join(PROJECT_ROOT, 'utils', 'rules', 'category_rules.json')
+
+# 규칙 변경 시 바뀐 키워드가 하나도 없을 때 쓰는, 어떤 상품명과도 맞지 않는 정규식
+_MATCH_NOTHING = re.compile(r'(?!)')
+
+
+def _rule_keywords(rule: dict) -> list:
+    """규칙 하나의 키워드 목록 ('keywords' 목록 또는 설명별 'groups' 묶음)"""
+    if 'groups' in rule:
+        groups = rule['groups']
+        if not isinstance(groups, dict):
+            raise ValueError(f"{rule.get('category')}: groups는 {{설명: [키워드, ...]}} 형식이어야 합니다.")
+        return [word for words in groups.values() for word in words]
+    return rule.get('keywords', [])
+
+
+def validate_rules(spec: dict):
+    """
+    규칙 파일 내용을 검사하고 (버전, 기본 분류, [(분류명, 키워드 목록), ...])을 반환합니다.
+    형식 오류는 ValueError, 중복 키워드와 앞선 분류에 가려져 절대 걸리지 않는 키워드는 경고 후 제거합니다.
+    """
+    if not isinstance(spec, dict) or not isinstance(spec.get('rules'), list) or not spec['rules']:
+        raise ValueError("규칙 파일에 비어 있지 않은 rules 목록이 필요합니다.")
+    default = spec.get('default')
+    if not isinstance(default, str) or not default.strip():
+        raise ValueError("규칙 파일의 default 분류가 비어 있습니다.")
+
+    rules, earlier = [], []
+    for rule in spec['rules']:
+        category = rule.get('category') if isinstance(rule, dict) else None
+        if not isinstance(category, str) or not category.strip():
+            raise ValueError(f"분류명이 없는 규칙이 있습니다: {rule}")
+        if category in (c for c, _ in rules):
+            raise ValueError(f"분류 '{category}'가 두 번 정의되어 있습니다.")
+
+        keywords = []
+        for word in _rule_keywords(rule):
+            if not isinstance(word, str) or not word.strip():
+                raise ValueError(f"{category}: 빈 키워드 또는 문자열이 아닌 키워드 {word!r}")
+            keywords.append(word.strip())
+        if not keywords:
+            raise ValueError(f"{category}: 키워드가 없습니다.")
+
+        unique = list(dict.fromkeys(keywords))
+        if len(unique) < len(keywords):
+            logger.warning(f"분류 규칙 '{category}': 중복 키워드 {len(keywords) - len(unique)}개 제거")
+
+        # 앞선 분류의 키워드를 포함하는 키워드는 항상 앞선 분류로 결정되므로 의미가 없음
+        shadowed = [w for w in unique if any(e in w for e in earlier)]
+        if shadowed:
+            logger.warning(f"분류 규칙 '{category}': 앞선 분류에 가려지는 키워드 제거 {shadowed}")
+            unique = [w for w in unique if w not in shadowed]
+
+        rules.append((category, unique))
+        earlier.extend(unique)
+
+    return spec.get('version', 0), default, rules
+
+
+def rules_hash(rules, default) -> str:
+    """분류 규칙 전체(순서 포함)의 해시 - 캐시 무효화 기준"""
+    payload = json.dumps({"rules": rules, "default": default}, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RuleSet:
+    """규칙 파일 하나를 검증·컴파일한 결과 (분류별 키워드를 하나의 정규식 alternation으로)"""
+
+    def __init__(self, spec: dict):
+        self.version, self.default, self.rules = validate_rules(spec)
+        self.compiled = [(category, re.compile("|".join(re.escape(word) for word in keywords)))
+                         for category, keywords in self.rules]
+        self.hash = rules_hash(self.rules, self.default)
+        # 캐시에 함께 저장해 두고 다음 규칙 변경 때 비교하는 정규화된 규칙
+        self.spec = json.dumps({"default": self.default, "rules": self.rules}, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str = RULES_PATH) -> 'RuleSet':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def classify(self, name) -> str:
+        name = str(name)
+        for category, pattern in self.compiled:
+            if pattern.search(name):
+                return category
+        return self.default
+
+    def changed_pattern(self, old_spec: str):
+        """
+        이전 규칙(spec) 대비 분류 결과가 바뀔 수 있는 상품명을 찾는 정규식.
+        분류 순서나 기본값이 바뀌었으면 None (전체 재분류 필요)
+        """
+        old = json.loads(old_spec)
+        if old['default'] != self.default or [c for c, _ in old['rules']] != [c for c, _ in self.rules]:
+            return None
+        changed = set()
+        for (_, old_words), (_, new_words) in zip(old['rules'], self.rules):
+            changed |= set(old_words) ^ set(new_words)
+        if not changed:
+            return _MATCH_NOTHING
+        return re.compile("|".join(re.escape(word) for word in sorted(changed)))
+
+
+# 규칙 파일 경로 → (수정 시각, 컴파일된 규칙). 파일이 바뀌면 다음 호출 때 다시 컴파일
+_loaded = {}
+
+
+def current_rules(path: str = RULES_PATH) -> RuleSet:
+    """
+    컴파일된 현재 규칙. 파일 수정 시각이 바뀌었을 때만 다시 읽고 컴파일합니다.
+    수정된 파일이 잘못되었으면 오류를 기록하고 직전 규칙을 계속 사용합니다.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _loaded.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        rules = RuleSet.load(path)
+    except ValueError as e:
+        if not cached:
+            raise
+        logger.error(f"분류 규칙 파일 오류로 이전 규칙(v{cached[1].version})을 유지합니다: {e}")
+        return cached[1]
+    if cached:
+        logger.info(f"분류 규칙 다시 로드: v{cached[1].version} → v{rules.version}")
+    _loaded[path] = (mtime, rules)
+    return rules
+
 
 def classify_product(name):
-    name = str(name)
- 
-    misc_keywords = [
-        # 기존 키워드
-        '홍삼', '숙취', '컨디션', '여명', '상쾌환', '종근당', '종건', '정관장', '스틱', '비타C구미오렌지7입', '순수한면', '비비안', '순면',
-        '멀티비타', '용기', '세트', '키트', '재료', '소스', '양념', '찌개용', '찌개두부', '녹차1.2L리필', '쌍화',
-        '즉석', '조리', '구이', '녹차녹차돌자반', '김밥김',
-        '증정', '사은품', '포인트',
-
-        # [새로 추가된 영양제 / 건강보조식품]
-        '비타민', '마그네슘', '아르기닌', '에너지샷', '활기력', '앰플', 
-        '유산균', '프로바이오틱스', '밀크씨슬', '마그랩', '콜라겐',
-        
-        # [새로 추가된 숙취해소제]
-        '모닝케어', '깨수깡', '레디큐', '헛개파워'
-    ]
-    if any(word in name for word in misc_keywords):
-        return "기타"
-    if any(word in name for word in misc_keywords):
-        return "기타"
-
-    household = [
-        '샴푸', '린스', '컨디셔너', '엘라스틴', '세제', '제습제', '페브리즈', '순한면', '쏘피',
-        '다우니', '면도기', '면도6날', '면도날', '중형', '대형', '라이너', '폼', '탈취', '테크', '도루코', 
-        '샤프란', '바디피트', '좋은느낌', '디어스킨', '칫솔', '치약', '비누', '순한면','베이킹소다',
-        '샤프란', '바디피트', '좋은느낌', '디어스킨', '칫솔', '치약', '비누', '순한면','베이킹소다',
-        '티슈', '물티슈', '밴드', '가글', '핸드크림', '하기스', '아우라', 'LG', '피죤', '섬유유연제'
-    ]
-    if any(word in name for word in household):
-        return "생활/위생용품"
-
-    snack = [
-        # 1. 과자/스낵류 (위험한 '칩' 대신 구체적 명시)
-        '과자', '스낵', '크래커', '쿠키', '비스킷', '감자칩', '나초', '팝콘', '뻥튀기', '강냉이',
-        '웨하스', '빼빼로', '칸쵸', '홈런볼', '포카칩', '스윙칩', '프링글스', '꼬깔콘', '새우깡', '맛동산',
-        '크라운', '롯데제과', '오리온', '해태', '포테토칩', '꼬북칩', '오징어땅콩', '콘칩', '에이스', '오예스',
-
-        # 2. 젤리/사탕/껌
-        '캔디', '사탕', '젤리', '하리보', '마이구미', '왕꿈틀이', '새콤달콤', '마이쮸', '껌', '자일리톨',
-        '후라보노', '풍선껌', '마쉬멜로우', '짱셔요', '츄파춥스', '목캔디', '젤리빈', '텐텐', '박하사탕', '이클립스',
-
-        # 3. 초콜릿류 ('초코' 단독 사용 시 초코우유가 끌려오므로 구체화)
-        '초콜릿', '초콜렛', '초코바', '초코파이', '가나', '허쉬', '킨더', '페레로로쉐', '킷캣',
-        '엠앤엠즈', '트윅스', '스니커즈', '크런키', '자유시간', '핫브레이크', '브라우니', '투익스', '밸런스밀바말차초코'
-
-        # 4. 아이스크림/디저트 ('아이스', '바', '콘' 단독 사용 금지)
-        '아이스크림', '하겐다즈', '나뚜루', '파인트', '아이스바', '구슬아이스크림', '설레임', '쭈쭈바',
-        '더위사냥', '메로나', '붕어싸만코', '투게더', '베스킨라빈스', '마카롱', '푸딩', '모찌', '다쿠아즈',
-        '케이크', '조각케익', '롤케익', '도넛', '카스텔라', '카스테라', '후룻컵', '츄러스', '까눌레',
-        '요플레', '플레인', '드링킹', '서울우유)흰우유미니컵',
-
-        # 5. 안주/견과/육가공류 ('아몬드' 단독 시 아몬드브리즈 음료가 끌려오므로 주의)
-        '견과', '꿀땅콩', '호두', '믹스넛', '허니버터아몬드', '육포', '오징어', '쥐포', '꾸이맨', '천하장사',
-        '맥스봉', '소시지', '핫바', '소세지', '맛밤', '군밤', '건크랜베리', '건망고', '포차24', '안주',
-        '비엔나', '프랑크', '스트링치즈', '커피땅콩', '열라면맛후랑크',
-
-        # 6. 빵/떡/기타 간식 (식사류인 샌드위치, 햄버거 제외)
-        '단팥빵', '크림빵', '소금빵', '베이글', '호떡', '만쥬', '슈크림', '에너지바', '프로틴바', '단백질바', 
-        '에너지젤', '양갱', '약과', '떡', '츄츄', '차슈'
-    ]
-    if any(word in name for word in snack):
-        return "간식류"
-
-
-    meal = [
-        '밥', '찌개', '육개장', '곰탕', '해장국', '사골', '비비고', '피자', '이모카세',
-        '만두', '오뚜기밥', '선지', '된장찌개', '참치', '김치찌개', '컵밥', 
-        '도시락', '삼각김밥', '김밥', '샌드위치', '햄버거', '죽', '국밥',
-        '면', '라면', '파스타', '안주야', '순대', '족발', '닭발', '볶음밥', '덮밥', '찜닭', '부대찌개' # 식사류 확장
-    ]
-    if any(word in name for word in meal):
-        return "식사류"
-
-    # 음료 (커피, 주스, 탄산, 주류, 유제품 등 모든 액체류)
-    beverage = [
-        '드링크', '탄산', '음료', '워터',
-        '커피', '아메리카노', '라떼', '카푸치노', '마키아또', '에스프레소', '카페', '모카', '콜드브루',
-        '콜라', '사이다', '소다', '에이드', '스프라이트', '맥콜', '환타', '웰치스', '코카', '펩시',
-        '쥬스', '주스', '차', '보리', '타임', '녹차', '홍차', '옥수수수염', '하늘보리', '헛개', '우엉', '쌍화', # 음료 키워드 확장
-        '우유', '두유', '요구르트', '딸기우유', '초코우유', '바나나우유',
-        '비타', '맥주', '소주', '막걸리', '와인', '하이볼', '토닉워터', '아몬드브리즈', '두유' # 음료 키워드 확장
-    ]
-    if any(word in name for word in beverage):
-        return "음료"
-    
-    water_keywords = [
-        '삼다수', '아이시스', '백산수', '평창수',
-        '동원샘물', '지리산수',
-        '에비앙', '볼빅',
-        '제주용암수', '제주수', '광동샘물',
-        '몽베스트', '크리스탈', '생수'
-    ]
-
-    if any(word in name for word in water_keywords):
-        return "생수"
-
-    return "기타" # 위에 해당하지 않는 모든 것은 기타로 분류
-
-def run_categorization():
-    logger.info("새로운 키워드로 카테고리 분류를 시작합니다.")
-    input_path = 'data/cleaned_data.csv'
-    output_path = 'data/categorized_data.csv'
-    
+    """상품명 하나를 분류합니다 (단건 조회용)."""
+    return current_rules().classify(name)
+
+
+def classify_names(names: pd.Series) -> pd.Series:
+    """
+    상품명 컬럼 전체를 한 번에 분류합니다.
+
+    동일한 상품명은 한 번만 검사한 뒤 결과를 전체 행에 다시 펼쳐 줍니다.
+    결과는 classify_product를 행마다 적용한 것과 동일합니다.
+    """
+    rules = current_rules()
+    codes, uniques = pd.factorize(names, use_na_sentinel=False)
+    labels = np.array([rules.classify(name) for name in uniques], dtype=object)
+    return pd.Series(labels[codes], index=names.index, name='category')
+
+
+def classify_names_parallel(names: pd.Series, workers: int = None) -> pd.Series:
+    """classify_names를 상품명 구간별로 프로세스 풀에서 실행합니다 (결과는 직렬 실행과 동일)."""
+    return map_partitions(classify_names, names, workers)
+
+
+def run_categorization(input_path: str = 'data/cleaned_data.csv',
+                       output_path: str = 'data/categorized_data.csv',
+                       use_cache: bool = True, workers: int = None):
+    """
+    정제 데이터를 분류해 output_path에 저장하고 결과 데이터프레임을 반환합니다. 실패 시 None
+    workers: 분류 프로세스 수 (기본: CPU 코어 수, 1이면 직렬)
+
+    수동 실행(CLI)용입니다. 월간 배치는 브랜드별 prepare 단계에서 같은 분류 캐시로 분류합니다.
+    """
+    rules = current_rules()
+    logger.info(f"분류 규칙 v{rules.version}로 카테고리 분류를 시작합니다.")
+
     if not os.path.exists(input_path):
         logger.error(f"'{input_path}' 파일이 없습니다. 정제 코드를 먼저 실행하세요.")
         return
@@ -113,8 +191,14 @@ def run_categorization():
     try:
         df = pd.read_csv(input_path, encoding='utf-8-sig')
         
-        # 카테고리 분류 적용
-        df['category'] = df['name'].apply(classify_product)
+        # 카테고리 분류 적용 (캐시에 없는 상품명만 분류기로 전달,
+        # 규칙이 바뀌었으면 바뀐 키워드가 들어간 상품명만 캐시에서 빠져 다시 분류됨)
+        classifier = partial(classify_names_parallel, workers=workers)
+        if use_cache:
+            with CategoryCache(rules.hash, rules_spec=rules.spec, stale_pattern=rules.changed_pattern) as cache:
+                df['category'] = cache.classify(df['name'], classifier)
+        else:
+            df['category'] = classifier(df['name'])
         
         # 결과 저장
         df.to_csv(output_path, index=False, encoding='utf-8-sig')
@@ -122,9 +206,29 @@ def run_categorization():
         logger.success(f"분류 완료: '{output_path}'에 저장되었습니다.")
         print("\n[ 카테고리별 데이터 분포 ]")
         print(df['category'].value_counts())
+        return df
         
     except Exception as e:
         logger.error(f"분류 작업 중 오류 발생: {e}")
 
+def watch_rules(interval: float = 5.0, **kwargs):
+    """규칙 파일이 바뀔 때마다 증분 재분류합니다 (Ctrl+C로 종료)."""
+    applied = None
+    while True:
+        rules = current_rules()
+        if rules.hash != applied:
+            run_categorization(**kwargs)
+            applied = rules.hash
+        time.sleep(interval)
+
+
 if __name__ == "__main__":
-    run_categorization()
+    parser = argparse.ArgumentParser(description="상품명 기반 카테고리 분류")
+    parser.add_argument('--watch', type=float, metavar='SECONDS', help="규칙 파일 변경을 감시하며 재분류")
+    parser.add_argument('--workers', type=int, help="분류 프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args()
+
+    if args.watch:
+        watch_rules(args.watch, workers=args.workers)
+    else:
+        run_categorization(workers=args.workers)
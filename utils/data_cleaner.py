@@ -2,8 +2,22 @@ import pandas as pd
 import glob
 from loguru import logger
 import os
+import sys
 
-def clean_and_merge():
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.data_cleaner_batch import clean_frame, read_raw_csv
+from utils.data_validation import QuarantineWriter, quarantine_path_for
+from utils.event_taxonomy import normalize_events
+from utils.stream_cleaner import DEFAULT_CHUNK_ROWS, stream_clean_files
+
+def clean_and_merge(chunked=False, chunk_rows=DEFAULT_CHUNK_ROWS, memory_limit_mb=256):
+    """
+    data/ 의 모든 원본 CSV를 정제·통합합니다.
+    chunked=True이면 파일 전체를 메모리에 올리지 않고 청크 단위로 스트리밍 정제합니다.
+    """
     logger.info("데이터 정제를 시작합니다.")
     
     # data/ 폴더 안의 모든 csv 파일 찾기
@@ -19,11 +33,22 @@ def clean_and_merge():
 
     logger.info(f"정제 대상 파일: {all_files}")
 
+    output_path = "data/cleaned_data.csv"
+    quarantine = QuarantineWriter(quarantine_path_for(output_path))
+
+    if chunked:
+        rows = stream_clean_files(all_files, output_path, lambda chunk: quarantine.filter(clean_frame(chunk)),
+                                  read_raw_csv, chunk_rows=chunk_rows, memory_limit_mb=memory_limit_mb,
+                                  spill_dir=os.path.join("data", "cache"))
+        quarantine.report()
+        logger.success(f"정제 및 통합 완료(스트리밍): 총 {rows}개의 데이터가 '{output_path}'에 저장되었습니다.")
+        return
+
     df_list = []
     
     for file in all_files:
         try:
-            df = pd.read_csv(file, encoding='utf-8-sig')
+            df = read_raw_csv(file)
             
             # 가격 데이터에서 숫자만 추출
             df['price'] = df['price'].astype(str).str.replace(r'[^0-9]', '', regex=True)
@@ -41,14 +66,16 @@ def clean_and_merge():
 
     combined_df = pd.concat(df_list, ignore_index=True)
     
-    # 필수 컬럼 결측치 제거 및 중복 제거
-    final_df = combined_df.dropna(subset=['brand', 'name', 'event']).drop_duplicates()
+    # 필수 컬럼 결측치 제거, 행사 표기 정규화 후 중복 제거
+    final_df = combined_df.dropna(subset=['brand', 'name', 'event'])
+    final_df = normalize_events(final_df).drop_duplicates()
     
-    # 노이즈 데이터 제거
+    # 노이즈 데이터 제거 후 스키마 검증 (실패 행은 data/quarantine.csv로 격리)
     final_df = final_df[~final_df['name'].str.contains('디폴트 이미지', na=False)]
+    final_df = quarantine.filter(final_df)
+    quarantine.report()
 
     # 정제된 데이터 저장
-    output_path = "data/cleaned_data.csv"
     final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
     logger.success(f"정제 및 통합 완료: 총 {len(final_df)}개의 데이터가 '{output_path}'에 저장되었습니다.")
 
@@ -1,12 +1,163 @@
+import argparse
 import pandas as pd
-import glob
 from loguru import logger
 import os
+import sys
+import json
+import hashlib
+import inspect
 from datetime import datetime
 import pytz
 
+# 단독 실행 시에도 utils 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-def clean_and_merge_batch():
+import utils.data_validation as data_validation
+import utils.event_taxonomy as event_taxonomy
+from utils.data_validation import QuarantineWriter, quarantine_path_for
+from utils.event_taxonomy import normalize_events
+from utils.snapshot_catalog import BRANDS, SnapshotCatalog
+from utils.stream_cleaner import DEFAULT_CHUNK_ROWS, stream_clean_files
+
+# 증분 정제용 캐시 경로 (원본 파일 매니페스트 + 파일별 정제 결과)
+CACHE_DIR = os.path.join("data", "cache")
+MANIFEST_PATH = os.path.join(CACHE_DIR, "clean_manifest.json")
+PARTITION_DIR = os.path.join(CACHE_DIR, "partitions")
+
+# 여러 달치 히스토리 백필 결과 (라이브 데이터셋과 분리)
+BACKFILL_OUTPUT_PATH = os.path.join("data", "history", "backfill_cleaned.csv")
+
+# 매니페스트·파티션 형식이 바뀌면 올려서 기존 캐시를 무효화
+# (2: 파티션에 행사 정규화 컬럼 event_type/buy_n/get_m 추가, 3: 파티션을 원본 상대 경로로 저장)
+MANIFEST_VERSION = 3
+
+
+def read_raw_csv(path: str, **kwargs):
+    """
+    브랜드 원본 CSV를 읽습니다. (chunksize/iterator 등 read_csv 인자 그대로 전달)
+    파일 앞에 빈 줄이 있으면 BOM이 헤더에 남으므로 컬럼명에서 제거합니다.
+    """
+    header = pd.read_csv(path, encoding='utf-8-sig', nrows=0).columns
+    names = [str(col).replace('\ufeff', '') for col in header]
+    return pd.read_csv(path, encoding='utf-8-sig', header=0, names=names, **kwargs)
+
+
+def clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """원본 데이터프레임 하나를 정제합니다 (가격 숫자화, 필수값 결측 제거, 행사 표기 정규화, 노이즈 제거)."""
+    df = df.copy()
+    df['price'] = df['price'].astype(str).str.replace(r'[^0-9]', '', regex=True)
+    df['price'] = pd.to_numeric(df['price'], errors='coerce').fillna(0).astype(int)
+
+    # 필수 컬럼 결측치 제거, 행사 표기 정규화(event_type/buy_n/get_m) 후 중복 제거
+    df = df.dropna(subset=['brand', 'name', 'event'])
+    df = normalize_events(df).drop_duplicates()
+
+    # 노이즈 데이터 제거
+    return df[~df['name'].str.contains('디폴트 이미지', na=False)]
+
+
+def file_sha256(path: str) -> str:
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def cleaner_fingerprint() -> str:
+    """
+    정제 코드 지문 (이 모듈·event_taxonomy·data_validation 소스 + 매니페스트 형식 버전 해시)
+    정제 함수가 쓰는 상수·보조 함수까지 포함하므로, 정제 로직이 바뀌면 기존 파티션을 재사용하지 않습니다.
+    """
+    sha = hashlib.sha256(str(MANIFEST_VERSION).encode('utf-8'))
+    for module in (sys.modules[__name__], event_taxonomy, data_validation):
+        sha.update(inspect.getsource(module).encode('utf-8'))
+    return sha.hexdigest()
+
+
+def load_manifest() -> dict:
+    if not os.path.exists(MANIFEST_PATH):
+        return {}
+    try:
+        with open(MANIFEST_PATH, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except Exception as e:
+        logger.warning(f"매니페스트를 읽지 못해 전체 재정제합니다: {e}")
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    if manifest.get('cleaner') != cleaner_fingerprint():
+        logger.info("정제 코드가 바뀌어 기존 파티션을 모두 다시 정제합니다.")
+        return {}
+    return manifest.get('files', {})
+
+
+def save_manifest(files: dict):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': MANIFEST_VERSION, 'cleaner': cleaner_fingerprint(), 'files': files}, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def source_key(raw_path: str) -> str:
+    """매니페스트·파티션 키 (작업 디렉토리 기준 상대 경로, 같은 파일명의 히스토리 스냅샷과 구분)"""
+    return os.path.normpath(os.path.relpath(raw_path))
+
+
+def partition_path(raw_path: str) -> str:
+    return os.path.join(PARTITION_DIR, source_key(raw_path))
+
+
+def is_unchanged(raw_path: str, entry: dict) -> bool:
+    """
+    매니페스트 기록과 원본 파일을 비교합니다.
+    크기와 수정시각이 같으면 해시 계산을 생략하고, 다르면 내용 해시로 최종 판단합니다.
+    """
+    if not entry or not os.path.exists(partition_path(raw_path)):
+        return False
+    stat = os.stat(raw_path)
+    if stat.st_size != entry.get('size'):
+        return False
+    if stat.st_mtime == entry.get('mtime'):
+        return True
+    if file_sha256(raw_path) == entry.get('sha256'):
+        # 내용은 그대로이고 수정시각만 바뀐 경우 (복사/체크아웃 등)
+        entry['mtime'] = stat.st_mtime
+        return True
+    return False
+
+
+def refresh_partition(raw_path: str) -> dict:
+    """원본 파일 하나를 정제해 파티션으로 저장하고 매니페스트 항목을 돌려줍니다."""
+    df = clean_frame(read_raw_csv(raw_path))
+    os.makedirs(os.path.dirname(partition_path(raw_path)), exist_ok=True)
+    df.to_csv(partition_path(raw_path), index=False, encoding='utf-8-sig')
+
+    stat = os.stat(raw_path)
+    return {
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'sha256': file_sha256(raw_path),
+        'rows': len(df),
+        'processed_at': datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def clean_and_merge_batch(output_path: str = "data/cleaned_data.csv", chunked: bool = False,
+                          chunk_rows: int = DEFAULT_CHUNK_ROWS, memory_limit_mb: int = 256):
+    """
+    브랜드별 최신 스냅샷을 정제·통합해 output_path에 저장하고 결과 데이터프레임을 반환합니다.
+    실패 시 None을 반환합니다.
+
+    chunked=True이면 파일을 청크 단위로 스트리밍 정제하며(파티션 캐시 미사용),
+    메모리에 결과 전체를 올리지 않으므로 저장된 행 수만 반환합니다.
+
+    수동 실행(CLI)·벤치마크용이며, 월간 배치는 브랜드별 prepare 단계(batch/stream_pipeline.prepare_partition)에서
+    clean_frame을 직접 사용하고 브랜드 단위 재사용은 DAG 단계 지문이 맡습니다.
+    """
     logger.info("데이터 정제를 시작합니다.")
 
     kst = pytz.timezone('Asia/Seoul')
@@ -15,54 +166,104 @@ def clean_and_merge_batch():
     now_kst = datetime.now(kst)
     current_target = now_kst.strftime("%y%m")
 
-    # data/ 폴더 안의 모든 csv 파일 찾기
-    raw_files = glob.glob("data/*.csv")
-
-    brands = ['7Eleven', 'CU', 'emart24', 'GS25']
-    all_files = [
-        f for f in raw_files
-        if any(brand.lower() in f.lower() for brand in brands)
-    ]
+    # 브랜드별 최신 스냅샷만 통합 대상 (이전 달 스냅샷은 히스토리 저장소로 이동)
+    catalog = SnapshotCatalog()
+    catalog.archive_old_snapshots()
+    all_files = catalog.latest_paths()
 
     if not all_files:
         logger.error(f"data/ 폴더 안에 {current_target}(현재 달)에 해당하는 CSV 파일이 없습니다.")
         return
 
+    for brand in BRANDS:
+        latest = catalog.latest(brand)
+        if latest is None:
+            logger.warning(f"{brand}: 수집된 스냅샷이 없습니다.")
+        elif latest[0].strftime("%y%m") != current_target:
+            logger.warning(f"{brand}: 최신 스냅샷({latest[0]})이 현재 달({current_target}) 데이터가 아닙니다.")
+
     logger.info(f"정제 대상 파일 ({current_target} 데이터): {all_files}")
 
+    # 스키마 검증에 실패한 행은 결과 파일 옆 quarantine.csv로 격리
+    quarantine = QuarantineWriter(quarantine_path_for(output_path))
+
+    if chunked:
+        rows = stream_clean_files(all_files, output_path, lambda chunk: quarantine.filter(clean_frame(chunk)),
+                                  read_raw_csv, chunk_rows=chunk_rows, memory_limit_mb=memory_limit_mb,
+                                  spill_dir=CACHE_DIR)
+        quarantine.report()
+        logger.success(f"정제 및 통합 완료(스트리밍): 총 {rows}개의 데이터가 '{output_path}'에 저장되었습니다.")
+        return rows
+
+    manifest = load_manifest()
+    files = {}
     df_list = []
 
     for file in all_files:
+        key = source_key(file)
         try:
-            df = pd.read_csv(file, encoding='utf-8-sig')
-
-            df['price'] = df['price'].astype(str).str.replace(r'[^0-9]', '', regex=True)
-            df['price'] = pd.to_numeric(df['price'], errors='coerce').fillna(0).astype(int)
+            entry = manifest.get(key)
+            if is_unchanged(file, entry):
+                logger.info(f"변경 없음, 캐시 사용: {file}")
+            else:
+                entry = refresh_partition(file)
+                logger.info(f"파일 정제 완료: {file}")
 
-            df_list.append(df)
-            logger.info(f"파일 로드 완료: {file}")
+            df_list.append(pd.read_csv(partition_path(file), encoding='utf-8-sig'))
+            files[key] = entry
 
         except Exception as e:
             logger.error(f"{file} 처리 중 오류 발생: {e}")
 
+    # 더 이상 존재하지 않는 원본 파일의 파티션 정리
+    for stale in set(manifest) - set(files):
+        if os.path.exists(partition_path(stale)):
+            os.remove(partition_path(stale))
+    save_manifest(files)
+
     if not df_list:
         logger.error("로드된 데이터가 없습니다.")
         return
 
-        # 데이터 통합
-    combined_df = pd.concat(df_list, ignore_index=True)
-
-    # 필수 컬럼 결측치 제거 및 중복 제거
-    final_df = combined_df.dropna(subset=['brand', 'name', 'event']).drop_duplicates()
-
-    # 노이즈 데이터 제거
-    final_df = final_df[~final_df['name'].str.contains('디폴트 이미지', na=False)]
+    # 파티션 통합 후 파일 간 중복 제거, 스키마 검증
+    final_df = pd.concat(df_list, ignore_index=True).drop_duplicates()
+    final_df = quarantine.filter(final_df)
+    quarantine.report()
 
     # 정제된 데이터 저장
-    output_path = "data/cleaned_data.csv"
     final_df.to_csv(output_path, index=False, encoding='utf-8-sig')
     logger.success(f"정제 및 통합 완료: 총 {len(final_df)}개의 데이터가 '{output_path}'에 저장되었습니다.")
+    return final_df
+
+
+def backfill_history(output_path: str = BACKFILL_OUTPUT_PATH, chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                     memory_limit_mb: int = 256) -> int:
+    """히스토리 저장소를 포함한 모든 스냅샷을 날짜순으로 스트리밍 정제해 하나의 파일로 만듭니다."""
+    files = [path for _, _, path in SnapshotCatalog().history()]
+    if not files:
+        logger.error("백필할 스냅샷이 없습니다.")
+        return 0
+
+    logger.info(f"히스토리 백필 시작: 스냅샷 {len(files)}개 (메모리 상한 {memory_limit_mb}MB)")
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    quarantine = QuarantineWriter(quarantine_path_for(output_path))
+    rows = stream_clean_files(files, output_path, lambda chunk: quarantine.filter(clean_frame(chunk)),
+                              read_raw_csv, chunk_rows=chunk_rows, memory_limit_mb=memory_limit_mb,
+                              spill_dir=CACHE_DIR)
+    quarantine.report()
+    logger.success(f"히스토리 백필 완료: 총 {rows}개의 데이터가 '{output_path}'에 저장되었습니다.")
+    return rows
 
 
 if __name__ == "__main__":
-    clean_and_merge_batch()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="배치용 데이터 정제")
+    parser.add_argument('--chunked', action='store_true', help="청크 단위 스트리밍 정제")
+    parser.add_argument('--backfill', action='store_true', help="모든 히스토리 스냅샷 백필 (스트리밍)")
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS)
+    parser.add_argument('--memory-limit-mb', type=int, default=256)
+    args = parser.parse_args()
+
+    if args.backfill:
+        backfill_history(chunk_rows=args.chunk_rows, memory_limit_mb=args.memory_limit_mb)
+    else:
+        clean_and_merge_batch(chunked=args.chunked, chunk_rows=args.chunk_rows, memory_limit_mb=args.memory_limit_mb)
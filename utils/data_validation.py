@@ -0,0 +1,140 @@
+"""
+정제 데이터 스키마 검증 및 격리(quarantine)
+
+정제 단계가 끝난 데이터프레임을 선언형 규칙(SCHEMA)으로 한 번에 검사합니다.
+규칙마다 전체 컬럼에 대한 불리언 마스크를 만들고, 하나라도 어긋난 행은 사유와 함께 격리 파일로 보냅니다.
+통과한 데이터는 아래 불변 조건을 보장하므로 화면 코드에서 행 단위 방어 코드가 필요 없습니다.
+
+    brand     BRANDS 중 하나
+    name      비어 있지 않은 문자열
+    price     MIN_PRICE 이상 MAX_PRICE 이하의 정수
+    event     정규화된 행사 (event_type이 N+M / GIFT / SALE)
+    img_url   http(s) URL
+"""
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+from utils.event_taxonomy import EVENT_TYPES
+from utils.snapshot_catalog import BRANDS
+
+MIN_PRICE = 100
+MAX_PRICE = 1_000_000
+URL_PATTERN = r'^https?://[^\s"\'<>]+$'
+
+# (사유, 컬럼, 검사 종류, 인자) — 위에서부터 순서대로 사유에 기록
+SCHEMA = [
+    ('missing_column', None, 'columns', ['brand', 'name', 'price', 'event', 'img_url', 'event_type']),
+    ('unknown_brand', 'brand', 'enum', BRANDS),
+    ('empty_name', 'name', 'non_empty', None),
+    ('invalid_price', 'price', 'range', (MIN_PRICE, MAX_PRICE)),
+    ('unknown_event', 'event_type', 'enum', [t for t in EVENT_TYPES if t != 'OTHER']),
+    ('invalid_img_url', 'img_url', 'pattern', URL_PATTERN),
+]
+
+QUARANTINE_FILENAME = "quarantine.csv"
+
+
+def _check(df: pd.DataFrame, column, kind, arg) -> pd.Series:
+    """규칙 하나에 대해 '위반' 마스크를 반환합니다."""
+    if kind == 'columns':
+        missing = [c for c in arg if c not in df.columns]
+        return pd.Series(bool(missing), index=df.index)
+    if column not in df.columns:
+        return pd.Series(True, index=df.index)
+
+    values = df[column]
+    if kind == 'enum':
+        return ~values.astype(object).isin(arg)
+    if kind == 'non_empty':
+        return values.isna() | (values.astype(str).str.strip() == '')
+    if kind == 'range':
+        numeric = pd.to_numeric(values, errors='coerce')
+        low, high = arg
+        return numeric.isna() | (numeric < low) | (numeric > high) | (numeric != np.floor(numeric))
+    if kind == 'pattern':
+        return ~values.astype(str).str.match(arg, na=False) | values.isna()
+    raise ValueError(f"알 수 없는 검사 종류: {kind}")
+
+
+def validate_frame(df: pd.DataFrame, schema=SCHEMA):
+    """
+    (통과 데이터, 격리 데이터)를 반환합니다.
+    격리 데이터에는 어긋난 규칙 이름을 ';'로 이은 reasons 컬럼이 붙습니다.
+    """
+    failures = pd.DataFrame({reason: _check(df, column, kind, arg) for reason, column, kind, arg in schema},
+                            index=df.index)
+    bad = failures.any(axis=1)
+    if not bad.any():
+        return df, df.iloc[0:0].assign(reasons=pd.Series(dtype=str))
+
+    reasons = failures[bad].dot(failures.columns + ';').str.rstrip(';')
+    return df[~bad], df[bad].assign(reasons=reasons)
+
+
+class QuarantineWriter:
+    """격리 행을 파일 하나에 이어 쓰는 도우미 (청크 단위 스트리밍 정제에서도 사용)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows = 0
+        self._started = False
+
+    def reset(self):
+        """지금까지 기록한 격리 행을 지우고 빈 파일 상태에서 다시 시작합니다."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.rows = 0
+        self._started = True
+
+    def write(self, quarantined: pd.DataFrame):
+        if not self._started:
+            self.reset()
+        if quarantined.empty:
+            return
+        quarantined = quarantined.assign(quarantined_at=datetime.now().isoformat(timespec='seconds'))
+        header = not os.path.exists(self.path)
+        quarantined.to_csv(self.path, mode='a', header=header, index=False,
+                           encoding='utf-8-sig' if header else 'utf-8')
+        self.rows += len(quarantined)
+
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """검증 후 통과 데이터만 반환하고, 격리 행은 파일에 기록합니다."""
+        valid, quarantined = validate_frame(df)
+        self.write(quarantined)
+        return valid
+
+    def report(self):
+        if self.rows:
+            counts = pd.read_csv(self.path, encoding='utf-8-sig')['reasons'].str.split(';').explode().value_counts()
+            logger.warning(f"검증 실패 {self.rows}행 격리 → '{self.path}' (사유별: {counts.to_dict()})")
+        else:
+            logger.info("검증 실패 행 없음")
+
+
+def quarantine_path_for(output_path: str) -> str:
+    """정제 결과 파일과 같은 디렉토리의 격리 파일 경로"""
+    return os.path.join(os.path.dirname(output_path) or ".", QUARANTINE_FILENAME)
+
+
+def merge_quarantine(paths, output_path: str, remove: bool = True) -> QuarantineWriter:
+    """
+    브랜드별로 따로 기록한 격리 파일들을 output_path 하나로 합칩니다 (없는 파일은 건너뜀).
+    remove=True이면 합친 조각 파일을 지웁니다. 합친 결과의 기록기를 반환하므로 바로 report()할 수 있습니다.
+    """
+    merged = QuarantineWriter(output_path)
+    merged.write(pd.DataFrame())  # 이전 실행의 격리 파일 정리
+    parts = [path for path in paths if os.path.exists(path)]
+    frames = [pd.read_csv(path, encoding='utf-8-sig') for path in parts]
+    if frames:
+        df = pd.concat(frames, ignore_index=True)
+        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+        merged.rows = len(df)
+    if remove:
+        for path in parts:
+            os.remove(path)
+    return merged
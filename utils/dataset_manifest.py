@@ -0,0 +1,117 @@
+"""
+데이터셋 매니페스트 (메타데이터 사이드카)
+
+배치가 cleaned_data.csv / categorized_data.csv를 쓸 때 같은 디렉토리에 <이름>.manifest.json을 함께 씁니다.
+행 수, 브랜드·행사·카테고리별 개수, 스키마, 내용 해시, 원본 스냅샷 날짜, 생성 시각을 담고 있어
+사이드바 통계·데이터 기준일 표시·화면 캐시 무효화는 CSV 전체를 읽지 않고 이 파일만 읽습니다.
+
+사용법:
+    python utils/dataset_manifest.py                         # data/ 기본 데이터셋 매니페스트 재생성
+    python utils/dataset_manifest.py data/snapshots/<버전>/categorized_data.csv
+"""
+import json
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+from loguru import logger
+
+# 단독 실행 시에도 utils 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.data_cleaner_batch import file_sha256
+from utils.dataset_store import resolve_data_path
+from utils.snapshot_catalog import BRANDS, SnapshotCatalog
+
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+# 개수를 집계할 컬럼 (데이터셋에 있는 것만)
+COUNT_COLUMNS = ['brand', 'event', 'event_type', 'category']
+
+DEFAULT_DATASETS = [os.path.join("data", "cleaned_data.csv"), os.path.join("data", "categorized_data.csv")]
+
+
+def manifest_path_for(data_path: str) -> str:
+    """data/cleaned_data.csv → data/cleaned_data.manifest.json"""
+    return os.path.splitext(data_path)[0] + MANIFEST_SUFFIX
+
+
+def source_snapshot_dates(catalog: SnapshotCatalog = None) -> dict:
+    """브랜드별 최신 원본 스냅샷 날짜 {브랜드: 'YYYY-MM-DD'}"""
+    catalog = catalog or SnapshotCatalog()
+    return {brand: catalog.latest(brand)[0].isoformat() for brand in BRANDS if catalog.latest(brand)}
+
+
+def build_manifest(df: pd.DataFrame, data_path: str, sources: dict = None) -> dict:
+    """저장된 데이터 파일(data_path)과 그 내용(df)으로 매니페스트를 만듭니다."""
+    return {
+        'manifest_version': MANIFEST_VERSION,
+        'file': os.path.basename(data_path),
+        'rows': int(len(df)),
+        'size': os.path.getsize(data_path),
+        'sha256': file_sha256(data_path),
+        'columns': {col: str(dtype) for col, dtype in df.dtypes.items()},
+        'counts': {col: {str(k): int(v) for k, v in df[col].value_counts().sort_index().items()}
+                   for col in COUNT_COLUMNS if col in df.columns},
+        'source_snapshots': sources or {},
+        'built_at': datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def write_manifest(data_path: str, df: pd.DataFrame = None, sources: dict = None) -> dict:
+    """data_path 옆에 매니페스트를 원자적으로 기록합니다. df를 주지 않으면 파일을 읽어 집계합니다."""
+    if df is None:
+        df = pd.read_csv(data_path, encoding='utf-8-sig')
+    manifest = build_manifest(df, data_path, sources)
+    path = manifest_path_for(data_path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+    logger.info(f"매니페스트 기록: '{path}' ({manifest['rows']}행)")
+    return manifest
+
+
+def read_manifest(data_path: str):
+    """
+    data_path의 매니페스트를 읽습니다. 데이터 파일이 없으면 None.
+    매니페스트가 없거나 파일 크기가 달라(데이터가 바뀜) 믿을 수 없으면 데이터를 한 번 읽어 메모리에서 만듭니다.
+    """
+    if not os.path.exists(data_path):
+        return None
+    path = manifest_path_for(data_path)
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            if manifest.get('size') == os.path.getsize(data_path):
+                return manifest
+        except Exception as e:
+            logger.warning(f"매니페스트를 읽지 못했습니다 ({path}): {e}")
+    logger.warning(f"'{data_path}' 매니페스트가 없거나 오래되어 데이터에서 다시 집계합니다.")
+    return build_manifest(pd.read_csv(data_path, encoding='utf-8-sig'), data_path)
+
+
+def current_manifest(filename: str = 'categorized_data.csv'):
+    """현재 공개된 버전의 데이터셋 매니페스트 (없으면 None)"""
+    return read_manifest(resolve_data_path(filename))
+
+
+def dataset_hash(filename: str = 'categorized_data.csv') -> str:
+    """
+    현재 공개된 데이터셋의 내용 해시. 화면의 캐시 함수 인자로 넘기면
+    배치가 새 데이터를 공개하거나 롤백했을 때 캐시가 자동으로 무효화됩니다.
+    """
+    manifest = current_manifest(filename)
+    return manifest['sha256'] if manifest else ''
+
+
+if __name__ == "__main__":
+    catalog = SnapshotCatalog()
+    for data_path in sys.argv[1:] or DEFAULT_DATASETS:
+        write_manifest(data_path, sources=source_snapshot_dates(catalog))
@@ -0,0 +1,52 @@
+"""
+대시보드 공용 데이터셋 서비스
+
+페이지마다 get_data/load_data/load_game_data로 categorized_data.csv를 다시 읽고 파생 컬럼을 따로 계산하던 것을
+이 모듈 하나로 모았습니다. 공개된 스냅샷(내용 해시)마다 프로세스에서 한 번만 읽어 st.cache_resource에 두고,
+모든 세션·페이지가 같은 ProductDataset 객체를 공유합니다. 배치가 새 버전을 공개하거나 롤백하면
+해시가 바뀌어 다음 요청에서 새로 읽습니다.
+
+    products()          전체 상품 (절약형 테이블 + unit_price/discount_num/discount_rate/pay_count/total_count)
+    unique_products()   (name, event, brand) 중복을 뺀 상품
+    products_by_id()    product_id 인덱스
+
+st.cache_data와 달리 호출마다 피클을 풀어 새 복사본을 만들지 않습니다. 각 함수는 공유 프레임의
+얕은 뷰(shared_view)를 돌려주므로 호출 비용은 컬럼 수에 비례할 뿐이고, 페이지가 받은 프레임에
+컬럼을 붙이거나 값을 바꿔도 copy-on-write로 그 부분만 복사되어 다른 세션에는 보이지 않습니다.
+(copy-on-write가 꺼진 pandas<3에서는 같은 격리를 위해 호출마다 복사본을 돌려줍니다)
+"""
+import pandas as pd
+import streamlit as st
+
+from utils.dataset_manifest import dataset_hash
+from utils.product_table import ProductDataset, shared_view
+
+# 대시보드 프로세스에서 copy-on-write를 켜 둠 (pandas 3부터는 기본값).
+# 꺼져 있으면 shared_view가 호출마다 전체를 복사하므로, pandas 2.x에서도 얕은 뷰를 쓰도록 앱 시작 시 한 번 설정
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# 현재 버전과 직전 버전(공개 직후 아직 이전 해시로 요청 중인 세션)까지만 보관
+MAX_VERSIONS = 2
+
+
+@st.cache_resource(max_entries=MAX_VERSIONS, show_spinner=False)
+def _load_dataset(data_hash: str) -> ProductDataset:
+    return ProductDataset.load()
+
+
+def current_dataset() -> ProductDataset:
+    """현재 공개된 스냅샷의 공유 데이터셋"""
+    return _load_dataset(dataset_hash())
+
+
+def products():
+    return shared_view(current_dataset().products)
+
+
+def unique_products():
+    return shared_view(current_dataset().unique_products)
+
+
+def products_by_id():
+    return shared_view(current_dataset().by_id)
@@ -0,0 +1,168 @@
+"""
+버전별 데이터셋 스냅샷 저장소
+
+배치는 data/snapshots/<버전>/ 디렉토리에 cleaned_data.csv, categorized_data.csv를 새로 만들고,
+모든 파일이 준비된 뒤 data/current.json 포인터를 원자적으로 교체(os.replace)해 공개합니다.
+버전은 실행마다 새로 만들고(실행 시각), 이미 있는 버전 디렉토리에는 다시 쓰지 않습니다.
+대시보드는 데이터를 읽을 때 포인터를 한 번만 확인하므로 배치 도중에도 반쯤 쓰인 파일을 읽지 않으며,
+문제가 생기면 포인터만 이전 버전으로 되돌리면 즉시 롤백됩니다.
+
+사용법:
+    python utils/dataset_store.py --list
+    python utils/dataset_store.py --rollback            # 직전 버전으로
+    python utils/dataset_store.py --rollback 20260301_003000
+"""
+import argparse
+import json
+import os
+import shutil
+from datetime import datetime
+
+from loguru import logger
+
+DATA_DIR = "data"
+SNAPSHOT_ROOT = os.path.join(DATA_DIR, "snapshots")
+POINTER_PATH = os.path.join(DATA_DIR, "current.json")
+
+# 포인터가 가리키는 버전과 직전 버전은 항상 보존하고, 그 외 오래된 버전은 정리
+KEEP_VERSIONS = 6
+
+
+def make_version(run_time: datetime = None) -> str:
+    return (run_time or datetime.now()).strftime("%Y%m%d_%H%M%S")
+
+
+def snapshot_dir(version: str) -> str:
+    return os.path.join(SNAPSHOT_ROOT, version)
+
+
+def new_version(run_time: datetime = None) -> str:
+    """아직 없는 버전명 (같은 초에 이미 있으면 _2, _3 …을 붙임)"""
+    base = make_version(run_time)
+    version, seq = base, 1
+    while os.path.exists(snapshot_dir(version)) or os.path.exists(_staging_dir(version)):
+        seq += 1
+        version = f"{base}_{seq}"
+    return version
+
+
+def _staging_dir(version: str) -> str:
+    # 점으로 시작하는 임시 디렉토리는 버전 목록·정리 대상에서 제외
+    return os.path.join(SNAPSHOT_ROOT, f".{version}.tmp")
+
+
+def new_snapshot_dir(version: str = None) -> str:
+    """
+    새 버전 디렉토리를 만들고 경로를 반환합니다. 공개(publish) 전까지 대시보드에는 보이지 않습니다.
+    이미 있는 버전(공개된 버전 포함)에는 쓰지 않도록 디렉토리가 있으면 FileExistsError
+    """
+    path = snapshot_dir(version or new_version())
+    os.makedirs(path)
+    return path
+
+
+def create_snapshot(files: list, version: str = None) -> str:
+    """
+    준비된 파일들을 새 버전 디렉토리로 복사하고 버전명을 반환합니다.
+    임시 디렉토리에 모두 복사한 뒤 os.replace로 옮기므로 반쯤 채워진 버전 디렉토리는 생기지 않습니다.
+    """
+    version = version or new_version()
+    staging = _staging_dir(version)
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    for path in files:
+        if os.path.exists(path):
+            shutil.copy2(path, os.path.join(staging, os.path.basename(path)))
+    os.replace(staging, snapshot_dir(version))
+    return version
+
+
+def read_pointer() -> dict:
+    if not os.path.exists(POINTER_PATH):
+        return {}
+    try:
+        with open(POINTER_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.error(f"데이터 포인터를 읽지 못했습니다: {e}")
+        return {}
+
+
+def _write_pointer(pointer: dict):
+    tmp_path = POINTER_PATH + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(pointer, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, POINTER_PATH)
+
+
+def current_version():
+    return read_pointer().get('version')
+
+
+def list_versions() -> list:
+    if not os.path.isdir(SNAPSHOT_ROOT):
+        return []
+    return sorted(v for v in os.listdir(SNAPSHOT_ROOT) if not v.startswith('.') and os.path.isdir(snapshot_dir(v)))
+
+
+def publish_snapshot(version: str):
+    """current 포인터를 지정한 버전으로 원자적으로 교체합니다."""
+    if not os.path.isdir(snapshot_dir(version)):
+        raise FileNotFoundError(f"스냅샷 버전이 없습니다: {version}")
+
+    previous = current_version()
+    _write_pointer({
+        'version': version,
+        'previous': previous if previous != version else read_pointer().get('previous'),
+        'published_at': datetime.now().isoformat(timespec='seconds'),
+    })
+    logger.success(f"데이터셋 버전 공개: {previous} → {version}")
+    prune_snapshots()
+
+
+def rollback(version: str = None) -> str:
+    """포인터를 지정한 버전(기본: 직전 버전)으로 되돌립니다."""
+    target = version or read_pointer().get('previous')
+    if not target:
+        raise ValueError("되돌릴 이전 버전이 없습니다.")
+    publish_snapshot(target)
+    return target
+
+
+def prune_snapshots(keep: int = KEEP_VERSIONS):
+    pointer = read_pointer()
+    protected = {pointer.get('version'), pointer.get('previous')}
+    versions = list_versions()
+    for version in versions[:-keep] if keep else versions:
+        if version not in protected:
+            shutil.rmtree(snapshot_dir(version), ignore_errors=True)
+            logger.info(f"오래된 스냅샷 정리: {version}")
+
+
+def resolve_data_path(filename: str) -> str:
+    """
+    현재 공개된 버전의 데이터 파일 경로를 반환합니다.
+    포인터가 없거나 해당 파일이 없으면 data/ 바로 아래의 기본 데이터를 사용합니다.
+    """
+    version = current_version()
+    if version:
+        path = os.path.join(snapshot_dir(version), filename)
+        if os.path.exists(path):
+            return path
+    return os.path.join(DATA_DIR, filename)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="데이터셋 스냅샷 버전 관리")
+    parser.add_argument('--list', action='store_true', help="보관 중인 버전 목록")
+    parser.add_argument('--rollback', nargs='?', const='', metavar='VERSION', help="지정 버전(기본: 직전 버전)으로 되돌리기")
+    args = parser.parse_args()
+
+    if args.rollback is not None:
+        rollback(args.rollback or None)
+    else:
+        current = current_version()
+        for v in list_versions():
+            print(f"{'*' if v == current else ' '} {v}")
@@ -0,0 +1,118 @@
+"""
+행사(event) 표기 정규화 모듈
+
+브랜드마다 행사 표기가 다릅니다 ('1+1', '1 + 1', '세일', GS25 API 코드 ONE_TO_ONE/GIFT 등).
+배치 정제 단계에서 한 번만 정규화해 아래 컬럼을 만들고, 페이지와 장바구니는 이 컬럼만 사용합니다.
+
+    event       정규화된 행사 라벨 ('1+1', '2+1', '3+1', '덤증정', 'SALE', 그 외 원문)
+    event_type  행사 종류 (EVENT_TYPES 범주형: N+M / GIFT / SALE / OTHER)
+    buy_n       N+M 행사의 구매 개수 N (그 외 0)
+    get_m       N+M 행사의 증정 개수 M (그 외 0)
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+EVENT_TYPES = ['N+M', 'GIFT', 'SALE', 'OTHER']
+EVENT_TYPE_DTYPE = pd.CategoricalDtype(EVENT_TYPES)
+
+SALE_LABEL = 'SALE'
+GIFT_LABEL = '덤증정'
+
+# 스크래퍼가 넘겨주는 행사 코드 → 표기
+EVENT_CODE_ALIASES = {
+    'ONE_TO_ONE': '1+1',
+    'TWO_TO_ONE': '2+1',
+    'THREE_TO_ONE': '3+1',
+    'GIFT': GIFT_LABEL,
+}
+
+_BUNDLE_PATTERN = re.compile(r'(\d+)\s*\+\s*(\d+)')
+_SALE_PATTERN = re.compile(r'(?i)sale|세일|할인')
+_GIFT_PATTERN = re.compile(r'덤|증정')
+
+EVENT_COLUMNS = ['event', 'event_type', 'buy_n', 'get_m']
+
+# 대표 N+M 행사별 최적 묶음 단위 (N + M)
+BUNDLE_EVENTS = {'1+1': (1, 1), '2+1': (2, 1), '3+1': (3, 1)}
+EVENT_UNITS = {label: n + m for label, (n, m) in BUNDLE_EVENTS.items()}
+
+
+def parse_event(raw) -> tuple:
+    """행사 원문 하나를 (라벨, 종류, N, M)으로 변환합니다."""
+    if raw is None or (isinstance(raw, float) and np.isnan(raw)):
+        return '', 'OTHER', 0, 0
+    text = str(raw).strip()
+    text = EVENT_CODE_ALIASES.get(text.upper(), text)
+
+    match = _BUNDLE_PATTERN.search(text)
+    if match:
+        n, m = int(match.group(1)), int(match.group(2))
+        return f"{n}+{m}", 'N+M', n, m
+    if _SALE_PATTERN.search(text):
+        return SALE_LABEL, 'SALE', 0, 0
+    if _GIFT_PATTERN.search(text):
+        return GIFT_LABEL, 'GIFT', 0, 0
+    return re.sub(r'\s+', '', text), 'OTHER', 0, 0
+
+
+def bundle_of(event) -> tuple:
+    """행사 라벨의 (N, M). N+M 행사가 아니면 (0, 0)"""
+    if event in BUNDLE_EVENTS:
+        return BUNDLE_EVENTS[event]
+    _, _, n, m = parse_event(event)
+    return n, m
+
+
+def normalize_events(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    event 컬럼을 정규화하고 event_type/buy_n/get_m 컬럼을 붙인 새 데이터프레임을 반환합니다.
+    고유 표기만 한 번씩 해석한 뒤 전체 행에 펼치므로 행 수와 무관하게 빠릅니다.
+    """
+    codes, uniques = pd.factorize(df['event'], use_na_sentinel=False)
+    parsed = [parse_event(value) for value in uniques]
+    labels = np.array([p[0] for p in parsed], dtype=object)
+    kinds = np.array([p[1] for p in parsed], dtype=object)
+    buy = np.array([p[2] for p in parsed], dtype=np.int8)
+    get = np.array([p[3] for p in parsed], dtype=np.int8)
+
+    df = df.copy()
+    df['event'] = labels[codes]
+    df['event_type'] = pd.Categorical(kinds[codes], dtype=EVENT_TYPE_DTYPE)
+    df['buy_n'] = buy[codes]
+    df['get_m'] = get[codes]
+    return df
+
+
+def ensure_event_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    배치에서 만든 행사 컬럼이 있으면 dtype만 맞추고, 없으면(이전 버전 데이터) 여기서 정규화합니다.
+    """
+    if not all(col in df.columns for col in EVENT_COLUMNS):
+        return normalize_events(df)
+    df = df.copy()
+    df['event_type'] = df['event_type'].astype(EVENT_TYPE_DTYPE)
+    df['buy_n'] = df['buy_n'].fillna(0).astype(np.int8)
+    df['get_m'] = df['get_m'].fillna(0).astype(np.int8)
+    return df
+
+
+def unit_prices(df: pd.DataFrame) -> pd.Series:
+    """N+M 행사 적용 시 개당 가격 (price * N // (N + M)), N+M이 아니면 정가"""
+    price = df['price'].astype(np.int64)
+    buy = df['buy_n'].astype(np.int64)
+    total = buy + df['get_m'].astype(np.int64)
+    bundle = total > 0
+    return price.where(~bundle, price * buy // total.where(bundle, 1))
+
+
+def discount_rates(df: pd.DataFrame) -> pd.Series:
+    """N+M 행사 할인율(%) = M / (N + M) * 100, 소수점 첫째 자리"""
+    total = df['buy_n'].astype(float) + df['get_m'].astype(float)
+    return (df['get_m'] / total.where(total > 0) * 100).fillna(0.0).round(1)
+
+
+def discount_labels(df: pd.DataFrame) -> pd.Series:
+    """화면 표기용 할인율 문자열 ('50%', '33%', '25%', '0%')"""
+    return discount_rates(df).astype(int).astype(str) + '%'
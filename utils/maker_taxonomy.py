@@ -0,0 +1,112 @@
+"""
+제조사(maker) 접두어 추출 모듈
+
+상품명은 대부분 'HK)새싹보리500ml', '서울우유)딸기우유' 처럼 제조사 접두어로 시작합니다.
+배치에서 한 번만 접두어를 분리해 아래 컬럼을 만들고, 화면·시각화는 상품명을 다시 정규식으로 훑지 않고 이 컬럼을 씁니다.
+
+    maker       정규화된 제조사 (별칭 표 적용, 접두어가 없거나 제조사가 아닌 라벨이면 기본값 '기타')
+    base_name   제조사 접두어를 뗀 상품명 (접두어가 없거나 제조사가 아니면 상품명 그대로)
+
+별칭 표(utils/rules/maker_aliases.json)는 같은 제조사의 줄임 표기('하겐' → '하겐다즈')와
+제조사가 아닌 분류 라벨('위스키)', '즉석빵)')을 담고 있습니다.
+
+사용법:
+    python utils/maker_taxonomy.py        # data/categorized_data.csv 에 maker/base_name 추가
+"""
+import json
+import os
+import sys
+
+import pandas as pd
+from loguru import logger
+
+# 단독 실행 시에도 utils 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+MAKER_ALIASES_PATH = os.path.join(PROJECT_ROOT, 'utils', 'rules', 'maker_aliases.json')
+MAKER_COLUMNS = ['maker', 'base_name']
+
+# 상품명 맨 앞의 '제조사)' (괄호 메모가 섞인 '장인라면(맵싸한맛)' 같은 이름은 제외)
+_MAKER_PREFIX = r'^\s*([^()\s][^()]{0,14})\)\s*(.*)$'
+
+
+def load_maker_aliases(path: str = MAKER_ALIASES_PATH):
+    """
+    별칭 표를 읽어 (기본값, {접두어: 제조사}, 제조사가 아닌 접두어 집합)을 반환합니다.
+    한 별칭이 두 제조사에 걸려 있거나 형식이 잘못되면 ValueError
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    default = spec.get('default')
+    if not isinstance(default, str) or not default.strip():
+        raise ValueError("제조사 별칭 표의 default가 비어 있습니다.")
+
+    aliases = {}
+    for maker, words in spec.get('aliases', {}).items():
+        if not isinstance(words, list):
+            raise ValueError(f"{maker}: 별칭은 목록이어야 합니다.")
+        for word in words:
+            if aliases.get(word, maker) != maker:
+                raise ValueError(f"별칭 '{word}'가 '{aliases[word]}'와 '{maker}' 두 제조사에 걸려 있습니다.")
+            aliases[word] = maker
+    not_makers = set(spec.get('not_makers', []))
+    overlap = not_makers & (set(aliases) | set(aliases.values()))
+    if overlap:
+        raise ValueError(f"제조사가 아닌 라벨과 별칭이 겹칩니다: {sorted(overlap)}")
+    return default, aliases, not_makers
+
+
+def extract_makers(names: pd.Series, path: str = MAKER_ALIASES_PATH) -> pd.DataFrame:
+    """상품명 시리즈 → maker / base_name 두 컬럼 데이터프레임 (행 순서·인덱스 유지)"""
+    default, aliases, not_makers = load_maker_aliases(path)
+    names = names.fillna('').astype(str)
+    parts = names.str.extract(_MAKER_PREFIX)
+    prefix = parts[0].str.strip()
+
+    is_maker = prefix.notna() & ~prefix.isin(not_makers)
+    maker = prefix.replace(aliases).where(is_maker, default)
+    base_name = parts[1].where(is_maker, names)
+    return pd.DataFrame({'maker': maker.astype(object), 'base_name': base_name.astype(object)}, index=names.index)
+
+
+def add_maker_columns(df: pd.DataFrame, path: str = MAKER_ALIASES_PATH) -> pd.DataFrame:
+    """maker/base_name 컬럼을 (다시) 계산해 붙인 새 데이터프레임을 반환합니다."""
+    df = df.copy()
+    df[MAKER_COLUMNS] = extract_makers(df['name'], path)
+    return df
+
+
+def ensure_maker_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """배치에서 만든 제조사 컬럼이 없으면(이전 버전 데이터) 여기서 추출합니다."""
+    if all(col in df.columns for col in MAKER_COLUMNS):
+        return df
+    return add_maker_columns(df)
+
+
+def run_maker_extraction(input_path: str = 'data/categorized_data.csv',
+                         output_path: str = 'data/categorized_data.csv'):
+    """데이터셋에 maker/base_name을 붙여 output_path에 저장하고 결과 데이터프레임을 반환합니다. 실패 시 None"""
+    if not os.path.exists(input_path):
+        logger.error(f"'{input_path}' 파일이 없습니다. 매칭 코드를 먼저 실행하세요.")
+        return
+
+    try:
+        df = add_maker_columns(pd.read_csv(input_path, encoding='utf-8-sig'))
+        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+
+        default = load_maker_aliases()[0]
+        logger.success(f"제조사 추출 완료: 제조사 {df['maker'].nunique()}곳, "
+                       f"접두어 없는 상품 {(df['maker'] == default).sum()}개 → '{output_path}'")
+        return df
+
+    except Exception as e:
+        logger.error(f"제조사 추출 중 오류 발생: {e}")
+
+
+if __name__ == "__main__":
+    result = run_maker_extraction()
+    if result is not None:
+        print("\n[ 상품 수 상위 제조사 ]")
+        print(result['maker'].value_counts().head(20))
@@ -0,0 +1,109 @@
+"""
+상품 용량(ml/g/개수) 추출 모듈
+
+상품명에 들어 있는 용량·중량·입수 표기('500ml', '1.5L', '햇반210g*3입', '18P')를 배치에서 한 번만 해석해
+아래 컬럼을 만듭니다. 가성비 순위는 상품명을 다시 훑지 않고 이 숫자 컬럼으로 정렬합니다.
+
+    size_value      전체 용량 (묶음이면 개당 용량 × 입수, 1L → 1000ml, 1kg → 1000g)
+    size_unit       'ml' / 'g' / '개' (해석하지 못하면 빈 값)
+    price_per_100   행사 적용 개당 가격 기준 100ml·100g당 가격 (용량이 개수뿐이면 빈 값)
+
+사용법:
+    python utils/package_size.py        # data/categorized_data.csv 에 용량 컬럼 추가
+"""
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+# 단독 실행 시에도 utils 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.event_taxonomy import ensure_event_columns, unit_prices
+
+SIZE_COLUMNS = ['size_value', 'size_unit', 'price_per_100']
+SIZE_UNITS = ['ml', 'g', '개']
+
+# 용량·중량 (+ 선택적인 '*3입' 묶음 개수), 없으면 입수 표기만
+_MEASURE = re.compile(r'(?i)(\d+(?:\.\d+)?)\s*(ml|l|kg|g)(?![a-z])(?:\s*[*x×]\s*(\d+))?')
+_COUNT = re.compile(r'(?i)(\d+)\s*(?:입|개|매|롤|봉|팩|구|p)(?![a-z])')
+_UNIT_SCALE = {'ml': ('ml', 1), 'l': ('ml', 1000), 'g': ('g', 1), 'kg': ('g', 1000)}
+
+
+def parse_sizes(names: pd.Series) -> pd.DataFrame:
+    """상품명 시리즈 → size_value / size_unit 두 컬럼 데이터프레임 (행 순서·인덱스 유지)"""
+    names = names.fillna('').astype(str)
+    measure = names.str.extract(_MEASURE)
+    count = pd.to_numeric(names.str.extract(_COUNT)[0], errors='coerce')
+
+    unit_key = measure[1].str.lower()
+    scale = unit_key.map({key: s for key, (_, s) in _UNIT_SCALE.items()})
+    pack = pd.to_numeric(measure[2], errors='coerce').fillna(1)
+    value = pd.to_numeric(measure[0], errors='coerce') * scale * pack
+    unit = unit_key.map({key: u for key, (u, _) in _UNIT_SCALE.items()})
+
+    # 용량 표기가 없으면 입수('3입', '18P')를 개수로 사용
+    only_count = value.isna() & count.notna()
+    value = value.where(~only_count, count)
+    unit = unit.where(~only_count, '개')
+
+    valid = value > 0
+    return pd.DataFrame({
+        'size_value': value.where(valid).astype(float),
+        'size_unit': unit.where(valid).astype(object),
+    }, index=names.index)
+
+
+def price_per_100(df: pd.DataFrame) -> pd.Series:
+    """행사 적용 개당 가격 기준 100ml·100g당 가격 (소수점 첫째 자리, 개수 단위는 NaN)"""
+    measured = df['size_unit'].isin(['ml', 'g']) & (df['size_value'] > 0)
+    per_100 = unit_prices(ensure_event_columns(df)) / df['size_value'].where(measured) * 100
+    return per_100.round(1)
+
+
+def add_size_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """용량 컬럼을 (다시) 계산해 붙인 새 데이터프레임을 반환합니다. 제조사 접두어를 뗀 base_name이 있으면 사용"""
+    df = df.copy()
+    names = df['base_name'] if 'base_name' in df.columns else df['name']
+    df[['size_value', 'size_unit']] = parse_sizes(names)
+    df['price_per_100'] = price_per_100(df)
+    return df
+
+
+def ensure_size_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """배치에서 만든 용량 컬럼이 없으면(이전 버전 데이터) 여기서 추출합니다."""
+    if all(col in df.columns for col in SIZE_COLUMNS):
+        return df
+    return add_size_columns(df)
+
+
+def run_size_extraction(input_path: str = 'data/categorized_data.csv',
+                        output_path: str = 'data/categorized_data.csv'):
+    """데이터셋에 용량 컬럼을 붙여 output_path에 저장하고 결과 데이터프레임을 반환합니다. 실패 시 None"""
+    if not os.path.exists(input_path):
+        logger.error(f"'{input_path}' 파일이 없습니다. 제조사 추출 코드를 먼저 실행하세요.")
+        return
+
+    try:
+        df = add_size_columns(pd.read_csv(input_path, encoding='utf-8-sig'))
+        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+
+        parsed = df['size_unit'].notna()
+        logger.success(f"용량 추출 완료: {parsed.sum()}/{len(df)}개 상품 "
+                       f"({np.mean(parsed) * 100:.1f}%) → '{output_path}'")
+        return df
+
+    except Exception as e:
+        logger.error(f"용량 추출 중 오류 발생: {e}")
+
+
+if __name__ == "__main__":
+    result = run_size_extraction()
+    if result is not None:
+        print("\n[ 단위별 상품 수 ]")
+        print(result['size_unit'].value_counts(dropna=False))
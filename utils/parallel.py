@@ -0,0 +1,62 @@
+"""
+파티션 단위 병렬 처리 도우미
+
+행 단위로 독립적인 보강 작업(카테고리 분류, 태그·용량 파싱 등)을 데이터 구간(파티션)으로 나눠
+프로세스 풀에서 실행하고, 결과를 파티션 순서대로 이어 붙입니다.
+파티션 경계와 결합 순서가 고정되어 있어 결과는 직렬 실행과 항상 같습니다.
+데이터가 작으면 프로세스 생성 비용이 더 크므로 풀을 만들지 않고 그대로 직렬 실행합니다.
+
+병렬로 넘기는 함수는 자식 프로세스에서 다시 import 할 수 있도록 모듈 최상위 함수여야 합니다.
+배치 단계는 스레드에서 실행되므로, 스레드가 잡고 있던 락을 자식이 물려받지 않도록 fork 대신
+forkserver(없으면 spawn)로 자식 프로세스를 만듭니다.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# 파티션 하나의 최소 행 수 (이보다 작게 나누면 직렬보다 느려짐)
+MIN_PARTITION_ROWS = 5000
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def _pool(workers: int) -> ProcessPoolExecutor:
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context(method))
+
+
+def partition_bounds(n: int, parts: int) -> list:
+    """[0, n) 구간을 거의 같은 크기의 parts개 연속 구간 (start, end)로 나눕니다."""
+    edges = np.linspace(0, n, parts + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
+def map_partitions(func, data, workers: int = None, min_rows: int = MIN_PARTITION_ROWS):
+    """
+    func(data 일부)를 파티션별로 실행해 결과(Series/DataFrame)를 원래 순서대로 이어 붙입니다.
+    func는 입력과 같은 인덱스의 결과를 돌려줘야 합니다.
+    """
+    workers = workers or default_workers()
+    parts = min(workers, len(data) // min_rows) if min_rows else min(workers, len(data))
+    if parts <= 1:
+        return func(data)
+
+    chunks = [data.iloc[start:end] for start, end in partition_bounds(len(data), parts)]
+    with _pool(parts) as pool:
+        results = list(pool.map(func, chunks))
+    return pd.concat(results)
+
+
+def map_items(func, items, workers: int = None) -> list:
+    """항목(스냅샷 파일 등)마다 func를 병렬 실행하고 입력 순서대로 결과 목록을 반환합니다."""
+    items = list(items)
+    workers = min(workers or default_workers(), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with _pool(workers) as pool:
+        return list(pool.map(func, items))
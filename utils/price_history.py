@@ -0,0 +1,272 @@
+"""
+월별 스냅샷 가격/행사 히스토리 저장소
+
+매달 데이터셋이 통째로 교체되므로 "이 상품의 행사가/행사 종류가 어떻게 바뀌었나"를 바로 볼 수 없습니다.
+이 저장소는 모든 브랜드 스냅샷을 상품 키(브랜드 + 상품명 해시) 기준으로 모아
+컬럼형 numpy 배열(.npz) 하나로 보관합니다.
+
+저장 형식 (상품 키 순 → 스냅샷 날짜 순으로 정렬된 관측치):
+    keys        uint64  정렬된 상품 키 (상품당 1개)
+    offsets     int64   상품별 관측치 구간 [offsets[i], offsets[i+1])
+    obs_date    uint16  관측 날짜 (dates 사전의 인덱스)
+    price_delta int32   같은 상품의 직전 관측 대비 가격 차이 (첫 관측은 절대값)
+    event_code  int16   행사 종류 (events 사전의 인덱스)
+
+한 상품 조회는 keys 이진 탐색(O(log n)) 후 구간 누적합으로 복원하고,
+전체 추이 분석은 모든 구간을 한 번에 벡터 연산으로 복원합니다.
+
+사용법:
+    python utils/price_history.py                     # 새 스냅샷만 증분 추가
+    python utils/price_history.py --rebuild           # 전체 재구축
+    python utils/price_history.py --product CU "상품명"
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+# 단독 실행 시에도 utils 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.parallel import map_items
+from utils.snapshot_catalog import SnapshotCatalog
+
+HISTORY_PATH = os.path.join("data", "history", "price_history.npz")
+
+
+def product_keys(brands, names) -> np.ndarray:
+    """(브랜드, 상품명) → 고정 시드 64비트 해시 키. 실행마다 같은 값이 나옵니다."""
+    joined = pd.Series(brands, dtype=object).astype(str) + "\x1f" + pd.Series(names, dtype=object).astype(str)
+    return pd.util.hash_pandas_object(joined, index=False).to_numpy(dtype=np.uint64)
+
+
+def _date_int(value) -> int:
+    return int(pd.Timestamp(value).strftime("%Y%m%d"))
+
+
+class PriceHistory:
+    """상품별 가격/행사 시계열 (델타 인코딩 컬럼 저장)"""
+
+    def __init__(self):
+        self.keys = np.empty(0, dtype=np.uint64)
+        self.brands = np.empty(0, dtype=str)
+        self.names = np.empty(0, dtype=str)
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.dates = np.empty(0, dtype=np.int32)
+        self.events = np.empty(0, dtype=str)
+        self.obs_date = np.empty(0, dtype=np.uint16)
+        self.price_delta = np.empty(0, dtype=np.int32)
+        self.event_code = np.empty(0, dtype=np.int16)
+        # 이미 반영한 (브랜드, 스냅샷 날짜) 목록 — 증분 추가 시 중복 방지
+        self.ingested_brand = np.empty(0, dtype=str)
+        self.ingested_date = np.empty(0, dtype=np.int32)
+
+    # ---------- 저장/로드 ----------
+
+    @classmethod
+    def load(cls, path: str = HISTORY_PATH) -> "PriceHistory":
+        store = cls()
+        if not os.path.exists(path):
+            return store
+        with np.load(path) as data:
+            for field in vars(store):
+                setattr(store, field, data[field])
+        return store
+
+    def save(self, path: str = HISTORY_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **vars(self))
+        os.replace(tmp_path, path)
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def n_observations(self) -> int:
+        return len(self.obs_date)
+
+    def is_ingested(self, brand: str, snapshot_date) -> bool:
+        return bool(np.any((self.ingested_brand == brand) & (self.ingested_date == _date_int(snapshot_date))))
+
+    # ---------- 인코딩/디코딩 ----------
+
+    def _decode_prices(self) -> np.ndarray:
+        """모든 상품의 델타를 한 번에 절대 가격으로 복원합니다."""
+        if not self.n_observations:
+            return np.empty(0, dtype=np.int64)
+        counts = np.diff(self.offsets)
+        csum = np.cumsum(self.price_delta, dtype=np.int64)
+        starts = self.offsets[:-1]
+        base = csum[starts] - self.price_delta[starts]
+        return csum - np.repeat(base, counts)
+
+    def _decode_flat(self):
+        """관측치를 (상품 인덱스, 날짜, 가격, 행사명) 평면 배열로 복원합니다."""
+        product_idx = np.repeat(np.arange(len(self.keys)), np.diff(self.offsets))
+        return (product_idx, self.dates[self.obs_date], self._decode_prices(),
+                self.events[self.event_code])
+
+    def append_snapshots(self, snapshots):
+        """
+        여러 스냅샷을 한 번에 추가합니다. snapshots: [(스냅샷 날짜, 브랜드, 정제된 데이터프레임)]
+        기존 관측치와 합쳐 한 번만 재정렬·재인코딩하므로 배치 단위로 모아서 호출하는 것이 좋습니다.
+        같은 상품·같은 날짜 관측은 새 값으로 덮어씁니다.
+        """
+        frames = []
+        ingested = []
+        for snapshot_date, brand, df in snapshots:
+            date = _date_int(snapshot_date)
+            part = df[['brand', 'name', 'price', 'event']].drop_duplicates(subset=['brand', 'name'], keep='first')
+            frames.append(part.assign(date=date))
+            ingested.append((brand, date))
+        if not frames:
+            return 0
+
+        new = pd.concat(frames, ignore_index=True)
+
+        product_idx, dates, prices, events = self._decode_flat()
+        old = pd.DataFrame({
+            'brand': self.brands[product_idx],
+            'name': self.names[product_idx],
+            'price': prices,
+            'event': events,
+            'date': dates,
+        })
+        merged = pd.concat([old, new], ignore_index=True)
+        merged['key'] = product_keys(merged['brand'], merged['name'])
+        merged = (merged.drop_duplicates(subset=['key', 'date'], keep='last')
+                  .sort_values(['key', 'date'], kind='stable', ignore_index=True))
+        self._encode(merged)
+
+        brands = np.concatenate([self.ingested_brand, np.array([b for b, _ in ingested], dtype=str)])
+        dates_done = np.concatenate([self.ingested_date, np.array([d for _, d in ingested], dtype=np.int32)])
+        done = pd.DataFrame({'brand': brands, 'date': dates_done}).drop_duplicates()
+        self.ingested_brand = done['brand'].to_numpy(dtype=str)
+        self.ingested_date = done['date'].to_numpy(dtype=np.int32)
+        return len(new)
+
+    def _encode(self, merged: pd.DataFrame):
+        """(key, date) 순으로 정렬된 관측치 테이블을 컬럼 배열로 인코딩합니다."""
+        keys = merged['key'].to_numpy(dtype=np.uint64)
+        first = np.r_[True, keys[1:] != keys[:-1]] if len(keys) else np.empty(0, dtype=bool)
+        starts = np.flatnonzero(first)
+
+        self.keys = keys[starts]
+        self.brands = merged['brand'].to_numpy(dtype=str)[starts]
+        self.names = merged['name'].to_numpy(dtype=str)[starts]
+        self.offsets = np.r_[starts, len(keys)].astype(np.int64)
+
+        self.dates, date_idx = np.unique(merged['date'].to_numpy(dtype=np.int32), return_inverse=True)
+        self.obs_date = date_idx.astype(np.uint16)
+
+        self.events, event_idx = np.unique(merged['event'].astype(str).to_numpy(dtype=str), return_inverse=True)
+        self.event_code = event_idx.astype(np.int16)
+
+        prices = merged['price'].to_numpy(dtype=np.int64)
+        delta = np.diff(prices, prepend=0)
+        delta[starts] = prices[starts]
+        self.price_delta = delta.astype(np.int32)
+
+    # ---------- 조회 ----------
+
+    def lookup(self, brand: str, name: str) -> pd.DataFrame:
+        """한 상품의 날짜별 가격/행사 이력 (이진 탐색). 없으면 빈 데이터프레임"""
+        key = product_keys([brand], [name])[0]
+        i = np.searchsorted(self.keys, key)
+        if i >= len(self.keys) or self.keys[i] != key:
+            return pd.DataFrame(columns=['date', 'price', 'event'])
+
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return pd.DataFrame({
+            'date': pd.to_datetime(self.dates[self.obs_date[start:end]].astype(str), format="%Y%m%d"),
+            'price': np.cumsum(self.price_delta[start:end], dtype=np.int64),
+            'event': self.events[self.event_code[start:end]],
+        })
+
+    def to_frame(self) -> pd.DataFrame:
+        """전체 관측치를 (brand, name, date, price, event) 데이터프레임으로 복원합니다."""
+        product_idx, dates, prices, events = self._decode_flat()
+        return pd.DataFrame({
+            'brand': self.brands[product_idx],
+            'name': self.names[product_idx],
+            'date': pd.to_datetime(dates.astype(str), format="%Y%m%d"),
+            'price': prices,
+            'event': events,
+        })
+
+    def changes(self) -> pd.DataFrame:
+        """직전 스냅샷 대비 가격 또는 행사가 바뀐 관측치 (상품별 첫 관측 제외)"""
+        product_idx, _, prices, _ = self._decode_flat()
+        if not len(product_idx):
+            return self.to_frame()
+        same_product = np.r_[False, product_idx[1:] == product_idx[:-1]]
+        price_changed = np.r_[False, prices[1:] != prices[:-1]]
+        event_changed = np.r_[False, self.event_code[1:] != self.event_code[:-1]]
+        mask = same_product & (price_changed | event_changed)
+
+        df = self.to_frame()
+        prev = np.flatnonzero(mask) - 1
+        df['prev_price'] = pd.Series(prices[prev], index=np.flatnonzero(mask))
+        df['prev_event'] = pd.Series(self.events[self.event_code[prev]], index=np.flatnonzero(mask))
+        return df[mask].reset_index(drop=True)
+
+    def trend(self, by: str = 'brand') -> pd.DataFrame:
+        """스냅샷 날짜 × by 그룹별 상품 수와 평균 가격"""
+        df = self.to_frame()
+        return (df.groupby(['date', by])['price']
+                .agg(products='size', avg_price='mean')
+                .reset_index())
+
+
+def _clean_snapshot(raw_path: str):
+    """원본 스냅샷 하나를 정제합니다 (프로세스 풀에서 실행). 실패 시 None"""
+    from utils.data_cleaner_batch import clean_frame, read_raw_csv
+    try:
+        return clean_frame(read_raw_csv(raw_path))
+    except Exception as e:
+        logger.error(f"{raw_path} 히스토리 반영 실패: {e}")
+
+
+def update_price_history(path: str = HISTORY_PATH, rebuild: bool = False, catalog: SnapshotCatalog = None,
+                         workers: int = None) -> PriceHistory:
+    """
+    스냅샷 카탈로그에서 아직 반영하지 않은 (브랜드, 날짜) 스냅샷만 정제해 히스토리에 추가합니다.
+    스냅샷 정제는 파일 단위로 프로세스 풀에서 병렬 실행합니다 (workers 기본: CPU 코어 수).
+    새 스냅샷이 없으면 파일을 다시 쓰지 않습니다.
+    """
+    store = PriceHistory() if rebuild else PriceHistory.load(path)
+    catalog = catalog or SnapshotCatalog()
+
+    todo = [(d, b, p) for d, b, p in catalog.history() if not store.is_ingested(b, d)]
+    cleaned = map_items(_clean_snapshot, [p for _, _, p in todo], workers)
+    pending = [(d, b, df) for (d, b, _), df in zip(todo, cleaned) if df is not None]
+
+    if not pending:
+        logger.info("가격 히스토리: 새 스냅샷 없음")
+        return store
+
+    rows = store.append_snapshots(pending)
+    store.save(path)
+    logger.success(f"가격 히스토리 갱신: 스냅샷 {len(pending)}개({rows}행) 추가, "
+                   f"상품 {len(store)}개 / 관측 {store.n_observations}개 → '{path}'")
+    return store
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="가격/행사 히스토리 저장소")
+    parser.add_argument('--rebuild', action='store_true', help="전체 스냅샷으로 재구축")
+    parser.add_argument('--product', nargs=2, metavar=('BRAND', 'NAME'), help="한 상품의 이력 조회")
+    parser.add_argument('--workers', type=int, help="스냅샷 정제 프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args()
+
+    if args.product:
+        print(PriceHistory.load().lookup(*args.product).to_string(index=False))
+    else:
+        update_price_history(rebuild=args.rebuild, workers=args.workers)
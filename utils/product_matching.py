@@ -0,0 +1,208 @@
+"""
+브랜드 간 동일 상품 매칭
+
+같은 상품이 편의점마다 다른 표기로 올라옵니다. (예: 'HK)새싹보리500ml', 'HK)새싹보리P500ml', 'HK)새싹보리펫500ml')
+상품명을 정규화(제조사 접두어 제거, 용량 단위 통일)한 뒤 문자 n-gram MinHash + LSH 밴딩으로 후보 쌍만 골라
+Jaccard 유사도로 확인하고, 같은 상품끼리 match_group_id를 부여합니다.
+모든 쌍을 비교(O(n²))하지 않고 같은 버킷에 들어온 후보만 비교하므로 상품 수에 거의 선형으로 동작합니다.
+
+사용법:
+    python utils/product_matching.py        # data/categorized_data.csv 에 match_group_id 추가
+"""
+import os
+import re
+import sys
+import zlib
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+# 단독 실행 시에도 utils 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.event_taxonomy import ensure_event_columns, unit_prices
+from utils.parallel import map_partitions
+
+NGRAM = 3
+NUM_PERM = 64
+BANDS = 16                    # 16밴드 × 4행 → 유사도 약 0.5 이상이면 후보가 될 확률이 높음
+ROWS_PER_BAND = NUM_PERM // BANDS
+MATCH_THRESHOLD = 0.7         # 후보 쌍을 같은 상품으로 볼 최소 Jaccard 유사도
+MAX_BUCKET = 50               # 지나치게 흔한 버킷(짧은 이름 등)은 비교에서 제외
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = np.random.RandomState(20260224)
+_PERM_A = _rng.randint(1, 1 << 31, size=NUM_PERM).astype(np.uint64)
+_PERM_B = _rng.randint(0, 1 << 31, size=NUM_PERM).astype(np.uint64)
+
+_MAKER_PREFIX = re.compile(r'^[^)]{1,15}\)')
+_NOTE = re.compile(r'\([^)]*\)')
+# 용기 표기(펫/PET/캔/병, 용량 앞 P)는 상품 구분에 의미가 없어 제거
+_PACKAGE = re.compile(r'(펫|pet|캔|병|p)(?=\d)')
+_SIZE = re.compile(r'(\d+(?:\.\d+)?)\s*(ml|l|kg|g)(?![a-z])')
+_UNIT_SCALE = {'ml': ('ml', 1), 'l': ('ml', 1000), 'g': ('g', 1), 'kg': ('g', 1000)}
+
+
+def _canonical_size(match) -> str:
+    unit, scale = _UNIT_SCALE[match.group(2)]
+    value = float(match.group(1)) * scale
+    return f"{value:g}{unit}"
+
+
+def normalize_name(name) -> str:
+    """매칭용 상품명: 제조사 접두어·괄호 메모·공백 제거, 소문자화, 용량 단위 통일 (1L → 1000ml, 500G → 500g)"""
+    if not isinstance(name, str):
+        return ''
+    text = _MAKER_PREFIX.sub('', name.strip())
+    text = _NOTE.sub('', text).lower()
+    text = re.sub(r'\s+', '', text)
+    text = _PACKAGE.sub('', text)
+    return _SIZE.sub(_canonical_size, text)
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """상품명 시리즈 전체 정규화 (프로세스 풀 파티션 단위)"""
+    return names.map(normalize_name)
+
+
+def size_token(normalized: str) -> str:
+    """정규화된 이름의 용량 표기 (없으면 빈 문자열)"""
+    match = re.search(r'\d+(?:\.\d+)?(?:ml|g)', normalized)
+    return match.group(0) if match else ''
+
+
+def shingles(text: str) -> set:
+    if len(text) <= NGRAM:
+        return {text} if text else set()
+    return {text[i:i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+def minhash_signatures(shingle_sets) -> np.ndarray:
+    """
+    (이름 수 × NUM_PERM) MinHash 서명. 모든 shingle 해시를 한 배열에 펼친 뒤
+    순열별 최소값을 이름 단위로 reduceat 해 한 번에 계산합니다.
+    """
+    lengths = np.array([len(s) for s in shingle_sets], dtype=np.int64)
+    signatures = np.full((len(shingle_sets), NUM_PERM), np.iinfo(np.uint64).max, dtype=np.uint64)
+    if not lengths.sum():
+        return signatures
+
+    flat = np.fromiter((zlib.crc32(g.encode('utf-8')) for s in shingle_sets for g in s),
+                       dtype=np.uint64, count=int(lengths.sum()))
+    has = lengths > 0
+    starts = np.r_[0, np.cumsum(lengths)[:-1]][has]
+
+    with np.errstate(over='ignore'):
+        for k in range(NUM_PERM):
+            hashed = (_PERM_A[k] * flat + _PERM_B[k]) % np.uint64(_MERSENNE_PRIME)
+            signatures[has, k] = np.minimum.reduceat(hashed, starts)
+    return signatures
+
+
+def candidate_pairs(signatures: np.ndarray) -> np.ndarray:
+    """LSH 밴딩: 한 밴드라도 서명이 같은 이름 쌍 (i < j) 배열"""
+    pairs = []
+    for band in range(BANDS):
+        rows = signatures[:, band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        bucket = pd.util.hash_pandas_object(pd.DataFrame(rows), index=False).to_numpy()
+        order = np.argsort(bucket, kind='stable')
+        sorted_bucket = bucket[order]
+        boundaries = np.flatnonzero(np.r_[True, sorted_bucket[1:] != sorted_bucket[:-1], True])
+        for start, end in zip(boundaries[:-1], boundaries[1:]):
+            size = end - start
+            if size < 2 or size > MAX_BUCKET:
+                continue
+            members = np.sort(order[start:end])
+            i, j = np.triu_indices(size, k=1)
+            pairs.append(np.column_stack([members[i], members[j]]))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.vstack(pairs), axis=0)
+
+
+class _UnionFind:
+    def __init__(self, n: int):
+        self.parent = np.arange(n)
+
+    def find(self, x: int) -> int:
+        root = x
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[x] != root:
+            self.parent[x], x = root, self.parent[x]
+        return root
+
+    def union(self, a: int, b: int):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def assign_match_groups(df: pd.DataFrame, threshold: float = MATCH_THRESHOLD, workers: int = None) -> pd.Series:
+    """
+    행마다 match_group_id를 부여합니다. 정규화 이름이 같으면 같은 그룹이고,
+    LSH 후보 중 브랜드가 다르고 용량이 어긋나지 않으며 Jaccard >= threshold인 쌍도 같은 그룹으로 묶습니다.
+    그룹 번호는 처음 등장한 행 순서대로 0부터 매깁니다.
+    상품명 정규화는 행 단위 작업이라 workers개 프로세스로 나눠 실행합니다.
+    """
+    normalized = map_partitions(normalize_names, df['name'], workers)
+    codes, uniques = pd.factorize(normalized)
+    n = len(uniques)
+
+    # 정규화 이름별 대표 정보 (브랜드 집합, 용량, shingle)
+    brand_sets = pd.Series(df['brand'].to_numpy()).groupby(codes).agg(frozenset).reindex(range(n)).tolist()
+    sizes = [size_token(u) for u in uniques]
+    shingle_sets = [shingles(u) for u in uniques]
+
+    uf = _UnionFind(n)
+    pairs = candidate_pairs(minhash_signatures(shingle_sets))
+    matched = 0
+    for a, b in pairs:
+        if brand_sets[a] == brand_sets[b] and len(brand_sets[a]) == 1:
+            continue  # 같은 브랜드 안의 변형(맛/구성 차이)은 별개 상품
+        if sizes[a] and sizes[b] and sizes[a] != sizes[b]:
+            continue
+        union = len(shingle_sets[a] | shingle_sets[b])
+        if union and len(shingle_sets[a] & shingle_sets[b]) / union >= threshold:
+            uf.union(a, b)
+            matched += 1
+
+    roots = np.array([uf.find(i) for i in range(n)])
+    group_codes, _ = pd.factorize(roots[codes])
+    logger.info(f"상품 매칭: 정규화 이름 {n}개, 후보 쌍 {len(pairs)}개 중 {matched}쌍 병합 → 그룹 {group_codes.max() + 1 if n else 0}개")
+    return pd.Series(group_codes, index=df.index, name='match_group_id')
+
+
+def cheapest_offers(df: pd.DataFrame) -> pd.DataFrame:
+    """match_group_id별로 개당 가격이 가장 싼 행 (브랜드 간 최저가 조회용)"""
+    df = ensure_event_columns(df)
+    df = df.assign(unit_price=unit_prices(df))
+    idx = df.groupby('match_group_id')['unit_price'].idxmin()
+    return df.loc[idx].set_index('match_group_id')
+
+
+def run_matching(input_path: str = 'data/categorized_data.csv', output_path: str = 'data/categorized_data.csv',
+                 workers: int = None):
+    """데이터셋에 match_group_id를 붙여 output_path에 저장하고 결과 데이터프레임을 반환합니다. 실패 시 None"""
+    if not os.path.exists(input_path):
+        logger.error(f"'{input_path}' 파일이 없습니다. 분류 코드를 먼저 실행하세요.")
+        return
+
+    try:
+        df = pd.read_csv(input_path, encoding='utf-8-sig')
+        df['match_group_id'] = assign_match_groups(df, workers=workers)
+        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+
+        cross = df.groupby('match_group_id')['brand'].nunique()
+        logger.success(f"매칭 완료: 2개 이상 브랜드에 걸친 상품 그룹 {(cross > 1).sum()}개 → '{output_path}'")
+        return df
+
+    except Exception as e:
+        logger.error(f"상품 매칭 중 오류 발생: {e}")
+
+
+if __name__ == "__main__":
+    run_matching()
@@ -0,0 +1,160 @@
+"""
+상품 ID 레지스트리
+
+배치가 (브랜드, 상품명, 행사) 조합마다 정수 product_id를 부여하고 data/product_registry.csv에 영구 보관합니다.
+다음 달 스냅샷에 같은 조합이 다시 나오면 같은 ID를 재사용하고, 처음 보는 조합에만 새 ID를 발급합니다.
+장바구니·세션 상태·조합 중복 제거는 문자열 튜플 대신 이 ID를 키로 사용합니다.
+
+사용법:
+    python utils/product_registry.py        # data/categorized_data.csv 에 product_id 부여
+"""
+import os
+import sys
+from datetime import date
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+# 단독 실행 시에도 utils 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# 배치가 매번 갱신하므로 저장소에는 올리지 않음 (.gitignore). 없으면 배포된 데이터셋의 product_id로 시작
+REGISTRY_PATH = os.path.join("data", "product_registry.csv")
+SEED_DATASET_PATH = os.path.join("data", "categorized_data.csv")
+
+KEY_COLUMNS = ['brand', 'name', 'event']
+REGISTRY_COLUMNS = ['product_id'] + KEY_COLUMNS + ['first_seen', 'last_seen']
+
+
+def seed_registry(dataset_path: str = SEED_DATASET_PATH) -> pd.DataFrame:
+    """
+    레지스트리 파일이 없을 때 배포된 데이터셋의 product_id로 시작 레지스트리를 만듭니다 (ID 연속성 유지).
+    관측 날짜는 비워 두며, 다음 배치에서 다시 관측되면 스냅샷 날짜로 채워집니다.
+    """
+    empty = pd.DataFrame(columns=REGISTRY_COLUMNS).astype({'product_id': np.int64})
+    if not os.path.exists(dataset_path):
+        return empty
+    df = pd.read_csv(dataset_path, encoding='utf-8-sig', dtype={'brand': str, 'name': str, 'event': str})
+    if 'product_id' not in df.columns:
+        return empty
+    seeded = df[['product_id'] + KEY_COLUMNS].drop_duplicates(subset='product_id').sort_values('product_id')
+    seeded = seeded.assign(product_id=seeded['product_id'].astype(np.int64), first_seen=np.nan, last_seen=np.nan)
+    logger.info(f"레지스트리가 없어 '{dataset_path}'의 product_id {len(seeded)}개로 시작합니다.")
+    return seeded[REGISTRY_COLUMNS].reset_index(drop=True)
+
+
+def load_registry(path: str = REGISTRY_PATH) -> pd.DataFrame:
+    if not os.path.exists(path):
+        if os.path.abspath(path) == os.path.abspath(REGISTRY_PATH):
+            return seed_registry()
+        return pd.DataFrame(columns=REGISTRY_COLUMNS).astype({'product_id': np.int64})
+    registry = pd.read_csv(path, encoding='utf-8-sig', dtype={'brand': str, 'name': str, 'event': str})
+    registry['product_id'] = registry['product_id'].astype(np.int64)
+    return registry
+
+
+def save_registry(registry: pd.DataFrame, path: str = REGISTRY_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    registry.to_csv(tmp_path, index=False, encoding='utf-8-sig')
+    os.replace(tmp_path, path)
+
+
+def _lookup(df: pd.DataFrame, registry: pd.DataFrame) -> pd.Series:
+    """df 행별 기존 product_id (없으면 NaN). 키 컬럼 조인 한 번으로 처리합니다."""
+    keys = df[KEY_COLUMNS].astype(str)
+    merged = keys.merge(registry[KEY_COLUMNS + ['product_id']], on=KEY_COLUMNS, how='left')
+    return pd.Series(merged['product_id'].to_numpy(), index=df.index)
+
+
+def seen_dates(df: pd.DataFrame, seen_on=None) -> pd.Series:
+    """
+    행별 관측 날짜 'YYYY-MM-DD'
+    seen_on: 날짜 하나(모든 행) 또는 {브랜드: 스냅샷 날짜}(행의 브랜드로 조회), 없는 값은 오늘 날짜
+    """
+    today = date.today().isoformat()
+    if isinstance(seen_on, dict):
+        return df['brand'].astype(str).map(seen_on).fillna(today)
+    return pd.Series(seen_on or today, index=df.index, dtype=object)
+
+
+def assign_product_ids(df: pd.DataFrame, registry: pd.DataFrame, seen_on=None):
+    """
+    df에 product_id를 부여합니다. 레지스트리에 있는 조합은 기존 ID, 새 조합은 max(ID)+1부터 순서대로 발급합니다.
+    (product_id 시리즈, 갱신된 레지스트리)를 반환합니다.
+
+    seen_on은 실행 날짜가 아니라 원본 스냅샷 날짜를 넘깁니다 (seen_dates 참고). first_seen/last_seen은
+    기존 기록보다 이르거나 늦을 때만 바뀌므로, 지난 스냅샷으로 다시 실행해도 last_seen이 앞당겨지지 않습니다.
+    """
+    seen = seen_dates(df, seen_on)
+    ids = _lookup(df, registry)
+
+    # 새 항목의 first_seen/last_seen은 아래에서 관측 날짜로 채움
+    new_keys = df.loc[ids.isna(), KEY_COLUMNS].astype(str).drop_duplicates()
+    next_id = int(registry['product_id'].max()) + 1 if len(registry) else 1
+    new_entries = new_keys.assign(product_id=np.arange(next_id, next_id + len(new_keys), dtype=np.int64),
+                                  first_seen=np.nan, last_seen=np.nan)
+
+    registry = pd.concat([registry, new_entries[REGISTRY_COLUMNS]], ignore_index=True)
+    ids = _lookup(df, registry).astype(np.int64)
+
+    span = seen.groupby(ids).agg(['min', 'max'])
+    first, last = registry['product_id'].map(span['min']), registry['product_id'].map(span['max'])
+    observed = first.notna()
+    registry['first_seen'] = registry['first_seen'].where(~observed | (registry['first_seen'] <= first), first)
+    registry['last_seen'] = registry['last_seen'].where(~observed | (registry['last_seen'] >= last), last)
+    return ids.rename('product_id'), registry
+
+
+def ensure_product_ids(df: pd.DataFrame, path: str = REGISTRY_PATH) -> pd.DataFrame:
+    """
+    배치에서 부여한 product_id가 없으면(이전 버전 데이터) 레지스트리를 읽기 전용으로 조회해 붙입니다.
+    레지스트리에 없는 조합은 키 해시로 만든 음수 임시 ID를 사용합니다.
+    """
+    if 'product_id' in df.columns:
+        return df
+    df = df.copy()
+    ids = _lookup(df, load_registry(path))
+    missing = ids.isna()
+    if missing.any():
+        hashed = pd.util.hash_pandas_object(df.loc[missing, KEY_COLUMNS].astype(str), index=False)
+        ids[missing] = -(hashed.to_numpy() >> np.uint64(2)).astype(np.int64) - 1
+    df['product_id'] = ids.astype(np.int64)
+    return df
+
+
+def run_registry(input_path: str = 'data/categorized_data.csv', output_path: str = 'data/categorized_data.csv',
+                 registry_path: str = REGISTRY_PATH, seen_on=None):
+    """
+    데이터셋에 product_id를 붙여 저장하고 레지스트리를 갱신합니다. 결과 데이터프레임, 실패 시 None
+    seen_on: 관측 날짜 또는 {브랜드: 스냅샷 날짜} (assign_product_ids 참고)
+    """
+    if not os.path.exists(input_path):
+        logger.error(f"'{input_path}' 파일이 없습니다.")
+        return
+
+    try:
+        df = pd.read_csv(input_path, encoding='utf-8-sig')
+        registry = load_registry(registry_path)
+        before = len(registry)
+
+        ids, registry = assign_product_ids(df.drop(columns=['product_id'], errors='ignore'), registry, seen_on)
+        df = df.drop(columns=['product_id'], errors='ignore')
+        df.insert(0, 'product_id', ids)
+
+        save_registry(registry, registry_path)
+        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+        logger.success(f"상품 ID 부여 완료: 기존 {len(df) - (len(registry) - before)}개 재사용, "
+                       f"신규 {len(registry) - before}개 발급 → '{output_path}'")
+        return df
+
+    except Exception as e:
+        logger.error(f"상품 ID 부여 중 오류 발생: {e}")
+
+
+if __name__ == "__main__":
+    from utils.dataset_manifest import source_snapshot_dates
+    run_registry(seen_on=source_snapshot_dates())
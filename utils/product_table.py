@@ -0,0 +1,215 @@
+"""
+메모리 절약형 상품 테이블 로더
+
+페이지마다 categorized_data.csv를 그대로 읽으면 문자열 컬럼이 모두 행 수만큼의 파이썬 문자열 객체가 되고,
+st.cache_data는 호출마다 복사본을 돌려주므로 세션당 여러 벌이 메모리에 올라갑니다.
+이 로더는 아래와 같이 컬럼 타입을 줄인 테이블을 만듭니다.
+
+    brand / event / event_type / category / maker   범주형 (정수 코드 + 고유값 사전)
+    size_unit                                       범주형
+    price / match_group_id / theme_bits             int32
+    size_value / price_per_100                      float32
+    buy_n / get_m                                   int8
+    name / base_name                                같은 상품명은 하나의 문자열 객체를 공유 (intern)
+    img_url                                         (선택) 공통 접두어 사전(img_prefix) + 나머지 경로(img_path)
+
+ProductDataset은 이 테이블에 화면용 파생 컬럼과 자주 쓰는 뷰를 붙인 묶음으로,
+utils/dataset_service.py가 공개 스냅샷마다 프로세스에서 한 번만 만들어 모든 페이지가 공유합니다.
+페이지에는 shared_view()로 만든 뷰를 건네고, copy-on-write 덕분에 페이지가 뷰를 고쳐도
+데이터는 그 컬럼만 새로 복사되며 공유 프레임은 그대로 남습니다. (copy-on-write가 꺼진 pandas<3에서는 전체 복사)
+
+사용법:
+    python utils/product_table.py        # 원본/절약형 테이블의 컬럼별 메모리 비교
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 단독 실행 시에도 utils 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from utils.dataset_store import resolve_data_path
+from utils.event_taxonomy import discount_labels, discount_rates, ensure_event_columns, unit_prices
+from utils.maker_taxonomy import ensure_maker_columns
+from utils.package_size import SIZE_UNITS, ensure_size_columns
+from utils.product_registry import ensure_product_ids
+from utils.theme_tags import ensure_theme_column
+
+CATEGORICAL_COLUMNS = ['brand', 'event', 'event_type', 'category', 'maker']
+INT32_COLUMNS = ['price', 'match_group_id', 'theme_bits']
+FLOAT32_COLUMNS = ['size_value', 'price_per_100']
+INTERNED_COLUMNS = ['name', 'base_name']
+# 화면용 파생 컬럼 (배치 컬럼 buy_n/get_m/event_type에서 데이터셋마다 한 번만 계산)
+DERIVED_COLUMNS = ['unit_price', 'discount_num', 'discount_rate', 'pay_count', 'total_count']
+# 같은 상품으로 보는 키 (요약·가이드 페이지는 이 키의 중복을 뺀 목록을 씀)
+PRODUCT_KEY = ['name', 'event', 'brand']
+
+# 이미지 URL에서 마지막 '/'까지를 접두어로 사전 인코딩 (브랜드별 이미지 서버 경로는 몇 가지뿐)
+_IMG_PREFIX = r'^(.*/)'
+
+
+def intern_strings(values: pd.Series) -> pd.Series:
+    """
+    같은 값의 문자열이 하나의 객체를 공유하는 object 시리즈.
+    pd.factorize는 한글 문자열마다 UTF-8 사본을 캐시해 오히려 커지므로 dict로 중복을 합칩니다.
+    """
+    pool = {}
+    interned = [pool.setdefault(v, sys.intern(v)) if isinstance(v, str) else None for v in values]
+    return pd.Series(interned, index=values.index, name=values.name, dtype=object)
+
+
+def split_img_url(urls: pd.Series):
+    """img_url → (범주형 접두어, 나머지 경로)"""
+    urls = urls.fillna('').astype(str)
+    prefix = urls.str.extract(_IMG_PREFIX, expand=False).fillna('')
+    path = pd.Series([url[len(p):] for url, p in zip(urls, prefix)], index=urls.index, dtype=object)
+    return prefix.astype('category'), intern_strings(path)
+
+
+def image_urls(df: pd.DataFrame) -> pd.Series:
+    """img_url 컬럼 (접두어 인코딩된 테이블이면 복원)"""
+    if 'img_url' in df.columns:
+        return df['img_url']
+    return df['img_prefix'].astype(str) + df['img_path'].astype(str)
+
+
+def compact_product_table(df: pd.DataFrame, encode_img_url: bool = False) -> pd.DataFrame:
+    """상품 테이블의 컬럼 타입을 메모리 절약형으로 바꾼 새 데이터프레임을 반환합니다."""
+    df = ensure_product_ids(ensure_event_columns(df))
+    df = ensure_theme_column(ensure_size_columns(ensure_maker_columns(df))).copy()
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in INT32_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(np.int32)
+    for col in FLOAT32_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(np.float32)
+    if 'size_unit' in df.columns:
+        df['size_unit'] = pd.Categorical(df['size_unit'], categories=SIZE_UNITS)
+    # 레지스트리 ID는 int32 범위 (레지스트리에 없는 상품의 음수 해시 ID가 섞이면 int64 유지)
+    ids = df['product_id']
+    if len(ids) and ids.min() >= np.iinfo(np.int32).min and ids.max() <= np.iinfo(np.int32).max:
+        df['product_id'] = ids.astype(np.int32)
+    for col in INTERNED_COLUMNS:
+        if col in df.columns:
+            df[col] = intern_strings(df[col])
+    if encode_img_url and 'img_url' in df.columns:
+        position = df.columns.get_loc('img_url')
+        prefix, path = split_img_url(df.pop('img_url'))
+        df.insert(position, 'img_prefix', prefix)
+        df.insert(position + 1, 'img_path', path)
+    elif 'img_url' in df.columns:
+        df['img_url'] = intern_strings(df['img_url'])
+    return df
+
+
+def load_product_table(path: str = None, encode_img_url: bool = False) -> pd.DataFrame:
+    """현재 공개된 상품 데이터셋을 메모리 절약형 테이블로 읽습니다. 파일이 없으면 빈 데이터프레임"""
+    path = path or resolve_data_path('categorized_data.csv')
+    if not os.path.exists(path):
+        return pd.DataFrame()
+    return compact_product_table(pd.read_csv(path, encoding='utf-8-sig'), encode_img_url)
+
+
+def add_derived_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    화면에서 쓰는 파생 컬럼을 붙인 새 데이터프레임을 반환합니다.
+
+        unit_price      행사 적용 개당 가격
+        discount_num    할인율(%) 숫자
+        discount_rate   할인율 표시 문자열 ('50%')
+        pay_count       실제 결제 개수 (N+M 행사면 N, 그 외 1)
+        total_count     받는 개수 (N+M 행사면 N+M, 그 외 1)
+    """
+    bundle = df['event_type'] == 'N+M'
+    return df.assign(
+        unit_price=unit_prices(df),
+        discount_num=discount_rates(df),
+        discount_rate=discount_labels(df),
+        pay_count=df['buy_n'].astype(int).where(bundle, 1),
+        total_count=(df['buy_n'] + df['get_m']).astype(int).where(bundle, 1),
+    )
+
+
+def copy_on_write_enabled() -> bool:
+    """pandas copy-on-write 동작 여부 (pandas 3부터는 항상 켜짐, 그 이전은 mode.copy_on_write 옵션)"""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return getattr(pd.options.mode, 'copy_on_write', False) is True
+
+
+def shared_view(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    공유 프레임을 페이지에 건넬 뷰
+
+    copy-on-write가 켜져 있으면 컬럼 배열을 공유하는 얕은 뷰를 돌려주며, 뷰에 컬럼을 추가하거나 값을 바꾸면
+    그 부분만 복사되고 원본은 바뀌지 않습니다. 꺼져 있으면(pandas<3 기본값) 같은 보장을 위해 전체를 복사합니다.
+    """
+    return df.copy(deep=not copy_on_write_enabled())
+
+
+class ProductDataset:
+    """
+    페이지들이 공유하는 상품 데이터셋 (절약형 테이블 + 파생 컬럼, 자주 쓰는 뷰를 한 번만 만듦)
+
+        products         전체 상품
+        unique_products  PRODUCT_KEY 중복을 뺀 상품
+        by_id            product_id 인덱스, ID당 한 행 (장바구니·게임 결과 조회용)
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        if df.empty:
+            self.products = self.unique_products = self.by_id = df
+            return
+        self.products = add_derived_columns(df)
+        self.unique_products = self.products.drop_duplicates(subset=PRODUCT_KEY)
+        # 레지스트리 키(brand, name, event)가 같고 가격·이미지만 다른 행은 같은 ID를 받으므로 첫 행만 남김 (ID당 한 행 보장)
+        self.by_id = self.products.drop_duplicates(subset='product_id').set_index('product_id', drop=False)
+
+    @classmethod
+    def load(cls, path: str = None):
+        """현재 공개된(또는 path의) 데이터셋을 읽어 만듭니다. 파일이 없으면 빈 데이터셋"""
+        return cls(load_product_table(path))
+
+    def __len__(self):
+        return len(self.products)
+
+
+def _column_bytes(values: pd.Series) -> int:
+    """컬럼 하나가 실제로 차지하는 바이트 (공유된 문자열 객체는 한 번만 계산)"""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.cat.codes.nbytes + int(values.cat.categories.memory_usage(deep=True))
+    if values.dtype == object or pd.api.types.is_string_dtype(values.dtype):
+        objects = {id(v): v for v in values.array}
+        return 8 * len(values) + sum(sys.getsizeof(v) for v in objects.values())
+    return int(values.memory_usage(index=False, deep=True))
+
+
+def memory_report(df: pd.DataFrame) -> pd.DataFrame:
+    """컬럼별 dtype과 메모리 사용량(바이트), 마지막 행은 합계"""
+    report = pd.DataFrame({
+        'dtype': [str(df[col].dtype) for col in df.columns],
+        'bytes': [_column_bytes(df[col]) for col in df.columns],
+    }, index=df.columns)
+    report.loc['(total)'] = ['', int(report['bytes'].sum())]
+    return report
+
+
+if __name__ == "__main__":
+    path = resolve_data_path('categorized_data.csv')
+    raw = pd.read_csv(path, encoding='utf-8-sig')
+    lean = load_product_table(path, encode_img_url=True)
+
+    raw_report, lean_report = memory_report(raw), memory_report(lean)
+    print("[ 원본 ]")
+    print(raw_report.to_string())
+    print("\n[ 절약형 ]")
+    print(lean_report.to_string())
+    ratio = raw_report.loc['(total)', 'bytes'] / lean_report.loc['(total)', 'bytes']
+    print(f"\n총 {raw_report.loc['(total)', 'bytes'] / 1e6:.2f}MB → {lean_report.loc['(total)', 'bytes'] / 1e6:.2f}MB ({ratio:.1f}배 감소)")
@@ -0,0 +1,97 @@
+"""
+브랜드별 원본 스냅샷 카탈로그
+
+크롤러는 매번 data/<브랜드>_<yymmdd>.csv 파일을 새로 만듭니다.
+카탈로그는 data/ 와 히스토리 저장소(data/history/raw/)를 한 번 훑어
+브랜드 → 스냅샷 목록 인덱스를 만들고, 브랜드별 최신 스냅샷을 바로 꺼낼 수 있게 합니다.
+최신이 아닌 스냅샷은 히스토리 저장소로 옮겨 라이브 데이터셋에서 빠지도록 합니다.
+"""
+import os
+import re
+import shutil
+from datetime import datetime
+
+from loguru import logger
+
+DATA_DIR = "data"
+HISTORY_RAW_DIR = os.path.join(DATA_DIR, "history", "raw")
+
+BRANDS = ['7Eleven', 'CU', 'emart24', 'GS25']
+
+# 파일명 규칙: <브랜드>_<yymmdd>.csv (브랜드 대소문자 무시)
+SNAPSHOT_PATTERN = re.compile(
+    r'^(?P<brand>' + '|'.join(re.escape(b) for b in BRANDS) + r')_(?P<date>\d{6})\.csv$',
+    re.IGNORECASE,
+)
+_CANONICAL_BRAND = {b.lower(): b for b in BRANDS}
+
+
+def parse_snapshot_name(filename: str):
+    """파일명에서 (브랜드, 스냅샷 날짜)를 추출합니다. 규칙에 맞지 않으면 None"""
+    match = SNAPSHOT_PATTERN.match(os.path.basename(filename))
+    if not match:
+        return None
+    try:
+        snapshot_date = datetime.strptime(match.group('date'), "%y%m%d").date()
+    except ValueError:
+        return None
+    return _CANONICAL_BRAND[match.group('brand').lower()], snapshot_date
+
+
+class SnapshotCatalog:
+    """브랜드 → 스냅샷(날짜, 경로) 인덱스"""
+
+    def __init__(self, data_dir: str = DATA_DIR, history_dir: str = HISTORY_RAW_DIR):
+        self.data_dir = data_dir
+        self.history_dir = history_dir
+        self.snapshots = {brand: [] for brand in BRANDS}
+        self._latest = {}
+        self._scan()
+
+    def _scan(self):
+        for directory in (self.data_dir, self.history_dir):
+            if not os.path.isdir(directory):
+                continue
+            for filename in os.listdir(directory):
+                parsed = parse_snapshot_name(filename)
+                if parsed:
+                    brand, snapshot_date = parsed
+                    self.snapshots[brand].append((snapshot_date, os.path.join(directory, filename)))
+
+        for brand, items in self.snapshots.items():
+            items.sort()
+            if items:
+                self._latest[brand] = items[-1]
+
+    def latest(self, brand: str):
+        """브랜드의 최신 스냅샷 (날짜, 경로). 없으면 None"""
+        return self._latest.get(brand)
+
+    def latest_paths(self) -> list:
+        """브랜드별 최신 스냅샷 경로 목록 (브랜드명 순)"""
+        return [self._latest[brand][1] for brand in sorted(self._latest)]
+
+    def history(self, brand: str = None) -> list:
+        """최신을 포함한 전체 스냅샷 (날짜, 브랜드, 경로) 목록, 날짜순"""
+        brands = [brand] if brand else BRANDS
+        items = [(d, b, p) for b in brands for d, p in self.snapshots.get(b, [])]
+        return sorted(items)
+
+    def archive_old_snapshots(self) -> list:
+        """
+        data/ 에 남아 있는 최신이 아닌 스냅샷을 히스토리 저장소로 옮깁니다.
+        옮긴 파일 경로 목록을 반환합니다.
+        """
+        moved = []
+        for brand, items in self.snapshots.items():
+            latest = self._latest.get(brand)
+            for i, (snapshot_date, path) in enumerate(items):
+                if (snapshot_date, path) == latest or os.path.dirname(path) != self.data_dir:
+                    continue
+                os.makedirs(self.history_dir, exist_ok=True)
+                target = os.path.join(self.history_dir, os.path.basename(path))
+                shutil.move(path, target)
+                items[i] = (snapshot_date, target)
+                moved.append(target)
+                logger.info(f"이전 스냅샷을 히스토리로 이동: {path} → {target}")
+        return moved
@@ -0,0 +1,147 @@
+"""
+청크 단위 스트리밍 정제기 (대용량 히스토리 백필용)
+
+여러 달치 원본 스냅샷을 한꺼번에 read_csv → concat → drop_duplicates 하면
+전체 데이터가 메모리에 올라가야 합니다. 여기서는 파일을 행 묶음(청크)으로 읽어
+정제하고, 행 해시 키 집합으로 중복을 걸러낸 뒤 결과를 바로 파일에 이어 씁니다.
+
+메모리 상한(memory_limit_mb)의 절반은 청크, 절반은 중복 키 집합에 배정합니다.
+키 집합이 상한을 넘으면 디스크(SQLite)로 옮겨 계속 중복을 검사합니다.
+"""
+import os
+import sqlite3
+import tempfile
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+OUTPUT_COLUMNS = ['brand', 'name', 'price', 'event', 'img_url', 'event_type', 'buy_n', 'get_m']
+
+DEFAULT_CHUNK_ROWS = 50_000
+MIN_CHUNK_ROWS = 1_000
+# 파이썬 set에 담긴 int 키 하나가 차지하는 대략적인 바이트 수 (set 슬롯 + int 객체)
+KEY_BYTES = 100
+
+
+class HashKeySet:
+    """
+    64비트 행 해시 키 집합.
+    메모리 예산을 넘으면 SQLite 임시 파일로 옮겨 디스크 기반으로 중복을 검사합니다.
+    (64비트 해시 충돌 확률은 수천만 행 규모에서도 무시할 수준)
+    """
+
+    def __init__(self, memory_limit_bytes: int, spill_dir: str = None):
+        self.max_keys = max(memory_limit_bytes // KEY_BYTES, 1)
+        self.spill_dir = spill_dir
+        self.keys = set()
+        self.conn = None
+        self.db_path = None
+
+    def _spill(self):
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+        fd, self.db_path = tempfile.mkstemp(suffix='.sqlite', prefix='dedup_', dir=self.spill_dir)
+        os.close(fd)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("CREATE TABLE keys (k INTEGER PRIMARY KEY)")
+        with self.conn:
+            self.conn.executemany("INSERT INTO keys VALUES (?)", ((k,) for k in self.keys))
+        logger.info(f"중복 키 {len(self.keys):,}개가 메모리 상한을 넘어 디스크로 전환합니다: {self.db_path}")
+        self.keys = set()
+
+    def add_new(self, hashes: np.ndarray) -> np.ndarray:
+        """처음 보는 키에 해당하는 위치만 True인 마스크를 반환하고, 그 키들을 집합에 추가합니다."""
+        # SQLite INTEGER는 부호 있는 64비트이므로 int64로 해석
+        keys = hashes.view(np.int64).tolist()
+        mask = np.zeros(len(keys), dtype=bool)
+
+        if self.conn is None:
+            for i, k in enumerate(keys):
+                if k not in self.keys:
+                    self.keys.add(k)
+                    mask[i] = True
+            if len(self.keys) > self.max_keys:
+                self._spill()
+            return mask
+
+        with self.conn:
+            for i, k in enumerate(keys):
+                cur = self.conn.execute("INSERT OR IGNORE INTO keys VALUES (?)", (k,))
+                mask[i] = cur.rowcount == 1
+        return mask
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            os.remove(self.db_path)
+            self.conn = None
+
+
+def _iter_chunks(path: str, chunk_budget_bytes: int, chunk_rows: int, reader_func):
+    """청크 메모리가 예산을 넘지 않도록 첫 청크의 행당 바이트를 보고 청크 크기를 조정합니다."""
+    reader = reader_func(path, iterator=True)
+    rows = chunk_rows
+    try:
+        while True:
+            try:
+                chunk = reader.get_chunk(rows)
+            except StopIteration:
+                break
+            bytes_per_row = chunk.memory_usage(deep=True).sum() / max(len(chunk), 1)
+            rows = int(max(MIN_CHUNK_ROWS, min(chunk_rows, chunk_budget_bytes // max(bytes_per_row, 1))))
+            yield chunk
+    finally:
+        reader.close()
+
+
+def stream_clean_files(files, output_path: str, clean_func, reader_func,
+                       chunk_rows: int = DEFAULT_CHUNK_ROWS, memory_limit_mb: int = 256,
+                       spill_dir: str = None) -> int:
+    """
+    원본 파일들을 청크 단위로 정제·중복 제거해 output_path에 이어 씁니다.
+
+    Args:
+        files: 원본 CSV 경로 목록 (이 순서대로 처리, 먼저 나온 행을 남김)
+        output_path: 결과 CSV 경로
+        clean_func: 데이터프레임 청크 하나를 정제하는 함수
+        reader_func: (path, **kwargs)로 CSV를 읽는 함수 (iterator=True 지원)
+        chunk_rows: 청크 최대 행 수
+        memory_limit_mb: 청크 + 중복 키 집합의 메모리 상한
+        spill_dir: 키 집합을 디스크로 옮길 때 쓸 임시 디렉토리
+    Returns:
+        저장된 행 수
+    """
+    budget = memory_limit_mb * 1024 * 1024
+    seen = HashKeySet(budget // 2, spill_dir=spill_dir)
+    tmp_path = output_path + ".tmp"
+    written = 0
+
+    try:
+        # 헤더는 BOM 포함으로 한 번만 쓰고, 이후 청크는 BOM 없이 이어 쓰기
+        pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(tmp_path, index=False, encoding='utf-8-sig')
+
+        for file in files:
+            file_rows = 0
+            try:
+                for chunk in _iter_chunks(file, budget // 2, chunk_rows, reader_func):
+                    cleaned = clean_func(chunk).reindex(columns=OUTPUT_COLUMNS)
+                    if cleaned.empty:
+                        continue
+                    hashes = pd.util.hash_pandas_object(cleaned, index=False).to_numpy()
+                    cleaned = cleaned[seen.add_new(hashes)]
+                    cleaned.to_csv(tmp_path, mode='a', header=False, index=False, encoding='utf-8')
+                    file_rows += len(cleaned)
+                logger.info(f"스트리밍 정제 완료: {file} ({file_rows:,}행)")
+            except Exception as e:
+                # 이미 기록된 청크는 유지하고 다음 파일로 진행
+                logger.error(f"{file} 처리 중 오류 발생 ({file_rows:,}행까지 반영): {e}")
+            written += file_rows
+
+        os.replace(tmp_path, output_path)
+    finally:
+        seen.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    return written
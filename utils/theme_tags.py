@@ -0,0 +1,144 @@
+"""
+테마 태그 비트셋 모듈
+
+식단·야식 가이드의 테마(제로 & 저당, 고단백, 맥주 안주, 소주 안주, 든든한 야식 등)를
+utils/rules/theme_tags.json에 데이터로 정의하고, 배치에서 상품마다 한 번만 판정해 정수 비트셋 컬럼으로 저장합니다.
+
+    theme_bits  테마 bit 번호 자리가 1이면 해당 테마 상품 (포함 키워드가 있고 제외 키워드가 없음)
+
+가이드 페이지는 키워드 정규식을 다시 돌리지 않고 (theme_bits & 테마 비트) != 0 한 번으로 테마를 고릅니다.
+
+사용법:
+    python utils/theme_tags.py        # data/categorized_data.csv 에 theme_bits 추가
+"""
+import json
+import os
+import re
+import sys
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+
+# 단독 실행 시에도 utils 패키지를 찾을 수 있도록 루트 경로 추가
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+THEME_TAGS_PATH = os.path.join(PROJECT_ROOT, 'utils', 'rules', 'theme_tags.json')
+THEME_COLUMN = 'theme_bits'
+MAX_BIT = 30  # int32 비트셋에 담을 수 있는 최대 bit 번호
+
+
+def _keyword_pattern(words: list):
+    """키워드 목록 → 대소문자 무시 alternation 정규식 (목록이 비면 None)"""
+    if not words:
+        return None
+    return re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+
+
+def load_themes(path: str = THEME_TAGS_PATH) -> list:
+    """
+    테마 정의를 읽어 [{'bit', 'page', 'label', 'mask', 'include', 'exclude'}, ...]로 반환합니다.
+    include/exclude는 컴파일된 정규식입니다. bit 중복·범위 오류, 포함 키워드가 없는 테마는 ValueError
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+
+    themes, bits = [], set()
+    for theme in spec.get('themes', []):
+        bit, label = theme.get('bit'), theme.get('label')
+        if not isinstance(bit, int) or not 0 <= bit <= MAX_BIT:
+            raise ValueError(f"{label}: bit는 0~{MAX_BIT} 정수여야 합니다.")
+        if bit in bits:
+            raise ValueError(f"{label}: bit {bit}가 다른 테마와 겹칩니다.")
+        if not theme.get('include'):
+            raise ValueError(f"{label}: 포함 키워드가 없습니다.")
+        bits.add(bit)
+        themes.append({
+            'bit': bit,
+            'page': theme.get('page', ''),
+            'label': label,
+            'mask': 1 << bit,
+            'include': _keyword_pattern(theme['include']),
+            'exclude': _keyword_pattern(theme.get('exclude', [])),
+        })
+    return themes
+
+
+# 테마 파일 경로 → (수정 시각, 테마 목록). 파일이 바뀌면 다음 호출 때 다시 읽음 (current_rules와 같은 방식)
+_loaded = {}
+
+
+def current_themes(path: str = THEME_TAGS_PATH) -> list:
+    """프로세스에 캐시된 테마 정의. 대시보드 재실행마다 파일을 다시 읽지 않고 수정 시각이 바뀌었을 때만 읽습니다."""
+    mtime = os.stat(path).st_mtime_ns
+    cached = _loaded.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    themes = load_themes(path)
+    _loaded[path] = (mtime, themes)
+    return themes
+
+
+def page_themes(page: str, path: str = THEME_TAGS_PATH) -> dict:
+    """페이지 하나의 테마 {라벨: 비트 마스크} (정의 순서 유지)"""
+    return {theme['label']: theme['mask'] for theme in current_themes(path) if theme['page'] == page}
+
+
+def theme_bitsets(names: pd.Series, path: str = THEME_TAGS_PATH) -> pd.Series:
+    """
+    상품명 시리즈 → 테마 비트셋 시리즈 (int32)
+    동일한 상품명은 한 번만 검사한 뒤 결과를 전체 행에 다시 펼쳐 줍니다.
+    """
+    themes = load_themes(path)
+    codes, uniques = pd.factorize(names.fillna('').astype(str), use_na_sentinel=False)
+
+    bits = np.zeros(len(uniques), dtype=np.int32)
+    for i, name in enumerate(uniques):
+        for theme in themes:
+            if theme['include'].search(name) and not (theme['exclude'] and theme['exclude'].search(name)):
+                bits[i] |= theme['mask']
+    return pd.Series(bits[codes], index=names.index, name=THEME_COLUMN)
+
+
+def theme_mask(df: pd.DataFrame, mask: int) -> pd.Series:
+    """theme_bits에 mask 비트가 켜진 행 (불리언 시리즈)"""
+    return (df[THEME_COLUMN] & mask) != 0
+
+
+def add_theme_column(df: pd.DataFrame, path: str = THEME_TAGS_PATH) -> pd.DataFrame:
+    """theme_bits 컬럼을 (다시) 계산해 붙인 새 데이터프레임을 반환합니다."""
+    df = df.copy()
+    df[THEME_COLUMN] = theme_bitsets(df['name'], path)
+    return df
+
+
+def ensure_theme_column(df: pd.DataFrame) -> pd.DataFrame:
+    """배치에서 만든 theme_bits 컬럼이 없으면(이전 버전 데이터) 여기서 판정합니다."""
+    if THEME_COLUMN in df.columns:
+        return df
+    return add_theme_column(df)
+
+
+def run_theme_tagging(input_path: str = 'data/categorized_data.csv',
+                      output_path: str = 'data/categorized_data.csv'):
+    """데이터셋에 theme_bits를 붙여 output_path에 저장하고 결과 데이터프레임을 반환합니다. 실패 시 None"""
+    if not os.path.exists(input_path):
+        logger.error(f"'{input_path}' 파일이 없습니다. 용량 추출 코드를 먼저 실행하세요.")
+        return
+
+    try:
+        df = add_theme_column(pd.read_csv(input_path, encoding='utf-8-sig'))
+        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+
+        counts = {theme['label']: int(theme_mask(df, theme['mask']).sum()) for theme in load_themes()}
+        logger.success(f"테마 태그 완료: {counts} → '{output_path}'")
+        return df
+
+    except Exception as e:
+        logger.error(f"테마 태그 중 오류 발생: {e}")
+
+
+if __name__ == "__main__":
+    run_theme_tagging()